@@ -1,7 +1,53 @@
 """
-pynmeagps Performance benchmarking utility
+pynmeagps Performance benchmark suite
 
-Usage (kwargs optional): python3 benchmark.py cycles=10000
+Usage (kwargs optional):
+
+python3 benchmark.py mode=suite cycles=1000 repeats=5 warmup=1 filter=parse,stream
+    output=results.json baseline=previous.json threshold=10
+python3 benchmark.py mode=compare baseline=previous.json current=results.json threshold=10
+python3 benchmark.py mode=stream cycles=10000 bufsize=65536
+python3 benchmark.py mode=bulk cycles=10000 workers=4 chunksize=1048576 func=Y
+
+mode=parse is equivalent to mode=suite filter=parse.all.
+
+mode=suite (the default) runs each benchmark in the suite:
+
+- stream.bytesio, stream.file, stream.socket - NMEAReader.read()
+  over an in-memory stream, a log file and a local socket
+- parse.all[.groups|.compact] - NMEAReader.parse() over the test corpus
+- parse.<identity> - NMEAReader.parse() per message type
+- construct.<msgID> - NMEAMessage construction from keyword arguments
+- serialize - NMEAMessage.serialize() over the test corpus
+- serialize.batch - NMEASerializer over the test corpus in one batch
+- helper.<function> - dmm2ddd(), time2utc() and haversine()
+- memory.default|groups|compact - retained memory per parsed message
+  (measured with tracemalloc in a separate process)
+
+Each timed benchmark performs 'cycles' iterations of its operation
+per repetition. After 'warmup' untimed repetitions, 'repeats' timed
+repetitions are run with the garbage collector disabled, and the
+min, median, mean and standard deviation of the time per operation
+in nanoseconds (measured with time.perf_counter_ns) are reported.
+'filter' selects benchmarks whose names contain any of the given
+comma-separated strings.
+
+Results can be saved as JSON (output=) and compared against a
+previous results file (baseline=), e.g. one produced by a different
+pynmeagps version. Any benchmark whose median is more than 'threshold'
+percent worse than the baseline is reported as a regression, and the
+script exits with status 1. mode=compare compares two saved results
+files without running the suite.
+
+mode=stream benchmarks NMEAReader.read() over a single large
+in-memory byte stream, and mode=bulk benchmarks nmeabulk.parse_file()
+over a temporary log file with 1 up to 'workers' worker processes.
+Bulk mode only measures scaling if at least 'workers' CPUs are
+available to the process. With fewer CPUs (e.g. a single CPU
+container) the workers share the same CPUs, and the results instead
+show the process pool overhead - process start-up, pickling results
+back to the parent process and per-chunk scheduling - relative to
+the single worker case.
 
 Created on 5 Nov 2021
 
@@ -9,13 +55,35 @@ Created on 5 Nov 2021
 :copyright: SEMU Consulting © 2021
 :license: BSD 3-Clause
 """
+
 # pylint: disable=line-too-long
 
-from sys import argv
-from datetime import datetime
-from platform import version as osver, python_version
-from pynmeagps.nmeareader import NMEAReader
+import gc
+import json
+import multiprocessing
+import os
+import socket
+import statistics
+import sys
+import threading
+import tracemalloc
+from datetime import datetime, timezone
+from io import BufferedReader, BytesIO
+from platform import platform, python_implementation, python_version
+from tempfile import TemporaryDirectory
+from time import perf_counter_ns
+
+import pynmeagps
+from pynmeagps import (
+    NMEAMessage,
+    NMEAReader,
+    NMEASerializer,
+    dmm2ddd,
+    haversine,
+    time2utc,
+)
 from pynmeagps._version import __version__ as nmeaver
+from pynmeagps.nmeabulk import available_cpus, parse_file
 
 NMEAMESSAGES = [
     b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71",
@@ -50,75 +118,553 @@ NMEAMESSAGES = [
     b"$PUBX,03,23,1,-,014,06,08,000,12,U,207,43,28,009,14,-,049,06,,000,15,-,171,44,23,000,17,-,064,32,16,000,19,-,094,33,,000,20,U,251,20,31,038,21,-,354,04,,000,23,U,251,27,31,064,24,U,268,89,26,000,25,-,223,05,,000,48,-,,,15,000,52,-,,,28,013,65,-,176,07,,000,66,U,223,57,35,064,67,-,315,42,23,000,68,-,341,00,29,000,75,-,057,37,,000,76,U,303,78,18,000,77,-,253,27,21,000,84,-,018,19,,000,85,-,078,22,,000,86,-,121,01,,000*02",
 ]
 
+# keyword arguments for construction benchmarks, by msgID
+CONSTRUCT = {
+    "GLL": {
+        "lat": 53.450657,
+        "lon": -2.2404103333,
+        "time": "10:36:07",
+        "status": "A",
+        "posMode": "A",
+    },
+    "GGA": {
+        "time": "10:36:07",
+        "lat": 53.450657,
+        "lon": -2.2404103333,
+        "quality": 1,
+        "numSV": 6,
+        "HDOP": 5.88,
+        "alt": 56.0,
+        "altUnit": "M",
+        "sep": 48.5,
+        "sepUnit": "M",
+    },
+    "RMC": {
+        "time": "10:36:07",
+        "status": "A",
+        "lat": 53.450657,
+        "lon": -2.2404103333,
+        "spd": 0.046,
+        "date": "06/03/21",
+        "posMode": "A",
+        "navStatus": "V",
+    },
+    "GSV": {
+        "numMsg": 1,
+        "msgNum": 1,
+        "numSV": 2,
+        "svid_01": 21,
+        "elv_01": 45.0,
+        "az_01": 120,
+        "cno_01": 15,
+        "svid_02": 25,
+        "elv_02": 30.0,
+        "az_02": 240,
+        "cno_02": 28,
+        "signalID": "1",
+    },
+}
+
+MEMMODES = {"default": {}, "groups": {"groups": True}, "compact": {"compact": True}}
+BYTES = "bytes/msg"
+NSOP = "ns/op"
 
-def progbar(i: int, lim: int, inc: int = 20):
+
+def corpus(cycles: int = 1) -> bytes:
     """
-    Display progress bar on console.
+    Get test messages as CRLF terminated byte stream.
 
-    :param int i: iteration
-    :param int lim: max iterations
-    :param int inc: bar increments (20)
+    :param int cycles: number of copies of test messages
+    :return: byte stream
+    :rtype: bytes
     """
 
-    i = min(i, lim)
-    pct = int(i * inc / lim)
-    if not i % int(lim / inc):
-        print(
-            f"{int(pct*100/inc):02}% " + "\u2593" * pct + "\u2591" * (inc - pct),
-            end="\r",
+    return b"".join(msg + b"\r\n" for msg in NMEAMESSAGES) * cycles
+
+
+def _read_all(stream, bufsize: int = 4096) -> int:
+    """
+    Read all messages from stream with NMEAReader.
+
+    :param stream stream: input stream
+    :param int bufsize: NMEAReader bufsize
+    :return: number of messages read
+    :rtype: int
+    """
+
+    count = 0
+    for _ in NMEAReader(stream, bufsize=bufsize):
+        count += 1
+    return count
+
+
+def _read_socket(data: bytes, bufsize: int) -> int:
+    """
+    Read all messages from a local socket, with data sent
+    by a separate thread.
+
+    :param bytes data: data to send
+    :param int bufsize: NMEAReader bufsize
+    :return: number of messages read
+    :rtype: int
+    """
+
+    rsock, wsock = socket.socketpair()
+
+    def send():
+        with wsock:
+            wsock.sendall(data)
+
+    thread = threading.Thread(target=send, daemon=True)
+    thread.start()
+    with rsock:
+        count = _read_all(rsock, bufsize)
+    thread.join()
+    return count
+
+
+def suite(cycles: int, tmpdir: str, bufsize: int = 4096) -> dict:
+    """
+    Define timed benchmarks.
+
+    :param int cycles: number of iterations per repetition
+    :param str tmpdir: temporary directory for log file benchmarks
+    :param int bufsize: NMEAReader bufsize
+    :return: dict of {name: (function, operations per call)}
+    :rtype: dict
+    """
+
+    benches = {}
+    nummsgs = len(NMEAMESSAGES)
+    msgs = [msg + b"\r\n" for msg in NMEAMESSAGES]
+    data = corpus(cycles)
+    path = os.path.join(tmpdir, "benchmark.log")
+    with open(path, "wb") as stream:
+        stream.write(data)
+
+    def read_file():
+        with open(path, "rb") as stream:
+            return _read_all(stream, bufsize)
+
+    # stream reading
+    benches["stream.bytesio"] = (
+        lambda: _read_all(BytesIO(data), bufsize),
+        nummsgs * cycles,
+    )
+    benches["stream.file"] = (read_file, nummsgs * cycles)
+    if hasattr(socket, "socketpair"):
+        benches["stream.socket"] = (
+            lambda: _read_socket(data, bufsize),
+            nummsgs * cycles,
         )
 
+    # parsing
+    def parse_all(msglist, **kwargs):
+        def run():
+            for _ in range(cycles):
+                for msg in msglist:
+                    NMEAReader.parse(msg, **kwargs)
+
+        return run
+
+    benches["parse.all"] = (parse_all(msgs), nummsgs * cycles)
+    benches["parse.all.groups"] = (parse_all(msgs, groups=True), nummsgs * cycles)
+    if hasattr(pynmeagps, "CompactNMEAMessage"):
+        benches["parse.all.compact"] = (
+            parse_all(msgs, compact=True),
+            nummsgs * cycles,
+        )
+    bytype = {}
+    for msg in msgs:
+        bytype.setdefault(NMEAReader.parse(msg).identity, []).append(msg)
+    for ident, msglist in sorted(bytype.items()):
+        benches[f"parse.{ident}"] = (parse_all(msglist), len(msglist) * cycles)
+
+    # construction
+    def construct(msgid, kwargs):
+        def run():
+            for _ in range(cycles):
+                NMEAMessage("GN", msgid, 0, **kwargs)
+
+        return run
+
+    for msgid, kwargs in CONSTRUCT.items():
+        benches[f"construct.{msgid}"] = (construct(msgid, kwargs), cycles)
+
+    # serialization
+    parsed = [NMEAReader.parse(msg) for msg in msgs]
+
+    def serialize():
+        for _ in range(cycles):
+            for msg in parsed:
+                msg.serialize()
+
+    benches["serialize"] = (serialize, nummsgs * cycles)
+    serializer = NMEASerializer()
+
+    def serialize_batch():
+        for _ in range(cycles):
+            serializer.serialize(parsed)
+
+    benches["serialize.batch"] = (serialize_batch, nummsgs * cycles)
+
+    # helpers
+    positions = [f"{5300 + i % 60:04d}.{i:05d}" for i in range(cycles)]
+    times = [
+        f"{(i // 3600) % 24:02d}{(i // 60) % 60:02d}{i % 60:02d}.00"
+        for i in range(cycles)
+    ]
+
+    def helper_dmm2ddd():
+        for pos in positions:
+            dmm2ddd(pos, "LA")
+
+    def helper_time2utc():  # distinct times, so not cached
+        for tim in times:
+            time2utc(tim)
+
+    def helper_haversine():
+        for i in range(cycles):
+            haversine(53.24, -2.16, 53.32 + i * 1e-6, -2.08)
+
+    benches["helper.dmm2ddd"] = (helper_dmm2ddd, cycles)
+    benches["helper.time2utc"] = (helper_time2utc, cycles)
+    benches["helper.haversine"] = (helper_haversine, cycles)
+
+    return benches
+
+
+def timeit(func, ops: int, repeats: int = 5, warmup: int = 1) -> dict:
+    """
+    Time function, returning statistics of the time per operation.
+
+    :param object func: function to time
+    :param int ops: number of operations performed per call
+    :param int repeats: number of timed repetitions
+    :param int warmup: number of untimed warmup repetitions
+    :return: dict of statistics in ns per operation
+    :rtype: dict
+    """
+
+    for _ in range(warmup):
+        func()
+    samples = []
+    gcenabled = gc.isenabled()
+    try:
+        for _ in range(repeats):
+            gc.collect()
+            gc.disable()
+            start = perf_counter_ns()
+            func()
+            samples.append((perf_counter_ns() - start) / ops)
+            if gcenabled:
+                gc.enable()
+    finally:
+        if gcenabled:
+            gc.enable()
+    median = statistics.median(samples)
+    return {
+        "unit": NSOP,
+        "ops": ops,
+        "repeats": repeats,
+        "min": min(samples),
+        "median": median,
+        "mean": statistics.mean(samples),
+        "stdev": statistics.stdev(samples) if repeats > 1 else 0.0,
+        "rate": 1e9 / median if median else 0.0,
+    }
+
+
+def memory_per_message(mode: str, cycles: int) -> float:
+    """
+    Measure retained memory per parsed message using tracemalloc.
+    Run in a fresh process so results are not affected by objects
+    created by other benchmarks.
+
+    :param str mode: parsing mode ("default", "groups" or "compact")
+    :param int cycles: number of copies of test messages to retain
+    :return: bytes per message
+    :rtype: float
+    """
+
+    msgs = [msg + b"\r\n" for msg in NMEAMESSAGES] * cycles
+    kwargs = MEMMODES[mode]
+    NMEAReader.parse(msgs[0], **kwargs)  # create any cached definitions
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    retained = [NMEAReader.parse(msg, **kwargs) for msg in msgs]
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return used / len(retained)
+
+
+def run_suite(**kwargs) -> dict:
+    """
+    Run benchmark suite.
+
+    :param int cycles: (kwarg) iterations per repetition (1,000)
+    :param int repeats: (kwarg) timed repetitions (5)
+    :param int warmup: (kwarg) untimed warmup repetitions (1)
+    :param int bufsize: (kwarg) NMEAReader stream read chunk size (4096)
+    :param str filter: (kwarg) comma-separated benchmark name filters (None = all)
+    :return: results dict
+    :rtype: dict
+    """
+
+    cycles = int(kwargs.get("cycles", 1000))
+    repeats = int(kwargs.get("repeats", 5))
+    warmup = int(kwargs.get("warmup", 1))
+    bufsize = int(kwargs.get("bufsize", 4096))
+    filters = kwargs.get("filter", None)
+    filters = None if filters is None else filters.split(",")
+
+    def selected(name: str) -> bool:
+        return filters is None or any(flt in name for flt in filters)
+
+    meta = {
+        "pynmeagps": nmeaver,
+        "python": f"{python_implementation()} {python_version()}",
+        "platform": platform(),
+        "cpus": os.cpu_count(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "cycles": cycles,
+        "repeats": repeats,
+        "warmup": warmup,
+    }
+    print("\n".join(f"{key}: {val}" for key, val in meta.items()), "\n")
+    print(f"{'benchmark':<28}{'median':>14}{'stdev':>9}{'rate':>16}")
+
+    results = {}
+    with TemporaryDirectory() as tmpdir:
+        for name, (func, ops) in suite(cycles, tmpdir, bufsize).items():
+            if not selected(name):
+                continue
+            res = results[name] = timeit(func, ops, repeats, warmup)
+            print(
+                f"{name:<28}{res['median']:>11,.0f} ns"
+                f"{100 * res['stdev'] / res['median']:>8.1f}%"
+                f"{res['rate']:>12,.0f} /s"
+            )
+
+    ctx = multiprocessing.get_context("spawn")
+    for mode in MEMMODES:
+        name = f"memory.{mode}"
+        if not selected(name) or (
+            mode == "compact" and not hasattr(pynmeagps, "CompactNMEAMessage")
+        ):
+            continue
+        with ctx.Pool(1) as pool:
+            size = pool.apply(memory_per_message, (mode, cycles))
+        results[name] = {"unit": BYTES, "median": size}
+        print(f"{name:<28}{size:>11,.0f} B")
 
-def benchmark(**kwargs) -> float:
+    return {"meta": meta, "results": results}
+
+
+def compare(baseline: dict, current: dict, threshold: float = 10.0) -> list:
+    """
+    Compare benchmark results against baseline. Lower values are
+    better for all benchmarks (time or bytes per message).
+
+    :param dict baseline: baseline results dict
+    :param dict current: current results dict
+    :param float threshold: regression threshold in percent (10)
+    :return: list of names of regressed benchmarks
+    :rtype: list
     """
-    pyubx2 Performance benchmark test.
+
+    base = baseline["results"]
+    curr = current["results"]
+    print(
+        f"\nBaseline: pynmeagps {baseline['meta']['pynmeagps']} "
+        f"({baseline['meta']['timestamp']})"
+        f"\nCurrent:  pynmeagps {current['meta']['pynmeagps']} "
+        f"({current['meta']['timestamp']})\n"
+    )
+    print(f"{'benchmark':<28}{'baseline':>14}{'current':>14}{'change':>10}")
+    regressions = []
+    for name, res in curr.items():
+        if name not in base:
+            continue
+        old, new = base[name]["median"], res["median"]
+        change = 100 * (new - old) / old if old else 0.0
+        flag = ""
+        if change > threshold:
+            regressions.append(name)
+            flag = "  REGRESSION"
+        print(f"{name:<28}{old:>14,.1f}{new:>14,.1f}{change:>+9.1f}%{flag}")
+    for label, names in (
+        ("baseline", set(base) - set(curr)),
+        ("current", set(curr) - set(base)),
+    ):
+        if names:
+            print(f"Only in {label}: {', '.join(sorted(names))}")
+    print(
+        f"\n{len(regressions)} regression(s) greater than {threshold}% "
+        f"in {len(set(base) & set(curr))} common benchmarks.\n"
+    )
+    return regressions
+
+
+def benchmark_stream(**kwargs) -> float:
+    """
+    pynmeagps stream-level performance benchmark test.
+
+    Reads the test messages from an in-memory byte stream via
+    NMEAReader.read(), so the result includes stream framing
+    as well as parsing.
 
     :param int cycles: (kwarg) number of test cycles (10,000)
+    :param int bufsize: (kwarg) NMEAReader stream read chunk size (4096)
     :returns: benchmark as transactions/second
     :rtype: float
-    :raises: UBXStreamError
     """
 
     cyc = int(kwargs.get("cycles", 10000))
-    txnc = len(NMEAMESSAGES)
-    txnt = txnc * cyc
+    bufsize = int(kwargs.get("bufsize", 4096))
+    txnt = len(NMEAMESSAGES) * cyc
+    data = corpus(cyc)
 
     print(
-        f"\nOperating system: {osver()}",
         f"\nPython version: {python_version()}",
         f"\npynmeagps version: {nmeaver}",
         f"\nTest cycles: {cyc:,}",
-        f"\nTxn per cycle: {txnc:,}",
+        f"\nStream size: {len(data):,} bytes",
+        f"\nRead chunk size: {bufsize:,} bytes",
     )
 
-    start = datetime.now()
-    print(f"\nBenchmark test started at {start}")
-    for i in range(cyc):
-        progbar(i, cyc)
-        for msg in NMEAMESSAGES:
-            _ = NMEAReader.parse(msg)
-    end = datetime.now()
-    print(f"Benchmark test ended at {end}.")
-    duration = (end - start).total_seconds()
-    rate = round(txnt / duration, 2)
+    stream = BufferedReader(BytesIO(data))
+    start = perf_counter_ns()
+    count = _read_all(stream, bufsize)
+    duration = (perf_counter_ns() - start) / 1e9
+    rate = round(count / duration, 2)
 
     print(
-        f"\n{txnt:,} messages processed in {duration:,.3f} seconds = {rate:,.2f} txns/second.\n"
+        f"\n{count:,} of {txnt:,} messages read in {duration:,.3f} seconds = {rate:,.2f} txns/second.\n"
     )
 
     return rate
 
 
+def identity(_, parsed) -> str:
+    """
+    Reduce each parsed message to its identity in the worker process.
+    """
+
+    return parsed.identity
+
+
+def benchmark_bulk(**kwargs) -> dict:
+    """
+    pynmeagps multiprocess bulk log parser benchmark test.
+
+    Writes the test messages to a temporary log file and parses
+    it via nmeabulk.parse_file() with 1, 2, 4 ... workers.
+
+    :param int cycles: (kwarg) number of test cycles (10,000)
+    :param int workers: (kwarg) maximum number of worker processes (available_cpus())
+    :param int chunksize: (kwarg) chunk size in bytes (1048576)
+    :param str func: (kwarg) "Y" = reduce each result to its identity
+        in the worker process, "N" = return full NMEAMessage (N)
+    :returns: benchmark as dict of {workers: transactions/second}
+    :rtype: dict
+    """
+
+    cpus = available_cpus()
+    cyc = int(kwargs.get("cycles", 10000))
+    maxworkers = int(kwargs.get("workers", cpus))
+    chunksize = int(kwargs.get("chunksize", 1048576))
+    func = identity if kwargs.get("func", "N") == "Y" else None
+    txnt = len(NMEAMESSAGES) * cyc
+
+    print(
+        f"\nPython version: {python_version()}",
+        f"\npynmeagps version: {nmeaver}",
+        f"\nCPU count: {os.cpu_count()} ({cpus} available to this process)",
+        f"\nTest cycles: {cyc:,}",
+        f"\nChunk size: {chunksize:,} bytes",
+    )
+    if cpus < maxworkers:
+        print(
+            f"\nWARNING: only {cpus} CPU(s) available for {maxworkers} workers.",
+            "\nScaling beyond this cannot be measured - where workers exceed",
+            "\navailable CPUs, the results show the process pool overhead",
+            "\n(process start-up, pickling results back to the parent process",
+            "\nand per-chunk scheduling) rather than multi-core speedup.",
+        )
+
+    rates = {}
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "benchmark.log")
+        with open(path, "wb") as stream:
+            stream.write(corpus(cyc))
+        workers = 1
+        while True:
+            start = perf_counter_ns()
+            count = 0
+            for _ in parse_file(path, workers=workers, chunksize=chunksize, func=func):
+                count += 1
+            duration = (perf_counter_ns() - start) / 1e9
+            rates[workers] = round(count / duration, 2)
+            print(
+                f"\n{workers} worker(s): {count:,} of {txnt:,} messages parsed in "
+                f"{duration:,.3f} seconds = {rates[workers]:,.2f} txns/second "
+                f"(x{rates[workers] / rates[1]:.2f})."
+            )
+            if workers >= maxworkers:
+                break
+            workers = min(workers * 2, maxworkers)
+    print()
+
+    return rates
+
+
+def _load(path: str) -> dict:
+    """
+    Load JSON results file.
+
+    :param str path: file path
+    :return: results dict
+    :rtype: dict
+    """
+
+    with open(path, "r", encoding="utf-8") as infile:
+        return json.load(infile)
+
+
 def main():
     """
     CLI Entry point.
 
-    args as benchmark() method
+    args as run_suite(), compare(), benchmark_stream() or benchmark_bulk()
     """
 
-    benchmark(**dict(arg.split("=") for arg in argv[1:]))
+    kwargs = dict(arg.split("=", 1) for arg in sys.argv[1:])
+    mode = kwargs.pop("mode", "suite")
+    if mode == "stream":
+        benchmark_stream(**kwargs)
+        return
+    if mode == "bulk":
+        benchmark_bulk(**kwargs)
+        return
 
+    if mode == "parse":  # as for previous versions of this utility
+        kwargs.setdefault("filter", "parse.all")
+    threshold = float(kwargs.pop("threshold", 10.0))
+    baseline = kwargs.pop("baseline", None)
+    if mode == "compare":
+        current = _load(kwargs.pop("current"))
+    else:
+        output = kwargs.pop("output", None)
+        current = run_suite(**kwargs)
+        if output is not None:
+            with open(output, "w", encoding="utf-8") as outfile:
+                json.dump(current, outfile, indent=2)
+            print(f"\nResults saved to {output}")
+    if baseline is not None and compare(_load(baseline), current, threshold):
+        sys.exit(1)
 
-if __name__ == "__main__":
 
+if __name__ == "__main__":
     main()
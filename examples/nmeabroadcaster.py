@@ -0,0 +1,59 @@
+"""
+nmeabroadcaster.py
+
+Simple example which broadcasts NMEA data from a serial port
+or datalog file to any number of TCP clients, as raw NMEA
+sentences on one port and JSON-encoded parsed messages on
+another, using the pynmeagps.NMEABroadcaster class.
+
+Usage:
+
+python3 nmeabroadcaster.py source=/dev/ttyACM0 baudrate=9600 port=50010 jsonport=50011
+
+If 'source' is not a serial port, it is treated as a datalog file.
+Clients can connect using e.g. the nmeasocket.py example, or
+'nc localhost 50011' to view the JSON output. Press CTRL-C to terminate.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+import asyncio
+import os
+import sys
+from pynmeagps import NMEABroadcaster
+
+
+def main(**kwargs):
+    """
+    Main routine.
+    """
+
+    source = kwargs.get("source", "pygpsdata.log")
+    baudrate = int(kwargs.get("baudrate", 9600))
+    port = int(kwargs.get("port", 50010))
+    jsonport = int(kwargs.get("jsonport", 50011))
+
+    if os.path.isfile(source):
+        stream = open(source, "rb")  # pylint: disable=consider-using-with
+    else:
+        from serial import Serial  # pylint: disable=import-outside-toplevel
+
+        stream = Serial(source, baudrate, timeout=3)
+
+    broadcaster = NMEABroadcaster(stream, port=port, jsonport=jsonport)
+    print(f"Broadcasting {source} on ports {port} (raw) and {jsonport} (JSON)...")
+    try:
+        stats = asyncio.run(broadcaster.serve())
+        print(f"\n{stats['messages']:,d} messages broadcast.")
+    except KeyboardInterrupt:
+        print("\nBroadcast terminated by user")
+    finally:
+        stream.close()
+
+
+if __name__ == "__main__":
+    main(**dict(arg.split("=") for arg in sys.argv[1:]))
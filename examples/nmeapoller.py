@@ -9,11 +9,15 @@ polling utility.
 threads are not truly concurrent.)
 
 It connects to the receiver's serial port and sets up a
-NMEAReader read thread. With the read thread running
+NMEAEventReader read thread. With the read thread running
 in the background, it polls for a variety of NMEA
 messages. The read thread reads and parses any responses
 to these polls and outputs them to the terminal.
 
+NMEAEventReader waits for incoming data without
+busy-waiting on the serial port's in_waiting attribute,
+so the read thread uses virtually no CPU while idle.
+
 If a given NMEA message is not supported by your device,
 you'll see a '<GNTXT...NMEA unknown msg>' response.
 
@@ -23,46 +27,42 @@ Created on 7 Mar 2021
 # pylint: disable=invalid-name
 
 from sys import platform
-from io import BufferedReader
 from threading import Thread, Lock
 from time import sleep
 from serial import Serial
 from pynmeagps import (
     NMEAMessage,
-    NMEAReader,
+    NMEAEventReader,
     POLL,
     NMEA_MSGIDS,
 )
 
-# initialise global variables
-reading = False
-
 
-def read_messages(stream, lock, nmeareader):
+def read_messages(lock, nmeareader):
     """
-    Reads, parses and prints out incoming UBX messages
+    Reads, parses and prints out incoming NMEA messages
+    until the reader is stopped or the stream ends
     """
     # pylint: disable=unused-variable, broad-except
 
-    while reading:
-        if stream.in_waiting:
-            try:
-                lock.acquire()
-                (raw_data, parsed_data) = nmeareader.read()
-                lock.release()
+    while not (nmeareader.stopped or nmeareader.eof):
+        try:
+            if nmeareader.wait():  # blocks until data available, timeout or stop
+                with lock:
+                    (raw_data, parsed_data) = nmeareader.read()
                 if parsed_data:
                     print(parsed_data)
-            except Exception as err:
-                print(f"\n\nSomething went wrong {err}\n\n")
-                continue
+        except Exception as err:
+            print(f"\n\nSomething went wrong {err}\n\n")
+            continue
 
 
-def start_thread(stream, lock, nmeareader):
+def start_thread(lock, nmeareader):
     """
     Start read thread
     """
 
-    thr = Thread(target=read_messages, args=(stream, lock, nmeareader), daemon=True)
+    thr = Thread(target=read_messages, args=(lock, nmeareader), daemon=True)
     thr.start()
     return thr
 
@@ -91,13 +91,12 @@ if __name__ == "__main__":
 
     with Serial(port, baudrate, timeout=timeout) as serial:
 
-        # create NMEAReader instance
-        nmr = NMEAReader(BufferedReader(serial))
+        # create NMEAEventReader instance
+        nmr = NMEAEventReader(serial, timeout=1)
 
         print("\nStarting read thread...\n")
-        reading = True
         serial_lock = Lock()
-        read_thread = start_thread(serial, serial_lock, nmr)
+        read_thread = start_thread(serial_lock, nmr)
 
         # DO OTHER STUFF HERE WHILE THREAD RUNS IN BACKGROUND...
         for msgid in NMEA_MSGIDS:
@@ -109,6 +108,7 @@ if __name__ == "__main__":
         print("\nPolling complete. Pausing for any final responses...\n")
         sleep(1)
         print("\nStopping reader thread...\n")
-        reading = False
+        nmr.stop()
         read_thread.join()
+        nmr.close()
         print("\nProcessing Complete")
@@ -3,7 +3,13 @@ This is a simple HTTP Server utilising the native
 Python 3 http.server library.
 
 It implements a REST API /gps to retrieve GPS data
-from the designated GPSClass object.
+from the designated GPSClass object, and a Server-Sent Events
+(SSE) endpoint /events which pushes GPS data to connected
+browsers as it changes, rather than having them poll /gps.
+
+GPSClass objects should subclass GPSPublisher, which serializes
+each update once and pushes only the fields which have changed
+since the previous update to all subscribed clients.
 
 A dummy GPSDataStub object is provided to simulate
 the output from a GPS device.
@@ -12,7 +18,8 @@ NB: Must be executed from the root folder i.e. /examples/webserver/.
 Press CTRL-C to terminate.
 
 The web page can be accessed at http://localhost:8080. The dummy parsed 
-data can also be accessed directly via the REST API http://localhost:8080/gps.
+data can also be accessed directly via the REST API http://localhost:8080/gps
+or as an event stream via http://localhost:8080/events.
 
 Created on 17 May 2021
 
@@ -20,10 +27,12 @@ Created on 17 May 2021
 :license: (c) SEMU Consulting 2021 - BSD 3-Clause License
 """
 
-from http.server import SimpleHTTPRequestHandler, HTTPServer
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import json
 import random
 from datetime import datetime
+from queue import Empty, Full, Queue
+from threading import Event, Lock, Thread
 
 ADDRESS = "localhost"
 TCPPORT = 8080
@@ -31,16 +40,163 @@ HTML = "/index.html"
 CSS = "/styles.css"
 JS = "/scripts.js"
 ICON = "/favicon.ico"
+EVENTS = "/events"
+QUEUESIZE = 16  # maximum number of pending events per client
+KEEPALIVE = 15  # seconds between keepalive comments on idle event streams
 
 
-class GPSDataStub:
+class GPSPublisher:
     """
-    Stub data class to simulate GPS data.
+    GPS data publisher.
+
+    Maintains the current GPS data dictionary and pushes changes
+    to subscribed /events clients. Each update is JSON encoded
+    once, however many clients are subscribed, and contains only
+    those fields whose values have changed. A newly subscribed client
+    first receives the full current data.
+
+    A client whose event queue is full (i.e. which is not keeping up)
+    is unsubscribed; browser EventSource clients will automatically
+    reconnect and resynchronise from the full current data.
     """
 
+    def __init__(self):
+        """
+        Constructor.
+        """
+
+        self.gpsdata = {}
+        self._json = None  # cached JSON encoding of gpsdata
+        self._subscribers = set()
+        self._lock = Lock()
+
+    def publish(self, data: dict) -> dict:
+        """
+        Update GPS data and push any changed fields to subscribers.
+
+        :param dict data: updated GPS data (all or some fields)
+        :return: changed fields (empty if nothing changed)
+        :rtype: dict
+        """
+
+        with self._lock:
+            delta = {
+                key: val for key, val in data.items() if self.gpsdata.get(key) != val
+            }
+            if not delta:
+                return delta
+            self.gpsdata.update(delta)
+            self._json = None
+            event = _sse(json.dumps(delta))
+            for queue in list(self._subscribers):
+                try:
+                    queue.put_nowait(event)
+                except Full:  # slow client, so end its subscription
+                    self._subscribers.discard(queue)
+                    _drain(queue)
+                    queue.put_nowait(None)
+        return delta
+
+    def subscribe(self) -> Queue:
+        """
+        Subscribe to GPS data updates.
+
+        :return: queue of encoded events, primed with the full current data;
+            None in the queue signifies that the subscription has ended
+        :rtype: queue.Queue
+        """
+
+        queue = Queue(QUEUESIZE)
+        with self._lock:
+            queue.put_nowait(_sse(self._get_json()))
+            self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: Queue):
+        """
+        Unsubscribe from GPS data updates.
+
+        :param queue.Queue queue: queue returned by subscribe()
+        """
+
+        with self._lock:
+            self._subscribers.discard(queue)
+
+    @property
+    def subscribers(self) -> int:
+        """
+        Number of subscribed clients.
+
+        :return: number of subscribers
+        :rtype: int
+        """
+
+        return len(self._subscribers)
+
     def get_data(self):
         """
-        Simulated REST API /gps response.
+        Return GPS data in JSON format.
+
+        This is used by the REST API /gps implemented in the
+        GPSHTTPServer class. The JSON is only re-encoded when
+        the data has changed.
+        """
+
+        with self._lock:
+            return self._get_json()
+
+    def _get_json(self):
+        """
+        Return cached JSON encoding of GPS data (caller must hold lock).
+        """
+
+        if self._json is None:
+            self._json = json.dumps(self.gpsdata)
+        return self._json
+
+
+class GPSDataStub(GPSPublisher):
+    """
+    Stub data class to simulate GPS data.
+    """
+
+    def __init__(self, interval=1.0):
+        """
+        Constructor.
+        """
+
+        super().__init__()
+        self._interval = interval
+        self._stopevent = Event()
+        self.publish(self.simulate())
+
+    def start(self):
+        """
+        Start thread publishing simulated data.
+        """
+
+        self._stopevent.clear()
+        Thread(target=self._run, daemon=True).start()
+
+    def stop(self):
+        """
+        Stop thread publishing simulated data.
+        """
+
+        self._stopevent.set()
+
+    def _run(self):
+        """
+        THREADED PROCESS
+        Publishes simulated data at the designated interval.
+        """
+
+        while not self._stopevent.wait(self._interval):
+            self.publish(self.simulate())
+
+    def simulate(self):
+        """
+        Simulated GPS data.
         """
 
         now = datetime.now()
@@ -58,15 +214,19 @@ class GPSDataStub:
             "vdop": round(random.uniform(0, 99.0), 2),
             "fix": random.randrange(1, 4),
         }
-        return json.dumps(dic)
+        return dic
 
 
-class GPSHTTPServer(HTTPServer):
+class GPSHTTPServer(ThreadingHTTPServer):
     """
-    HTTPServer subclass incorporating reference to GPSClass object which
-    must implement a get_data() method in support of the /gps REST API.
+    ThreadingHTTPServer subclass incorporating reference to GPSClass
+    object which must implement a get_data() method in support of the
+    /gps REST API and subscribe() and unsubscribe() methods in support
+    of the /events event stream (e.g. by subclassing GPSPublisher).
     """
 
+    daemon_threads = True
+
     def __init__(self, server_address, RequestHandlerClass, GPSClass):
         """
         Constructor.
@@ -94,6 +254,9 @@ class GPSHTTPHandler(SimpleHTTPRequestHandler):
 
         if self.path in (HTML, JS, CSS, ICON):
             res = open(self.path[1:]).read()
+        elif self.path == EVENTS:  # stream GPS data updates
+            self.send_events()
+            return
         elif self.path == "/gps":  # invoke GPS REST API
             res = self.server.gps.get_data()
             mimetype = "application/json"
@@ -106,16 +269,70 @@ class GPSHTTPHandler(SimpleHTTPRequestHandler):
         self.end_headers()
         self.wfile.write(res.encode())
 
+    def send_events(self):
+        """
+        Push GPS data updates to client as Server-Sent Events until
+        the client disconnects or its subscription is ended.
+        """
 
-if __name__ == "__main__":
+        self.send_response(200)
+        self.send_header("Content-type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        queue = self.server.gps.subscribe()
+        try:
+            while True:
+                try:
+                    event = queue.get(timeout=KEEPALIVE)
+                except Empty:
+                    event = b": keepalive\n\n"
+                if event is None:
+                    break
+                self.wfile.write(event)
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.gps.unsubscribe(queue)
+            self.close_connection = True
+
+
+def _drain(queue: Queue):
+    """
+    Discard any pending events in queue.
+
+    :param queue.Queue queue: event queue
+    """
 
+    try:
+        while True:
+            queue.get_nowait()
+    except Empty:
+        pass
+
+
+def _sse(data: str) -> bytes:
+    """
+    Encode data as a Server-Sent Event.
+
+    :param str data: single-line event data
+    :return: encoded event
+    :rtype: bytes
+    """
+
+    return f"data: {data}\n\n".encode()
+
+
+if __name__ == "__main__":
     gps = GPSDataStub()
+    gps.start()
     print("\nStarting HTTP Server on http://" + ADDRESS + ":" + str(TCPPORT) + " ...")
     httpd = GPSHTTPServer((ADDRESS, TCPPORT), GPSHTTPHandler, gps)
 
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
-        httpd.shutdown()
+        gps.stop()
+        httpd.server_close()
 
     print("\nHTTP Server stopped.")
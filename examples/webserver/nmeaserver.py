@@ -11,8 +11,14 @@ implemented by the pynmeagps streaming and parsing service.
 NB: Must be executed from the root folder i.e. /examples/webserver/.
 Press CTRL-C to terminate.
 
+The NMEA sentences of each navigation epoch are fused into a single
+fix by pynmeagps.EpochBuilder, and any changes are pushed to the web page
+as Server-Sent Events via the /events endpoint implemented by
+GPSHTTPServer, rather than having the page poll the REST API.
+
 The web page can be accessed at http://localhost:8080. The parsed 
-data can also be accessed directly via the REST API http://localhost:8080/gps.
+data can also be accessed directly via the REST API http://localhost:8080/gps
+or as an event stream via http://localhost:8080/events.
 
 Created on 17 May 2021
 
@@ -21,17 +27,31 @@ Created on 17 May 2021
 """
 
 from sys import platform
-from io import BufferedReader
 from threading import Thread, Event
 from time import sleep
-import json
-from gpshttpserver import GPSHTTPServer, GPSHTTPHandler
+from gpshttpserver import GPSHTTPServer, GPSHTTPHandler, GPSPublisher
 from serial import Serial, SerialException, SerialTimeoutException
-from pynmeagps import NMEAReader, GET
+from pynmeagps import EpochBuilder, NMEAEventReader, GET
 import pynmeagps.exceptions as nme
 
-
-class NMEAStreamer:
+# GPS data fields derived from NMEAFix attributes
+FIXDATA = (
+    ("date", "date"),
+    ("time", "time"),
+    ("latitude", "lat"),
+    ("longitude", "lon"),
+    ("elevation", "alt"),
+    ("speed", "spd"),
+    ("track", "cog"),
+    ("siv", "numSV"),
+    ("pdop", "PDOP"),
+    ("hdop", "HDOP"),
+    ("vdop", "VDOP"),
+    ("fix", "navMode"),
+)
+
+
+class NMEAStreamer(GPSPublisher):
     """
     NMEAStreamer class.
     """
@@ -41,6 +61,7 @@ class NMEAStreamer:
         Constructor.
         """
 
+        super().__init__()
         self._serial_object = None
         self._serial_thread = None
         self._nmeareader = None
@@ -51,20 +72,23 @@ class NMEAStreamer:
         self._nmea_only = nmea_only
         self._validate = validate
         self._stopevent = Event()
-        self.gpsdata = {
-            "date": "1900-01-01",
-            "time": "00.00.00",
-            "latitude": 0.0,
-            "longitude": 0.0,
-            "elevation": 0.0,
-            "speed": 0.0,
-            "track": 0,
-            "siv": 0,
-            "pdop": 99,
-            "hdop": 99,
-            "vdop": 99,
-            "fix": 0,
-        }
+        self._epochbuilder = EpochBuilder()
+        self.publish(
+            {
+                "date": "1900-01-01",
+                "time": "00.00.00",
+                "latitude": 0.0,
+                "longitude": 0.0,
+                "elevation": 0.0,
+                "speed": 0.0,
+                "track": 0,
+                "siv": 0,
+                "pdop": 99,
+                "hdop": 99,
+                "vdop": 99,
+                "fix": 0,
+            }
+        )
 
     def __del__(self):
         """
@@ -85,8 +109,10 @@ class NMEAStreamer:
             self._serial_object = Serial(
                 self._port, self._baudrate, timeout=self._timeout
             )
-            self._nmeareader = NMEAReader(
-                BufferedReader(self._serial_object),
+            self._nmeareader = NMEAEventReader(
+                self._serial_object,
+                timeout=1,
+                stopevent=self._stopevent,
                 nmeaonly=self._nmea_only,
                 validate=self._validate,
                 msgmode=GET,
@@ -136,59 +162,36 @@ class NMEAStreamer:
     def _read_thread(self, stopevent):
         """
         THREADED PROCESS
-        Reads and parses NMEA message data from stream
+        Reads and parses NMEA message data from stream, waiting
+        for data to arrive rather than polling the serial port
         """
 
-        while not stopevent.is_set():
-            if self._serial_object.in_waiting:
-                try:
-                    (raw_data, parsed_data) = self._nmeareader.read()
-                    if parsed_data:
-                        self.set_data(parsed_data)
-                except (
-                    nme.NMEAStreamError,
-                    nme.NMEAMessageError,
-                    nme.NMEATypeError,
-                    nme.NMEAParseError,
-                ) as err:
-                    print(f"Something went wrong {err}")
-                    continue
-
-    def set_data(self, parsed_data):
-        """
-        Set GPS data dictionary from RMC, GGA and GSA sentences.
-        """
-
-        # print(parsed_data)
-        if parsed_data.msgID == "RMC":
-            self.gpsdata["date"] = str(parsed_data.date)
-            self.gpsdata["time"] = str(parsed_data.time)
-            self.gpsdata["latitude"] = parsed_data.lat
-            self.gpsdata["longitude"] = parsed_data.lon
-            self.gpsdata["speed"] = parsed_data.spd
-            self.gpsdata["track"] = parsed_data.cog
-        if parsed_data.msgID == "GGA":
-            self.gpsdata["time"] = str(parsed_data.time)
-            self.gpsdata["latitude"] = parsed_data.lat
-            self.gpsdata["longitude"] = parsed_data.lon
-            self.gpsdata["elevation"] = parsed_data.alt
-            self.gpsdata["siv"] = parsed_data.numSV
-            self.gpsdata["hdop"] = parsed_data.HDOP
-        if parsed_data.msgID == "GSA":
-            self.gpsdata["fix"] = parsed_data.navMode
-            self.gpsdata["pdop"] = parsed_data.PDOP
-            self.gpsdata["hdop"] = parsed_data.HDOP
-            self.gpsdata["vdop"] = parsed_data.VDOP
+        while not (stopevent.is_set() or self._nmeareader.eof):
+            try:
+                (raw_data, parsed_data) = self._nmeareader.read()
+                for fix in self._epochbuilder.process(parsed_data):
+                    self.set_data(fix)
+            except (
+                nme.NMEAStreamError,
+                nme.NMEAMessageError,
+                nme.NMEATypeError,
+                nme.NMEAParseError,
+            ) as err:
+                print(f"Something went wrong {err}")
+                continue
 
-    def get_data(self):
+    def set_data(self, fix):
         """
-        Return GPS data in JSON format.
-
-        This is used by the REST API /gps implemented in the
-        GPSHTTPServer class.
+        Set GPS data dictionary from fused NMEAFix and push any
+        changed fields to /events clients.
         """
 
-        return json.dumps(self.gpsdata)
+        data = {}
+        for key, att in FIXDATA:
+            val = getattr(fix, att)
+            if val is not None:
+                data[key] = str(val) if key in ("date", "time") else val
+        self.publish(data)
 
 
 if __name__ == "__main__":
@@ -222,7 +225,7 @@ if __name__ == "__main__":
 
         try:
             while True:
-                pass
+                sleep(1)
         except KeyboardInterrupt:
             print("\n\nTerminated by user\n\n")
 
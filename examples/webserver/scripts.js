@@ -2,24 +2,22 @@
 
 var gInterval = 5000; // 5 seconds
 var gTimer = 0;
+var gSource = null;
 var FIXDESC = ["No Fix", "2D", "3D"];
 
-// Refresh web page
+// Refresh web page with those fields present in obj
 function refreshPage(obj) {
     "use strict";
 
-    document.getElementById('date').innerHTML = obj.date;
-    document.getElementById('time').innerHTML = obj.time;
-    document.getElementById('latitude').innerHTML = obj.latitude;
-    document.getElementById('longitude').innerHTML = obj.longitude;
-    document.getElementById('elevation').innerHTML = obj.elevation;
-    document.getElementById('speed').innerHTML = obj.speed;
-    document.getElementById('track').innerHTML = obj.track;
-    document.getElementById('siv').innerHTML = obj.siv;
-    document.getElementById('pdop').innerHTML = obj.pdop;
-    document.getElementById('hdop').innerHTML = obj.hdop;
-    document.getElementById('vdop').innerHTML = obj.vdop;
-    document.getElementById('fix').innerHTML = FIXDESC[obj.fix - 1];
+    var key;
+    for (key in obj) {
+        if (obj.hasOwnProperty(key)) {
+            var elem = document.getElementById(key);
+            if (elem !== null) {
+                elem.innerHTML = (key === 'fix') ? FIXDESC[obj.fix - 1] : obj[key];
+            }
+        }
+    }
 
 }
 
@@ -51,11 +49,28 @@ function setTimer() {
     gTimer = setInterval("getGPS()", gInterval);
 }
 
+// Subscribe to gps data events; each event contains only the changed
+// fields, and the first event after (re)connecting contains all fields
+function subscribe() {
+    "use strict";
+
+    gSource = new EventSource('/events');
+    gSource.onmessage = function (event) {
+        refreshPage(JSON.parse(event.data));
+    };
+
+}
+
 // Functions to call when body first loaded
 function start() {
     "use strict";
 
-    getGPS();
-    setTimer();
+    if (typeof EventSource !== 'undefined') {
+        subscribe();
+    }
+    else { // fall back to polling REST API
+        getGPS();
+        setTimer();
+    }
 
 }
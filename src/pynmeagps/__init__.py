@@ -15,7 +15,42 @@ from pynmeagps.exceptions import (
     NMEAStreamError,
 )
 from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeacompact import CompactNMEAMessage, compact_class, compact_message
 from pynmeagps.nmeareader import NMEAReader
+from pynmeagps.nmeaserializer import NMEASerializer
+from pynmeagps.nmeareplay import NMEAReplay, synthesize
+from pynmeagps.nmeabroadcaster import (
+    NMEABroadcaster,
+    DISCONNECT,
+    DROPNEWEST,
+    DROPOLDEST,
+)
+from pynmeagps.asyncnmeareader import AsyncNMEAReader
+from pynmeagps.nmeaeventreader import NMEAEventReader
+from pynmeagps.mmapnmeareader import MMapNMEAReader
+from pynmeagps.nmeabulk import available_cpus, parse_file, split_file
+from pynmeagps.nmeapipeline import (
+    ChecksumStage,
+    FilterStage,
+    MapStage,
+    ParseStage,
+    Pipeline,
+    PipelineItem,
+    RawWriter,
+    Stage,
+)
+from pynmeagps.epochbuilder import EpochBuilder, NMEAFix
+from pynmeagps.gpxwriter import GPXWriter
+from pynmeagps.gsvassembler import GSVAssembler, SatelliteTable
+from pynmeagps.nmeaarrays import (
+    decode_columns,
+    ecef2llh_array,
+    llh2ecef_array,
+    haversine_array,
+    bearing_array,
+    track_distances,
+    track_bearings,
+)
 from pynmeagps.socket_stream import SocketStream
 from pynmeagps.nmeatypes_core import *
 from pynmeagps.nmeatypes_get import *
@@ -0,0 +1,134 @@
+"""
+AsyncNMEAReader class.
+
+Reads and parses individual NMEA GNSS/GPS messages from
+any asynchronous stream which supports an 'async read(n) -> bytes'
+method, such as asyncio.StreamReader.
+
+Returns both the raw binary data (as bytes) and the parsed
+data (as a NMEAMessage object).
+
+Data awaited from the stream is fed to an internal NMEAReader,
+which frames, filters and parses the sentences, so validation,
+msgmode, nmeaonly, quitonerror, msgfilter and instrumentation
+semantics are identical to those of NMEAReader. This allows a
+single event loop to multiplex many NMEA streams without a thread
+per stream e.g.
+
+    reader, _ = await asyncio.open_connection(host, port)
+    async for raw, parsed in AsyncNMEAReader(reader):
+        ...
+
+NB: as for NMEAReader.read_buffered(), a sentence which is not
+CRLF terminated is skipped, rather than ending the stream.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+from time import perf_counter_ns
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEAReader
+
+
+class AsyncNMEAReader:
+    """
+    AsyncNMEAReader class.
+
+    Constructor keyword arguments are as for NMEAReader, except
+    that 'stream' must support an 'async read(n) -> bytes' method
+    (e.g. asyncio.StreamReader) and 'bufsize' is the stream read
+    chunk size.
+    """
+
+    def __init__(self, stream, **kwargs):
+        """Constructor.
+
+        :param stream stream: asynchronous input data stream
+            (e.g. asyncio.StreamReader)
+        :param kwargs: keyword arguments as for NMEAReader
+            e.g. msgmode, quitonerror, msgfilter, instrument
+        :raises: NMEAParseError (if mode is invalid)
+        """
+
+        # the internal reader is only fed data read here, never a stream
+        self._reader = NMEAReader(None, **kwargs)
+        self._stream = stream
+        self._bufsize = int(kwargs.get("bufsize", 4096))
+        self._instrument = kwargs.get("instrument", False)
+
+    def __aiter__(self):
+        """Asynchronous iterator."""
+
+        return self
+
+    async def __anext__(self) -> (bytes, NMEAMessage):
+        """
+        Return next item in asynchronous iteration.
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
+        :rtype: tuple
+        :raises: StopAsyncIteration
+
+        """
+
+        (raw_data, parsed_data) = await self.read()
+        if raw_data is None and parsed_data is None:
+            raise StopAsyncIteration
+        return (raw_data, parsed_data)
+
+    async def read(self) -> (bytes, NMEAMessage):
+        """
+        Read the binary data from the stream buffer, awaiting
+        further data from the stream as required.
+
+        If a msgfilter is set, messages not in the filter are either
+        skipped or, if filterraw=True, returned as (raw_data, None).
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage),
+            or (None, None) if stream is exhausted
+        :rtype: tuple
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+
+        """
+
+        reader = self._reader
+        while True:
+            item = reader.read_buffered()
+            if item != (None, None):
+                return item
+            if self._instrument:  # read timing includes time awaiting data
+                start = perf_counter_ns()
+                data = await self._stream.read(self._bufsize)
+                added = reader.feed(data, perf_counter_ns() - start)
+            else:
+                added = reader.feed(await self._stream.read(self._bufsize))
+            if not added:
+                return (None, None)
+
+    @property
+    def skipped(self) -> dict:
+        """
+        Skipped messages getter.
+
+        :return: count of messages filtered by msgfilter, by identity
+            e.g. {"GPGSV": 12, "GNGSA": 8}
+        :rtype: dict
+        """
+
+        return self._reader.skipped
+
+    @property
+    def stats(self) -> dict:
+        """
+        Instrumentation statistics getter, as for NMEAReader. Only
+        available if the reader was created with instrument=True.
+
+        :return: snapshot of counters and timings (empty if instrument=False)
+        :rtype: dict
+        """
+
+        return self._reader.stats
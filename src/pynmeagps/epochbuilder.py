@@ -0,0 +1,353 @@
+"""
+Navigation epoch builder.
+
+A receiver outputs several NMEA sentences for each navigation epoch
+(e.g. RMC, VTG, GGA, GSA, GST, ZDA), each containing some of the epoch's
+navigation solution. EpochBuilder consumes parsed NMEAMessage objects
+and merges the relevant attributes of each sentence type into a single
+NMEAFix record per epoch e.g.
+
+    epb = EpochBuilder(terminator="GST")
+    for fix in epb.assemble(NMEAReader(stream)):
+        print(fix.time, fix.lat, fix.lon, fix.alt, fix.HDOP)
+
+or, with an asynchronous reader:
+
+    async for fix in epb.aassemble(AsyncNMEAReader(reader)):
+        ...
+
+An epoch is identified by the 'time' attribute of its sentences. The
+current fix is emitted when a sentence with a different time is
+received or, if a terminating sentence type is specified, as soon as
+that sentence has been merged. Sentences without a time attribute
+(e.g. GSA, VTG) are merged into the current epoch.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+# pylint: disable=invalid-name
+
+from datetime import date
+from pynmeagps.nmeacompact import CompactNMEAMessage
+from pynmeagps.nmeamessage import NMEAMessage
+import pynmeagps.exceptions as nme
+
+# NMEAFix attributes merged from each sentence type, as (fix attribute, message attribute)
+FIXFIELDS = {
+    "GGA": (
+        ("time", "time"),
+        ("lat", "lat"),
+        ("lon", "lon"),
+        ("alt", "alt"),
+        ("sep", "sep"),
+        ("quality", "quality"),
+        ("numSV", "numSV"),
+        ("HDOP", "HDOP"),
+        ("diffAge", "diffAge"),
+    ),
+    "RMC": (
+        ("time", "time"),
+        ("date", "date"),
+        ("status", "status"),
+        ("lat", "lat"),
+        ("lon", "lon"),
+        ("spd", "spd"),
+        ("cog", "cog"),
+        ("posMode", "posMode"),
+    ),
+    "GSA": (
+        ("navMode", "navMode"),
+        ("PDOP", "PDOP"),
+        ("HDOP", "HDOP"),
+        ("VDOP", "VDOP"),
+    ),
+    "GST": (
+        ("time", "time"),
+        ("rangeRms", "rangeRms"),
+        ("stdLat", "stdLat"),
+        ("stdLong", "stdLong"),
+        ("stdAlt", "stdAlt"),
+    ),
+    "VTG": (
+        ("cog", "cogt"),
+        ("spd", "sogn"),
+        ("posMode", "posMode"),
+    ),
+    "ZDA": (("time", "time"),),  # date is derived from day, month and year
+}
+
+
+class NMEAFix:
+    """
+    NMEAFix class.
+
+    Navigation solution for a single epoch. Attributes which were not
+    provided by any sentence in the epoch are None. 'svids' contains the
+    satellites used in the solution, from all GSA sentences in the epoch.
+    """
+
+    __slots__ = (
+        "time",
+        "date",
+        "status",
+        "lat",
+        "lon",
+        "alt",
+        "sep",
+        "quality",
+        "numSV",
+        "diffAge",
+        "spd",
+        "cog",
+        "posMode",
+        "navMode",
+        "PDOP",
+        "HDOP",
+        "VDOP",
+        "rangeRms",
+        "stdLat",
+        "stdLong",
+        "stdAlt",
+        "svids",
+    )
+
+    def __init__(self, **kwargs):
+        """Constructor.
+
+        :param kwargs: optional attribute values (all others None)
+        :raises: AttributeError if keyword is not a valid attribute
+        """
+
+        for att in self.__slots__:
+            setattr(self, att, None)
+        for att, val in kwargs.items():
+            setattr(self, att, val)
+
+    def __str__(self) -> str:
+        """
+        Human readable representation.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        return (
+            "<NMEAFix("
+            + ", ".join(f"{att}={val}" for att, val in self.asdict().items())
+            + ")>"
+        )
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        eval(repr(obj)) = obj
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return (
+            "NMEAFix("
+            + ", ".join(f"{att}={val!r}" for att, val in self.asdict().items())
+            + ")"
+        )
+
+    def __eq__(self, other) -> bool:
+        """
+        Equality comparison.
+
+        :param object other: object to compare
+        :return: True if all attributes are equal
+        :rtype: bool
+        """
+
+        if not isinstance(other, NMEAFix):
+            return NotImplemented
+        return all(getattr(self, att) == getattr(other, att) for att in self.__slots__)
+
+    def asdict(self) -> dict:
+        """
+        Return attributes as dictionary.
+
+        :return: dictionary of attribute names and values
+        :rtype: dict
+        """
+
+        return {att: getattr(self, att) for att in self.__slots__}
+
+
+class EpochBuilder:
+    """
+    EpochBuilder class.
+    """
+
+    def __init__(self, terminator: str = None):
+        """Constructor.
+
+        :param str terminator: msgID of sentence which terminates each
+            epoch e.g. "GST" (None = emit epoch when time changes)
+        """
+
+        self._terminator = terminator
+        self._fix = None  # current (pending) fix
+
+    def process(self, parsed: object) -> list:
+        """
+        Process parsed message. Anything other than a GGA, RMC, GSA,
+        GST, VTG or ZDA NMEAMessage or CompactNMEAMessage (including None
+        or an error string from NMEAReader) is ignored.
+
+        :param object parsed: parsed message
+        :return: list of NMEAFix objects emitted (empty or one)
+        :rtype: list
+        """
+
+        if not isinstance(parsed, (NMEAMessage, CompactNMEAMessage)):
+            return []
+        msgID = parsed.msgID
+        fields = FIXFIELDS.get(msgID, None)
+        if fields is None:
+            return []
+
+        fixes = []
+        fix = self._fix
+        tim = _value(parsed, "time")
+        if fix is not None and tim != "" and fix.time is not None and tim != fix.time:
+            fixes.append(fix)  # time has changed, so epoch is complete
+            fix = None
+        if fix is None:
+            fix = NMEAFix()
+        for fatt, matt in fields:
+            val = _value(parsed, matt)
+            if val != "":
+                setattr(fix, fatt, val)
+        if msgID == "GSA":
+            svids = tuple(svid for svid in _svids(parsed) if svid != "")
+            if fix.svids is not None:
+                svids = fix.svids + svids
+            setattr(fix, "svids", svids)
+        elif msgID == "ZDA":
+            dat = _zdadate(parsed)
+            if dat is not None:
+                setattr(fix, "date", dat)
+        if msgID == self._terminator:
+            fixes.append(fix)
+            fix = None
+        self._fix = fix
+        return fixes
+
+    def assemble(self, stream):
+        """
+        Generator which processes each item of an iterable of
+        parsed messages or (raw_data, parsed_data) tuples (e.g. an
+        NMEAReader), flushing any pending epoch at the end.
+
+        :param iterable stream: parsed messages or (raw_data, parsed_data) tuples
+        :return: generator of NMEAFix objects
+        :rtype: generator
+        """
+
+        for item in stream:
+            if isinstance(item, tuple):
+                item = item[1]
+            yield from self.process(item)
+        yield from self.flush()
+
+    async def aassemble(self, stream):
+        """
+        Asynchronous generator which processes each item of an
+        asynchronous iterable of parsed messages or (raw_data,
+        parsed_data) tuples (e.g. an AsyncNMEAReader), flushing
+        any pending epoch at the end.
+
+        :param iterable stream: asynchronous iterable of parsed messages
+            or (raw_data, parsed_data) tuples
+        :return: asynchronous generator of NMEAFix objects
+        :rtype: async_generator
+        """
+
+        async for item in stream:
+            if isinstance(item, tuple):
+                item = item[1]
+            for fix in self.process(item):
+                yield fix
+        for fix in self.flush():
+            yield fix
+
+    def flush(self) -> list:
+        """
+        Emit pending epoch, if any.
+
+        :return: list of NMEAFix objects (empty or one)
+        :rtype: list
+        """
+
+        fix = self._fix
+        self._fix = None
+        return [] if fix is None else [fix]
+
+
+def _value(parsed: NMEAMessage, att: str) -> object:
+    """
+    Get message attribute value, treating an absent attribute or
+    a (deferred) lazy conversion error as an empty value.
+
+    :param NMEAMessage parsed: parsed message
+    :param str att: attribute name
+    :return: attribute value, or "" if absent or invalid
+    :rtype: object
+    """
+
+    try:
+        return getattr(parsed, att)
+    except (AttributeError, nme.NMEATypeError):
+        return ""
+
+
+def _zdadate(parsed: NMEAMessage) -> date:
+    """
+    Get date from ZDA message day, month and year.
+
+    :param NMEAMessage parsed: ZDA message
+    :return: date, or None if absent or invalid
+    :rtype: datetime.date
+    """
+
+    try:
+        return date(
+            _value(parsed, "year"), _value(parsed, "month"), _value(parsed, "day")
+        )
+    except (TypeError, ValueError):
+        return None
+
+
+def _svids(parsed: NMEAMessage) -> tuple:
+    """
+    Get satellites used in solution from GSA message, parsed with or
+    without the 'groups' option. Invalid svids in a message parsed
+    with the 'lazy' option are omitted.
+
+    :param NMEAMessage parsed: GSA message
+    :return: tuple of svids
+    :rtype: tuple
+    """
+
+    try:
+        group = getattr(parsed, "groupSV", None)
+    except nme.NMEATypeError:  # (deferred) lazy conversion error
+        group = None
+    if group is not None:
+        return group.svid
+    svids = []
+    for i in range(1, 13):
+        try:
+            svids.append(getattr(parsed, f"svid_{i:02d}"))
+        except AttributeError:
+            break
+        except nme.NMEATypeError:
+            continue
+    return tuple(svids)
@@ -0,0 +1,307 @@
+"""
+Streaming GPX track writer.
+
+Writes a GPX 1.1 track from NMEAFix records, as produced by
+EpochBuilder, or directly from NMEAReader output e.g.
+
+    with open("nmeadata.log", "rb") as stream, open("track.gpx", "w") as gpxfile:
+        with GPXWriter(gpxfile) as gpx:
+            gpx.write_all(NMEAReader(stream))
+
+Trackpoints are accumulated in an internal buffer, which is written
+to the output text stream in chunks of around 'bufsize' characters,
+so arbitrarily large logs can be converted with constant memory.
+
+Trackpoint times use the date from the most recent RMC or ZDA
+sentence (advanced at midnight rollover), rather than the wall-clock
+date. Trackpoints prior to the first date are written without a time.
+A new track segment is started whenever the fix is lost (e.g. GGA
+quality 0, RMC status 'V' or no position) or, if 'maxgap' is
+specified, after a gap of more than 'maxgap' seconds between fixes.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=invalid-name
+
+from datetime import timedelta
+from xml.sax.saxutils import escape
+from pynmeagps.epochbuilder import EpochBuilder, NMEAFix
+import pynmeagps.exceptions as nme
+
+BUFSIZE = 65536  # default output buffer size in characters
+GITHUB_LINK = "https://github.com/semuconsulting/pynmeagps"
+GPX_HDR = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<gpx xmlns="http://www.topografix.com/GPX/1/1" creator="{creator}" version="1.1" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xsi:schemaLocation="http://www.topografix.com/GPX/1/1 '
+    'http://www.topografix.com/GPX/1/1/gpx.xsd">\n'
+    '<metadata><link href="{link}"><text>pynmeagps</text></link></metadata>\n'
+    "<trk><name>{name}</name>\n"
+)
+GPX_TLR = "</trk></gpx>\n"
+# GPX fix type by GGA quality, where this determines the fix type
+GPXFIX_QUALITY = {2: "dgps", 3: "pps"}
+# GPX fix type by GSA navMode
+GPXFIX_NAVMODE = {2: "2d", 3: "3d"}
+SECSPERDAY = 86400
+
+
+class GPXWriter:
+    """
+    GPXWriter class.
+    """
+
+    def __init__(
+        self,
+        stream,
+        name: str = "GPX track from NMEA datalog",
+        bufsize: int = BUFSIZE,
+        maxgap: float = None,
+        creator: str = "pynmeagps",
+    ):
+        """Constructor.
+
+        :param stream stream: output text stream supporting a write(str)
+            method (e.g. a file opened in text mode)
+        :param str name: track name ("GPX track from NMEA datalog")
+        :param int bufsize: output buffer size in characters (65536)
+        :param float maxgap: maximum gap in seconds between fixes in a
+            track segment (None = no limit)
+        :param str creator: GPX creator attribute ("pynmeagps")
+        """
+
+        self._stream = stream
+        self._bufsize = bufsize
+        self._maxgap = maxgap
+        self._buffer = []
+        self._buflen = 0
+        self._closed = False
+        self._inseg = False  # True if track segment is open
+        self._date = None  # most recent date
+        self._lastsecs = None  # time of most recent fix, as seconds of day
+        self._lastpoint = None  # time of most recent trackpoint, as seconds of day
+        self._points = 0
+        self._segments = 0
+        self._put(
+            GPX_HDR.format(
+                creator=escape(creator, {'"': "&quot;"}),
+                link=GITHUB_LINK,
+                name=escape(name),
+            )
+        )
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def write(self, fix: NMEAFix) -> bool:
+        """
+        Write trackpoint for fix, starting a new track segment if
+        required. Fixes without a valid position end the current
+        track segment and are not written.
+
+        :param NMEAFix fix: navigation fix e.g. from EpochBuilder
+        :return: True if trackpoint was written, False if fix was invalid
+        :rtype: bool
+        :raises: NMEAStreamError if writer is closed
+        """
+
+        if self._closed:
+            raise nme.NMEAStreamError("GPX writer is closed.")
+
+        secs = self._update_date(fix)
+        if not _isvalid(fix):
+            self._end_segment()
+            return False
+        if (
+            self._maxgap is not None
+            and secs is not None
+            and self._lastpoint is not None
+            and (secs - self._lastpoint) % SECSPERDAY > self._maxgap
+        ):
+            self._end_segment()
+        if not self._inseg:
+            self._put("<trkseg>\n")
+            self._inseg = True
+            self._segments += 1
+        self._put(self._trkpt(fix))
+        self._lastpoint = secs
+        self._points += 1
+        return True
+
+    def write_all(self, stream, terminator: str = None) -> int:
+        """
+        Write trackpoint for each navigation epoch in an iterable of
+        parsed messages or (raw_data, parsed_data) tuples (e.g. an
+        NMEAReader), consolidated into fixes by an EpochBuilder.
+
+        :param iterable stream: parsed messages or (raw_data, parsed_data) tuples
+        :param str terminator: msgID of sentence which terminates each
+            epoch (None = epoch ends when time changes)
+        :return: number of trackpoints written
+        :rtype: int
+        :raises: NMEAStreamError if writer is closed
+        """
+
+        count = 0
+        for fix in EpochBuilder(terminator=terminator).assemble(stream):
+            count += self.write(fix)
+        return count
+
+    def flush(self):
+        """
+        Write buffered output to stream.
+        """
+
+        if self._buffer:
+            self._stream.write("".join(self._buffer))
+            self._buffer = []
+            self._buflen = 0
+
+    def close(self):
+        """
+        Write GPX trailer and flush buffered output. The output
+        stream itself is not closed.
+        """
+
+        if self._closed:
+            return
+        self._end_segment()
+        self._put(GPX_TLR)
+        self.flush()
+        self._closed = True
+
+    def _put(self, text: str):
+        """
+        Add text to output buffer, writing buffer to stream when full.
+
+        :param str text: text
+        """
+
+        self._buffer.append(text)
+        self._buflen += len(text)
+        if self._buflen >= self._bufsize:
+            self.flush()
+
+    def _end_segment(self):
+        """
+        End current track segment, if any.
+        """
+
+        if self._inseg:
+            self._put("</trkseg>\n")
+            self._inseg = False
+
+    def _update_date(self, fix: NMEAFix) -> int:
+        """
+        Update current date from fix, advancing it if the time has
+        wrapped past midnight since the previous fix.
+
+        :param NMEAFix fix: navigation fix
+        :return: fix time as seconds of day, or None if fix has no time
+        :rtype: int
+        """
+
+        tim = fix.time
+        secs = None
+        if tim is not None:
+            secs = tim.hour * 3600 + tim.minute * 60 + tim.second
+        if fix.date is not None:
+            self._date = fix.date
+        elif (
+            self._date is not None
+            and secs is not None
+            and self._lastsecs is not None
+            and self._lastsecs - secs > SECSPERDAY // 2
+        ):
+            self._date += timedelta(days=1)
+        if secs is not None:
+            self._lastsecs = secs
+        return secs
+
+    def _trkpt(self, fix: NMEAFix) -> str:
+        """
+        Format trackpoint element. Child elements are in the order
+        required by the GPX wptType schema.
+
+        :param NMEAFix fix: navigation fix
+        :return: trkpt element
+        :rtype: str
+        """
+
+        els = []
+        if fix.alt is not None:
+            els.append(f"<ele>{fix.alt}</ele>")
+        if fix.time is not None and self._date is not None:
+            els.append(f"<time>{self._date.isoformat()}T{fix.time.isoformat()}Z</time>")
+        if fix.sep is not None:
+            els.append(f"<geoidheight>{fix.sep}</geoidheight>")
+        fixtype = GPXFIX_QUALITY.get(fix.quality, GPXFIX_NAVMODE.get(fix.navMode, None))
+        if fixtype is not None:
+            els.append(f"<fix>{fixtype}</fix>")
+        for tag, val in (
+            ("sat", fix.numSV),
+            ("hdop", fix.HDOP),
+            ("vdop", fix.VDOP),
+            ("pdop", fix.PDOP),
+            ("ageofdgpsdata", fix.diffAge),
+        ):
+            if val is not None:
+                els.append(f"<{tag}>{val}</{tag}>")
+        return f'<trkpt lat="{fix.lat}" lon="{fix.lon}">{"".join(els)}</trkpt>\n'
+
+    @property
+    def points(self) -> int:
+        """
+        Getter for number of trackpoints written.
+
+        :return: number of trackpoints
+        :rtype: int
+        """
+
+        return self._points
+
+    @property
+    def segments(self) -> int:
+        """
+        Getter for number of track segments written.
+
+        :return: number of track segments
+        :rtype: int
+        """
+
+        return self._segments
+
+
+def _isvalid(fix: NMEAFix) -> bool:
+    """
+    Check if fix has a valid position.
+
+    :param NMEAFix fix: navigation fix
+    :return: True if position is valid
+    :rtype: bool
+    """
+
+    return (
+        fix.lat is not None
+        and fix.lon is not None
+        and fix.quality != 0
+        and fix.status != "V"
+        and fix.posMode != "N"
+    )
@@ -0,0 +1,281 @@
+"""
+GSV sentence assembler.
+
+Satellites-in-view data is output as a cycle of numMsg GSV sentences
+per talker and signal ID, each containing up to four satellites.
+GSVAssembler consumes parsed NMEAMessage objects (e.g. the output of
+an NMEAReader), buffers the GSV sentences of each cycle and emits one
+consolidated SatelliteTable per cycle e.g.
+
+    gsva = GSVAssembler()
+    for raw, parsed in NMEAReader(stream):
+        for table in gsva.process(parsed):
+            print(table.talker, table.svid, table.cno)
+
+A cycle is emitted as soon as its final (msgNum = numMsg) sentence is
+received. A cycle with missing sentences is still emitted, flagged as
+incomplete, when its final sentence is received, when a new cycle for the
+same talker and signal ID starts, or when the number of pending cycles
+exceeds a limit, so memory usage is bounded.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+# pylint: disable=invalid-name
+
+from pynmeagps.nmeacompact import CompactNMEAMessage
+from pynmeagps.nmeamessage import NMEAMessage
+import pynmeagps.exceptions as nme
+
+MAXMSGS = 9  # maximum number of sentences in a GSV cycle
+MAXPENDING = 16  # default maximum number of pending cycles
+
+
+class SatelliteTable:
+    """
+    SatelliteTable class.
+
+    Consolidated satellites-in-view data from a single GSV cycle,
+    with the values of each satellite attribute held as a tuple in
+    satellite order.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        talker: str,
+        signalID: str,
+        numSV: int,
+        sats: list,
+        missing: tuple = (),
+    ):
+        """Constructor.
+
+        :param str talker: talker e.g. "GP"
+        :param str signalID: signal ID (NMEA >=4.10), or "" if not present
+        :param int numSV: total number of satellites in view
+        :param list sats: list of (svid, elv, az, cno) tuples
+        :param tuple missing: msgNum of any GSV sentences missing from the cycle
+        """
+
+        # pylint: disable=too-many-arguments
+
+        self.talker = talker
+        self.signalID = signalID
+        self.numSV = numSV
+        self.missing = missing
+        self.svid, self.elv, self.az, self.cno = (
+            tuple(zip(*sats)) if sats else ((), (), (), ())
+        )
+
+    def __len__(self) -> int:
+        """
+        Number of satellites in table.
+
+        :return: number of satellites
+        :rtype: int
+        """
+
+        return len(self.svid)
+
+    def __iter__(self):
+        """
+        Iterate over satellites.
+
+        :return: iterator of (svid, elv, az, cno) tuples
+        :rtype: iterator
+        """
+
+        return zip(self.svid, self.elv, self.az, self.cno)
+
+    def __str__(self) -> str:
+        """
+        Human readable representation.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        return (
+            f"<SatelliteTable({self.talker}, signalID={self.signalID}, "
+            f"numSV={self.numSV}, svid={self.svid}, elv={self.elv}, "
+            f"az={self.az}, cno={self.cno}, complete={self.complete})>"
+        )
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return (
+            f"SatelliteTable('{self.talker}', '{self.signalID}', {self.numSV}, "
+            f"{list(self)}, {self.missing})"
+        )
+
+    @property
+    def complete(self) -> bool:
+        """
+        Complete getter.
+
+        :return: True if all GSV sentences in the cycle were received
+        :rtype: bool
+        """
+
+        return not self.missing
+
+
+class GSVAssembler:
+    """
+    GSVAssembler class.
+    """
+
+    def __init__(self, maxpending: int = MAXPENDING):
+        """Constructor.
+
+        :param int maxpending: maximum number of pending (talker, signal ID)
+            cycles - the oldest is emitted as incomplete if exceeded (16)
+        """
+
+        self._maxpending = max(maxpending, 1)
+        # pending cycles keyed on (talker, signalID), in order of first sentence
+        self._pending = {}
+
+    def process(self, parsed: object) -> list:
+        """
+        Process parsed message. Anything other than a GSV NMEAMessage or
+        CompactNMEAMessage (including None or an error string from
+        NMEAReader) is ignored.
+
+        :param object parsed: parsed message
+        :return: list of SatelliteTable objects emitted (usually empty or one)
+        :rtype: list
+        """
+
+        if (
+            not isinstance(parsed, (NMEAMessage, CompactNMEAMessage))
+            or parsed.msgID != "GSV"
+        ):
+            return []
+        try:
+            numMsg = parsed.numMsg
+            msgNum = parsed.msgNum
+        except (AttributeError, nme.NMEATypeError):  # truncated or invalid (lazy)
+            return []
+        if (
+            not isinstance(numMsg, int)
+            or not isinstance(msgNum, int)
+            or not 1 <= msgNum <= numMsg <= MAXMSGS
+        ):
+            return []
+        try:
+            sats = _satellites(parsed)
+            numSV = getattr(parsed, "numSV", None)
+        except nme.NMEATypeError:  # invalid (lazy) fragment, treated as missing
+            return []
+
+        tables = []
+        key = (parsed.talker, getattr(parsed, "signalID", ""))
+        cycle = self._pending.get(key, None)
+        # sentence belongs to a new cycle, so emit current one
+        if cycle is not None and (cycle[0] != numMsg or msgNum <= max(cycle[2])):
+            tables.append(self._emit(key))
+            cycle = None
+        if cycle is None:
+            if len(self._pending) >= self._maxpending:
+                tables.append(self._emit(next(iter(self._pending))))
+            cycle = self._pending[key] = [numMsg, 0, {}]
+        if numSV is not None:
+            cycle[1] = numSV
+        cycle[2][msgNum] = sats
+        if msgNum == numMsg:  # final sentence in cycle
+            tables.append(self._emit(key))
+        return tables
+
+    def assemble(self, stream):
+        """
+        Generator which processes each item of an iterable of
+        parsed messages or (raw_data, parsed_data) tuples (e.g. an
+        NMEAReader), flushing any pending cycles at the end.
+
+        :param iterable stream: parsed messages or (raw_data, parsed_data) tuples
+        :return: generator of SatelliteTable objects
+        :rtype: generator
+        """
+
+        for item in stream:
+            if isinstance(item, tuple):
+                item = item[1]
+            yield from self.process(item)
+        yield from self.flush()
+
+    def flush(self) -> list:
+        """
+        Emit all pending cycles (as incomplete).
+
+        :return: list of SatelliteTable objects
+        :rtype: list
+        """
+
+        return [self._emit(key) for key in list(self._pending)]
+
+    def _emit(self, key: tuple) -> SatelliteTable:
+        """
+        Remove pending cycle and convert it to a SatelliteTable.
+
+        :param tuple key: (talker, signalID)
+        :return: satellite table
+        :rtype: SatelliteTable
+        """
+
+        numMsg, numSV, frags = self._pending.pop(key)
+        sats = []
+        for msgNum in sorted(frags):
+            sats.extend(frags[msgNum])
+        missing = tuple(i for i in range(1, numMsg + 1) if i not in frags)
+        return SatelliteTable(key[0], key[1], numSV, sats, missing)
+
+    @property
+    def pending(self) -> int:
+        """
+        Pending getter.
+
+        :return: number of pending (incomplete) cycles
+        :rtype: int
+        """
+
+        return len(self._pending)
+
+
+def _satellites(parsed: NMEAMessage) -> list:
+    """
+    Get satellites from GSV message, parsed with or without the
+    'groups' option.
+
+    :param NMEAMessage parsed: GSV message
+    :return: list of (svid, elv, az, cno) tuples
+    :rtype: list
+    """
+
+    group = getattr(parsed, "group_sv", None)
+    if group is not None:
+        return list(zip(*group))
+    sats = []
+    i = 1
+    while True:
+        try:
+            sats.append(
+                tuple(
+                    getattr(parsed, f"{att}_{i:02d}")
+                    for att in ("svid", "elv", "az", "cno")
+                )
+            )
+        except AttributeError:
+            return sats
+        i += 1
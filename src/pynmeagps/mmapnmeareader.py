@@ -0,0 +1,133 @@
+"""
+MMapNMEAReader class.
+
+Reads and parses individual NMEA GNSS/GPS messages from a binary
+log file via a read-only memory map, rather than reading the file
+into an internal buffer.
+
+Returns the raw data of each sentence as a zero-copy memoryview
+slice of the mapping, and the parsed data (as a NMEAMessage object).
+Checksum validation and splitting in NMEAReader.parse() are performed
+directly on the slice, so file data is never copied into intermediate
+bytes objects. Where the platform supports it, pages of the mapping
+which have already been read are periodically released, so resident
+memory does not grow with the size of the file. Use bytes(raw_data)
+if a copy of the raw data is required after the reader is closed e.g.
+
+    with open("nmealog.log", "rb") as stream:
+        with MMapNMEAReader(stream) as nmr:
+            for raw, parsed in nmr:
+                ...
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+import mmap
+from pynmeagps.nmeareader import NMEAReader
+
+RELEASESIZE = 16777216  # interval in bytes at which read pages are released
+# releasing read pages requires Python>=3.8 and platform support
+CANRELEASE = hasattr(mmap.mmap, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+
+
+class MMapNMEAReader(NMEAReader):
+    """
+    MMapNMEAReader class.
+
+    Constructor keyword arguments are as for NMEAReader, except
+    that 'stream' must be a binary file object supporting fileno()
+    and 'bufsize' is not used.
+    """
+
+    def __init__(self, stream, **kwargs):
+        """Constructor.
+
+        :param stream stream: binary log file
+        :param kwargs: as for NMEAReader
+        """
+
+        super().__init__(stream, **kwargs)
+        try:
+            self._buffer = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file cannot be mapped
+            self._buffer = b""
+        self._view = memoryview(self._buffer)
+        if self._counters is not None:  # entire file is read on mapping
+            self._counters["bytes"] = len(self._buffer)
+        self._released = 0  # offset up to which read pages have been released
+        self._release = CANRELEASE and isinstance(self._buffer, mmap.mmap)
+        if self._release and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._buffer.madvise(mmap.MADV_SEQUENTIAL)
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def close(self):
+        """
+        Release memory map. If any raw data memoryview slices are still
+        referenced, the file is unmapped when they are released.
+        """
+
+        self._view.release()
+        self._release = False
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:  # exported slices still exist
+                pass
+        self._buffer = b""
+        self._view = memoryview(self._buffer)
+        self._pos = 0
+
+    def _frame(self, start: int, end: int) -> memoryview:
+        """
+        Return sentence at given offsets in memory map.
+
+        :param int start: sentence start offset
+        :param int end: sentence end offset
+        :return: NMEA sentence
+        :rtype: memoryview
+        """
+
+        if self._release and start - self._released >= RELEASESIZE:
+            self._release_pages(start)
+        return self._view[start:end]
+
+    def _release_pages(self, pos: int):
+        """
+        Release pages of the mapping which lie entirely before pos.
+        The file is mapped read-only, so any raw data slices in the
+        released pages remain valid and are simply re-read from the
+        file if accessed.
+
+        :param int pos: offset of first unread byte
+        """
+
+        end = pos - pos % mmap.PAGESIZE
+        self._buffer.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+        self._released = end
+
+    def _read_chunk(self) -> bytes:
+        """
+        The entire file is already mapped, so there is no more data.
+
+        :return: empty bytes
+        :rtype: bytes
+        """
+
+        return b""
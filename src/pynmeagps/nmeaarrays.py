@@ -0,0 +1,509 @@
+"""
+Columnar NMEA decoding and vectorized geodesy using NumPy arrays.
+
+Decodes a batch of raw NMEA sentences of a single message type
+directly into a dictionary of typed NumPy arrays, one per payload
+attribute, without constructing an NMEAMessage for each sentence,
+and provides array versions of the nmeahelpers geodesy functions
+for processing many positions at once e.g.
+
+    cols = decode_columns(raw_sentences, "GGA")
+    cols["lat"], cols["lon"], cols["alt"]
+    total = track_distances(cols["lat"], cols["lon"]).sum()
+
+The scalar nmeahelpers functions remain the fastest option for
+individual positions.
+
+Requires the optional numpy dependency (`pip install pynmeagps[numpy]`).
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+from itertools import zip_longest
+from pynmeagps.nmeahelpers import get_parts_cksum
+from pynmeagps.nmeamessage import _GROUP, compile_plan
+from pynmeagps.nmeatypes_core import (
+    DE,
+    DM,
+    DT,
+    GET,
+    IN,
+    LA,
+    LN,
+    POLL,
+    PROP_MSGIDS,
+    SET,
+    TM,
+    VALCKSUM,
+    WGS84_FLATTENING,
+    WGS84_SMAJ_AXIS,
+)
+from pynmeagps.nmeatypes_get import NMEA_PAYLOADS_GET
+from pynmeagps.nmeatypes_poll import NMEA_PAYLOADS_POLL
+from pynmeagps.nmeatypes_set import NMEA_PAYLOADS_SET
+import pynmeagps.exceptions as nme
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+PAYLOADS = {GET: NMEA_PAYLOADS_GET, SET: NMEA_PAYLOADS_SET, POLL: NMEA_PAYLOADS_POLL}
+
+
+def decode_columns(raw_sentences, msgid: str, **kwargs) -> dict:
+    """
+    Decode batch of raw NMEA sentences of a single message type
+    into a dictionary of typed NumPy arrays, one per payload attribute.
+
+    Sentences of any other message type, or which are badly formed or
+    (if validate includes VALCKSUM) have an invalid checksum, are ignored.
+
+    Attribute types map to array dtypes as follows:
+
+    - DE, LA, LN - float64, NaN if empty. LA and LN are converted to
+      decimal degrees and signed according to the NS and EW attributes.
+    - IN - int64, or float64 if any value is empty (NaN)
+    - TM - timedelta64[us] since midnight, NaT if empty
+      (add to a DT array to obtain datetime64 timestamps)
+    - DT, DM - datetime64[D], NaT if empty
+    - all other types - str
+
+    Attributes in or following a variable length repeating group
+    (e.g. GSV satellites) are not decoded.
+
+    :param object raw_sentences: iterable of raw NMEA sentences
+        as bytes, bytes-like objects or strings
+    :param str msgid: message ID, with or without talker e.g. "GGA",
+        "GNRMC", "PUBX00" or "UBX00" - if a talker is included, only
+        sentences from that talker are decoded"
+    :param int msgmode: (kwarg) 0 = GET (default), 1 = SET, 2 = POLL
+    :param int validate: (kwarg) bitfield validation flags - VALCKSUM (default)
+    :return: dict of {attribute name: numpy array}
+    :rtype: dict
+    :raises: ImportError (if numpy is not installed)
+    :raises: NMEAMessageError (if msgid is unknown)
+    """
+
+    _check_numpy("decode_columns")
+    msgmode = kwargs.get("msgmode", GET)
+    validate = kwargs.get("validate", VALCKSUM)
+    talker, key = _payload_key(msgid, msgmode)
+    plan = []
+    for step in compile_plan(PAYLOADS[msgmode][key]):
+        if step[0] == _GROUP:  # variable length repeating group
+            break
+        plan.append((step[2], step[3]))
+
+    rows = _select_rows(raw_sentences, talker, key, validate)
+    cols = list(zip_longest(*rows, fillvalue=""))
+    empty = ("",) * len(rows)
+    arrays = {}
+    for i, (name, att) in enumerate(plan):
+        arrays[name] = _to_array(cols[i] if i < len(cols) else empty, att)
+    _sign_latlon(arrays)
+    return arrays
+
+
+def _sign_latlon(arrays: dict):
+    """
+    Adjust sign of decimal lat/lon arrays according to direction
+    (NS/EW) arrays. Vectorized equivalent of NMEAMessage._sign_latlon().
+
+    :param dict arrays: dict of {attribute name: numpy array}
+    """
+
+    for key, dirn, pos, neg in (("lat", "NS", "N", "S"), ("lon", "EW", "E", "W")):
+        if key in arrays and dirn in arrays:
+            val = np.abs(arrays[key])
+            arrays[key] = np.where(
+                arrays[dirn] == neg,
+                -val,
+                np.where(arrays[dirn] == pos, val, arrays[key]),
+            )
+
+
+def _check_numpy(func: str):
+    """
+    Check that optional numpy dependency is installed.
+
+    :param str func: name of calling function
+    :raises: ImportError (if numpy is not installed)
+    """
+
+    if np is None:
+        raise ImportError(f"{func} requires numpy - install with 'pip install numpy'.")
+
+
+def _select_rows(raw_sentences, talker: str, key: str, validate: int) -> list:
+    """
+    Split raw NMEA sentences and select the payloads of those
+    matching the talker (if any) and payload definition key.
+
+    :param object raw_sentences: iterable of raw NMEA sentences
+    :param str talker: talker e.g. "GN", or "" for any talker
+    :param str key: payload definition key e.g. "GGA", "UBX00"
+    :param int validate: bitfield validation flags
+    :return: list of payloads
+    :rtype: list
+    """
+
+    rows = []
+    for raw in raw_sentences:
+        try:
+            tlk, mid, payload, cksum, calc = get_parts_cksum(raw)
+        except nme.NMEAMessageError:
+            continue
+        if talker and tlk != talker:
+            continue
+        if mid in PROP_MSGIDS and payload:
+            mid += payload[0]
+        if mid == key and not (validate & VALCKSUM and cksum != calc):
+            rows.append(payload)
+    return rows
+
+
+def _payload_key(msgid: str, msgmode: int) -> tuple:
+    """
+    Get talker and payload definition key for message ID.
+
+    :param str msgid: message ID, with or without talker
+    :param int msgmode: 0 = GET, 1 = SET, 2 = POLL
+    :return: tuple of (talker e.g. "GN", or "" if msgid has no talker,
+        payload definition key e.g. "GGA", "UBX00")
+    :rtype: tuple
+    :raises: NMEAMessageError (if msgid is unknown)
+    """
+
+    payloads = PAYLOADS.get(msgmode, {})
+    for i in range(3):
+        if msgid[i:] in payloads:
+            return msgid[:i], msgid[i:]
+    raise nme.NMEAMessageError(
+        f"Unknown msgID {msgid} msgmode {('GET', 'SET', 'POLL', '?')[min(msgmode, 3)]}."
+    )
+
+
+def _to_array(col: tuple, att: str) -> object:
+    """
+    Convert column of NMEA payload strings to typed NumPy array.
+
+    :param tuple col: column of payload strings
+    :param str att: attribute type e.g. 'DE'
+    :return: typed array
+    :rtype: numpy.ndarray
+    """
+
+    if att in (DE, LA, LN):
+        arr = _to_float(col)
+        if att != DE:
+            arr = dmm2ddd_array(arr)
+        return arr
+    if att == IN:
+        arr = _to_float(col)
+        if np.isnan(arr).any():
+            return arr
+        return arr.astype(np.int64)
+    if att == TM:
+        return time2utc_array(_to_float(col))
+    if att in (DT, DM):
+        return date2utc_array(_to_float(col), att)
+    return np.array(col, dtype=str)
+
+
+def _to_float(col: tuple) -> object:
+    """
+    Convert column of numeric strings to float64 array,
+    with NaN for empty or invalid values.
+
+    :param tuple col: column of payload strings
+    :return: float64 array
+    :rtype: numpy.ndarray
+    """
+
+    try:
+        return np.array([val or "nan" for val in col], dtype=np.float64)
+    except ValueError:  # one or more invalid values, convert individually
+        arr = np.empty(len(col), dtype=np.float64)
+        for i, val in enumerate(col):
+            try:
+                arr[i] = float(val)
+            except ValueError:
+                arr[i] = np.nan
+        return arr
+
+
+def dmm2ddd_array(pos: object) -> object:
+    """
+    Convert array of NMEA lat/lon values (d)ddmm.mmmmm to (unsigned)
+    decimal degrees. Vectorized equivalent of dmm2ddd().
+
+    :param numpy.ndarray pos: float64 array of (d)ddmm.mmmmm values
+    :return: float64 array of decimal degrees
+    :rtype: numpy.ndarray
+    """
+
+    pos = np.asarray(pos, dtype=np.float64)
+    deg = np.trunc(pos / 100)
+    return np.round(deg + (pos - deg * 100) / 60, 10)
+
+
+def time2utc_array(times: object) -> object:
+    """
+    Convert array of NMEA hhmmss.ss values to time since midnight.
+    Vectorized equivalent of time2utc().
+
+    :param numpy.ndarray times: float64 array of hhmmss.ss values
+    :return: timedelta64[us] array, NaT for empty or invalid values
+    :rtype: numpy.ndarray
+    """
+
+    times = np.asarray(times, dtype=np.float64)
+    hrs = np.trunc(times / 10000)
+    mins = np.trunc(times / 100) - hrs * 100
+    secs = times - hrs * 10000 - mins * 100
+    valid = (hrs >= 0) & (hrs < 24) & (mins >= 0) & (mins < 60) & (secs < 60)
+    usecs = np.round((hrs * 3600 + mins * 60 + secs) * 1e6)
+    usecs = np.where(valid, usecs, 0).astype(np.int64).astype("timedelta64[us]")
+    return np.where(valid, usecs, np.timedelta64("NaT", "us"))
+
+
+def date2utc_array(dates: object, form: str = DT) -> object:
+    """
+    Convert array of NMEA ddmmyy (or mmddyy) values to dates.
+    Vectorized equivalent of date2utc().
+
+    :param numpy.ndarray dates: float64 array of ddmmyy or mmddyy values
+    :param str form: date format DT = ddmmyy, DM = mmddyy (DT)
+    :return: datetime64[D] array, NaT for empty or invalid values
+    :rtype: numpy.ndarray
+    """
+
+    dates = np.asarray(dates, dtype=np.float64)
+    valid = np.isfinite(dates) & (dates >= 0) & (dates == np.trunc(dates))
+    dates = np.where(valid, dates, 0).astype(np.int64)
+    if form == DM:
+        mths, days = dates // 10000, dates // 100 % 100
+    else:
+        days, mths = dates // 10000, dates // 100 % 100
+    years = dates % 100
+    years += np.where(years >= 69, 1900, 2000)  # as per strptime %y
+    valid &= (mths >= 1) & (mths <= 12) & (days >= 1)
+    months = ((years - 1970) * 12 + np.clip(mths, 1, 12) - 1).astype("datetime64[M]")
+    res = months.astype("datetime64[D]") + (days - 1).astype("timedelta64[D]")
+    valid &= res.astype("datetime64[M]") == months  # day exceeds days in month
+    return np.where(valid, res, np.datetime64("NaT", "D"))
+
+
+def haversine_array(
+    lat1: object,
+    lon1: object,
+    lat2: object,
+    lon2: object,
+    radius: float = WGS84_SMAJ_AXIS / 1000,
+) -> object:
+    """
+    Calculate spherical distances in km between pairs of coordinates using
+    haversine formula. Vectorized equivalent of haversine() - arguments may
+    be arrays, sequences or scalars and are broadcast against each other.
+
+    :param object lat1: lat1 array
+    :param object lon1: lon1 array
+    :param object lat2: lat2 array
+    :param object lon2: lon2 array
+    :param float radius: radius in km (Earth = 6378.137 km)
+    :return: spherical distances in km
+    :rtype: numpy.ndarray
+    :raises: ImportError (if numpy is not installed)
+    """
+
+    _check_numpy("haversine_array")
+    phi1, lambda1, phi2, lambda2 = [
+        np.radians(np.asarray(c, dtype=np.float64)) for c in (lat1, lon1, lat2, lon2)
+    ]
+    cosd = np.cos(phi2 - phi1) - np.cos(phi1) * np.cos(phi2) * (
+        1 - np.cos(lambda2 - lambda1)
+    )
+    return radius * np.arccos(np.clip(cosd, -1.0, 1.0))
+
+
+def bearing_array(lat1: object, lon1: object, lat2: object, lon2: object) -> object:
+    """
+    Calculate bearings between pairs of coordinates. Vectorized equivalent
+    of bearing() - arguments may be arrays, sequences or scalars and are
+    broadcast against each other.
+
+    :param object lat1: lat1 array
+    :param object lon1: lon1 array
+    :param object lat2: lat2 array
+    :param object lon2: lon2 array
+    :return: bearings in degrees
+    :rtype: numpy.ndarray
+    :raises: ImportError (if numpy is not installed)
+    """
+
+    _check_numpy("bearing_array")
+    phi1, lambda1, phi2, lambda2 = [
+        np.radians(np.asarray(c, dtype=np.float64)) for c in (lat1, lon1, lat2, lon2)
+    ]
+    y = np.sin(lambda2 - lambda1) * np.cos(phi2)
+    x = np.cos(phi1) * np.sin(phi2) - np.sin(phi1) * np.cos(phi2) * np.cos(
+        lambda2 - lambda1
+    )
+    return (np.degrees(np.arctan2(y, x)) + 360) % 360
+
+
+def track_distances(
+    lat: object, lon: object, radius: float = WGS84_SMAJ_AXIS / 1000
+) -> object:
+    """
+    Calculate spherical distances in km between consecutive points of a
+    track e.g. track_distances(lat, lon).sum() is the total track length.
+
+    :param object lat: lat array
+    :param object lon: lon array
+    :param float radius: radius in km (Earth = 6378.137 km)
+    :return: distances in km (one fewer than number of points)
+    :rtype: numpy.ndarray
+    :raises: ImportError (if numpy is not installed)
+    """
+
+    _check_numpy("track_distances")
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    return haversine_array(lat[:-1], lon[:-1], lat[1:], lon[1:], radius)
+
+
+def track_bearings(lat: object, lon: object) -> object:
+    """
+    Calculate bearings between consecutive points of a track.
+
+    :param object lat: lat array
+    :param object lon: lon array
+    :return: bearings in degrees (one fewer than number of points)
+    :rtype: numpy.ndarray
+    :raises: ImportError (if numpy is not installed)
+    """
+
+    _check_numpy("track_bearings")
+    lat = np.asarray(lat, dtype=np.float64)
+    lon = np.asarray(lon, dtype=np.float64)
+    return bearing_array(lat[:-1], lon[:-1], lat[1:], lon[1:])
+
+
+def ecef2llh_array(
+    x: object,
+    y: object,
+    z: object,
+    a: float = WGS84_SMAJ_AXIS,
+    f: float = WGS84_FLATTENING,
+) -> tuple:
+    """
+    Convert ECEF coordinates to geodetic (LLH) using Olson algorithm.
+    Vectorized equivalent of ecef2llh().
+
+    :param object x: X coordinate array
+    :param object y: Y coordinate array
+    :param object z: Z coordinate array
+    :param float a: semi-major axis (6378137.0 for WGS84)
+    :param float f: flattening (298.257223563 for WGS84)
+    :return: tuple of (lat, lon, ellipsoidal height in m) arrays
+    :rtype: tuple
+    :raises: ImportError (if numpy is not installed)
+    """
+    # pylint: disable=too-many-locals
+
+    _check_numpy("ecef2llh_array")
+    x, y, z = np.broadcast_arrays(*[np.asarray(c, dtype=np.float64) for c in (x, y, z)])
+    f = 1 / f
+    e2 = f * (2 - f)
+    a1 = a * e2
+    a2 = a1 * a1
+    a3 = a1 * e2 / 2
+    a4 = 2.5 * a2
+    a5 = a1 + a3
+    a6 = 1 - e2
+    zp = np.abs(z)
+    w2 = x * x + y * y
+    w = np.sqrt(w2)
+    z2 = z * z
+    r2 = w2 + z2
+    r = np.sqrt(r2)
+    core = r < 100000.0  # algorithm inaccurate near Earth's core
+    r = np.where(core, 100000.0, r)
+    r2 = np.where(core, 1.0e10, r2)
+
+    lon = np.arctan2(y, x)
+    s2 = z2 / r2
+    c2 = w2 / r2
+    u = a2 / r
+    v = a3 - a4 / r
+    # c2 > 0.3 branch
+    s_hi = (zp / r) * (1.0 + c2 * (a1 + u + s2 * v) / r)
+    # c2 <= 0.3 branch
+    c_lo = (w / r) * (1.0 - s2 * (a5 - u - c2 * v) / r)
+    hi = c2 > 0.3
+    s_hi = np.where(hi, s_hi, 0.0)
+    c_lo = np.where(hi, 1.0, c_lo)
+    lat = np.where(hi, np.arcsin(s_hi), np.arccos(c_lo))
+    ss = np.where(hi, s_hi * s_hi, 1.0 - c_lo * c_lo)
+    c = np.where(hi, np.sqrt(1.0 - ss), c_lo)
+    s = np.where(hi, s_hi, np.sqrt(ss))
+    g = 1.0 - e2 * ss
+    rg = a / np.sqrt(g)
+    rf = a6 * rg
+    u = w - rg * c
+    v = zp - rf * s
+    f = c * u + s * v
+    m = c * v - s * u
+    p = m / (rf / g + f)
+    lat = lat + p
+    height = f + m * p / 2.0
+    lat = np.where(z < 0.0, -lat, lat)
+
+    lat = np.where(core, 0.0, np.degrees(lat))
+    lon = np.where(core, 0.0, np.degrees(lon))
+    height = np.where(core, -1.0e7, height)
+    return lat, lon, height
+
+
+def llh2ecef_array(
+    lat: object,
+    lon: object,
+    height: object,
+    a: float = WGS84_SMAJ_AXIS,
+    f: float = WGS84_FLATTENING,
+) -> tuple:
+    """
+    Convert geodetic coordinates (LLH) to ECEF. Vectorized equivalent
+    of llh2ecef().
+
+    :param object lat: lat array in degrees
+    :param object lon: lon array in degrees
+    :param object height: ellipsoidal height array in metres
+    :param float a: semi-major axis (6378137.0 for WGS84)
+    :param float f: flattening (298.257223563 for WGS84)
+    :return: tuple of ECEF (X, Y, Z) arrays
+    :rtype: tuple
+    :raises: ImportError (if numpy is not installed)
+    """
+
+    _check_numpy("llh2ecef_array")
+    lat, lon = [np.radians(np.asarray(c, dtype=np.float64)) for c in (lat, lon)]
+    height = np.asarray(height, dtype=np.float64)
+
+    f = 1 / f
+    e2 = f * (2 - f)
+    a2 = a**2
+    b2 = a2 * (1 - e2)
+
+    n = a / np.sqrt(1 - e2 * np.sin(lat) ** 2)
+    x = (n + height) * np.cos(lat) * np.cos(lon)
+    y = (n + height) * np.cos(lat) * np.sin(lon)
+    z = ((b2 / a2) * n + height) * np.sin(lat)
+
+    return x, y, z
@@ -0,0 +1,460 @@
+"""
+Multi-client TCP NMEA broadcaster.
+
+Reads NMEA data from a single source and broadcasts it, using
+asyncio, to any number of TCP clients as raw NMEA sentences and/or
+newline-delimited JSON-encoded parsed messages e.g.
+
+    with open("nmealog.log", "rb") as stream:
+        broadcaster = NMEABroadcaster(stream, port=50010, jsonport=50011)
+        stats = asyncio.run(broadcaster.serve())
+
+The source may be an asynchronous stream (e.g. asyncio.StreamReader
+from a socket connection) or AsyncNMEAReader, which is read in the
+event loop, or a synchronous stream (e.g. serial port or file) or
+NMEAReader, which is read in batches in a worker thread.
+
+Each message is encoded once and queued for every client. Messages
+read from a synchronous source in a single batch (i.e. those already
+buffered) are queued as a single entry. Each client has a bounded
+queue which is written to its connection by a separate task, in a
+single write for all queued entries, so a slow client does not hold
+up the source or other clients. If a
+client's queue is full, the 'policy' determines whether the newest
+message is dropped (DROPNEWEST), the oldest queued message is
+dropped (DROPOLDEST), or the client is disconnected (DISCONNECT).
+Queue depths and drops are reported in the stats property.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=protected-access
+
+import asyncio
+import json
+from pynmeagps.asyncnmeareader import AsyncNMEAReader
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEAReader
+import pynmeagps.exceptions as nme
+
+RAW = "raw"  # raw NMEA sentence output
+JSON = "json"  # JSON-encoded parsed message output
+DROPNEWEST = "dropnewest"  # drop newest message if client queue is full
+DROPOLDEST = "dropoldest"  # drop oldest queued message if client queue is full
+DISCONNECT = "disconnect"  # disconnect client if client queue is full
+POLICIES = (DROPNEWEST, DROPOLDEST, DISCONNECT)
+QUEUESIZE = 256  # default maximum entries queued per client
+LINGER = 1.0  # default time in seconds to drain client queues on close
+READSIZE = 4096  # client input read size
+BATCHSIZE = 64  # maximum messages read from a synchronous source per batch
+
+
+class _Client:
+    """
+    Connected client.
+    """
+
+    __slots__ = (
+        "writer",
+        "queue",
+        "peer",
+        "mode",
+        "task",
+        "sent",
+        "bytes",
+        "dropped",
+        "maxqueue",
+    )
+
+    def __init__(self, writer: asyncio.StreamWriter, mode: str, queuesize: int):
+        """Constructor.
+
+        :param asyncio.StreamWriter writer: client connection writer
+        :param str mode: output mode (RAW or JSON)
+        :param int queuesize: maximum messages queued
+        """
+
+        self.writer = writer
+        self.queue = asyncio.Queue(queuesize)
+        self.peer = writer.get_extra_info("peername")
+        self.mode = mode
+        self.task = None
+        self.sent = 0
+        self.bytes = 0
+        self.dropped = 0
+        self.maxqueue = 0
+
+
+class NMEABroadcaster:
+    """
+    NMEABroadcaster class.
+    """
+
+    def __init__(
+        self,
+        source,
+        host: str = "0.0.0.0",
+        port: int = None,
+        jsonport: int = None,
+        queuesize: int = QUEUESIZE,
+        policy: str = DROPOLDEST,
+        linger: float = LINGER,
+        **kwargs,
+    ):
+        """Constructor.
+
+        :param object source: asynchronous stream supporting an 'async read(n)'
+            method or AsyncNMEAReader, or synchronous stream or NMEAReader
+        :param str host: host address to listen on ("0.0.0.0")
+        :param int port: port for raw NMEA clients, 0 = any free port
+            (None = no raw output)
+        :param int jsonport: port for JSON clients, 0 = any free port
+            (None = no JSON output)
+        :param int queuesize: maximum entries queued per client, where each
+            entry is a batch of messages read from the source together (256)
+        :param str policy: action when a client's queue is full - DROPNEWEST,
+            DROPOLDEST or DISCONNECT (DROPOLDEST)
+        :param float linger: maximum time in seconds to wait for client
+            queues to drain when closing (1.0)
+        :param kwargs: keyword arguments for the NMEAReader or AsyncNMEAReader
+            created for a stream source (e.g. validate, msgmode, msgfilter)
+        :raises: NMEAParseError if no ports or invalid queue size or policy
+        """
+
+        if (port is None and jsonport is None) or queuesize < 1:
+            raise nme.NMEAParseError(
+                f"Invalid port {port}, jsonport {jsonport} or queue size {queuesize}."
+            )
+        if policy not in POLICIES:
+            raise nme.NMEAParseError(
+                f"Invalid policy {policy} - must be in {POLICIES}."
+            )
+        if isinstance(source, NMEAReader):
+            self._reader = source
+        elif asyncio.iscoroutinefunction(getattr(source, "read", None)):
+            self._reader = AsyncNMEAReader(source, **kwargs)
+        else:
+            self._reader = NMEAReader(source, **kwargs)
+        self._host = host
+        self._ports = {RAW: port, JSON: jsonport}
+        self._queuesize = queuesize
+        self._policy = policy
+        self._linger = linger
+        self._servers = {}
+        self._clients = {RAW: set(), JSON: set()}
+        self._sourcetask = None
+        self._stopping = False
+        self._messages = 0
+        self._errors = 0
+        self._connections = 0
+        self._disconnects = 0
+        self._dropped = 0
+
+    async def start(self):
+        """
+        Start listening for client connections.
+        """
+
+        for mode, port in self._ports.items():
+            if port is not None and mode not in self._servers:
+                self._servers[mode] = await asyncio.start_server(
+                    lambda r, w, m=mode: self._handle(r, w, m), self._host, port
+                )
+
+    async def serve(self) -> dict:
+        """
+        Start listening for client connections and broadcast messages
+        from the source until the source is exhausted or stop() is
+        called, then close all client connections.
+
+        :return: broadcast statistics, as for the stats property
+        :rtype: dict
+        """
+
+        await self.start()
+        self._stopping = False
+        self._sourcetask = asyncio.ensure_future(self._read_source())
+        try:
+            await self._sourcetask
+        except asyncio.CancelledError:
+            if not self._stopping:
+                raise
+        finally:
+            await self.close()
+        return self.stats
+
+    def stop(self):
+        """
+        Stop broadcasting. Must be called from the event loop thread.
+        """
+
+        self._stopping = True
+        if self._sourcetask is not None:
+            self._sourcetask.cancel()
+
+    async def close(self):
+        """
+        Wait up to 'linger' seconds for client queues to drain, then
+        close all client connections and stop listening.
+        """
+
+        clients = self._clients[RAW] | self._clients[JSON]
+        if clients:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(client.queue.join() for client in clients)),
+                    self._linger,
+                )
+            except asyncio.TimeoutError:
+                pass
+        for client in clients:
+            self._remove(client)
+        for server in self._servers.values():
+            server.close()
+            await server.wait_closed()
+        self._servers = {}
+
+    def broadcast(self, raw: bytes, parsed: object = None):
+        """
+        Queue message for all connected clients.
+
+        :param bytes raw: raw NMEA sentence
+        :param object parsed: parsed message, or None or error string
+            (None = not sent to JSON clients)
+        """
+
+        self._broadcast([raw], [parsed])
+
+    def _broadcast(self, raws: list, parseds: list):
+        """
+        Queue batch of messages for all connected clients, as a single
+        queue entry per client.
+
+        :param list raws: raw NMEA sentences
+        :param list parseds: corresponding parsed messages, or None or error strings
+        """
+
+        self._messages += len(raws)
+        if self._clients[RAW]:
+            self._queue(self._clients[RAW], b"".join(raws), len(raws))
+        if self._clients[JSON]:
+            lines = [line for line in map(_tojson, parseds) if line is not None]
+            if lines:
+                self._queue(self._clients[JSON], b"".join(lines), len(lines))
+
+    async def _read_source(self):
+        """
+        Read messages from source and broadcast them.
+        """
+
+        reader = self._reader
+        if isinstance(reader, AsyncNMEAReader):
+            async for raw, parsed in reader:
+                if raw is not None:
+                    self.broadcast(raw, parsed if self._clients[JSON] else None)
+            return
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await loop.run_in_executor(None, _read_batch, reader, BATCHSIZE)
+            if not batch:
+                break
+            self._errors += sum(isinstance(parsed, str) for _, parsed in batch)
+            self._broadcast(
+                [raw for raw, _ in batch if raw is not None],
+                [parsed for raw, parsed in batch if raw is not None],
+            )
+
+    def _queue(self, clients: set, data: bytes, num: int):
+        """
+        Queue data for clients, applying policy if a client's queue is full.
+
+        :param set clients: clients
+        :param bytes data: data
+        :param int num: number of messages in data
+        """
+
+        for client in tuple(clients):
+            queue = client.queue
+            if queue.full():
+                if self._policy == DISCONNECT:
+                    self._disconnects += 1
+                    self._remove(client)
+                    continue
+                dropped = num if self._policy == DROPNEWEST else queue.get_nowait()[1]
+                client.dropped += dropped
+                self._dropped += dropped
+                if self._policy == DROPNEWEST:
+                    continue
+                queue.task_done()
+            queue.put_nowait((data, num))
+            client.maxqueue = max(client.maxqueue, queue.qsize())
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, mode: str
+    ):
+        """
+        Handle client connection until client disconnects.
+
+        :param asyncio.StreamReader reader: client connection reader
+        :param asyncio.StreamWriter writer: client connection writer
+        :param str mode: output mode (RAW or JSON)
+        """
+
+        client = _Client(writer, mode, self._queuesize)
+        client.task = asyncio.ensure_future(self._send(client))
+        self._clients[mode].add(client)
+        self._connections += 1
+        try:
+            while await reader.read(READSIZE):  # client input is ignored
+                pass
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self._remove(client)
+
+    async def _send(self, client: _Client):
+        """
+        Write queued data to client connection, in a single write
+        per batch of queued messages.
+
+        :param _Client client: client
+        """
+
+        queue = client.queue
+        writer = client.writer
+        try:
+            while True:
+                entries = [await queue.get()]
+                while not queue.empty():
+                    entries.append(queue.get_nowait())
+                data = b"".join(entry[0] for entry in entries)
+                writer.write(data)
+                await writer.drain()
+                client.sent += sum(entry[1] for entry in entries)
+                client.bytes += len(data)
+                for _ in entries:
+                    queue.task_done()
+        except (ConnectionError, OSError):
+            self._remove(client)
+
+    def _remove(self, client: _Client):
+        """
+        Close client connection and discard any queued data.
+
+        :param _Client client: client
+        """
+
+        clients = self._clients[client.mode]
+        if client not in clients:
+            return
+        clients.discard(client)
+        if client.task is not None:
+            client.task.cancel()
+        client.writer.close()
+
+    @property
+    def addresses(self) -> dict:
+        """
+        Listening addresses getter.
+
+        :return: dict of {mode: (host, port)} for each listening port
+        :rtype: dict
+        """
+
+        return {
+            mode: server.sockets[0].getsockname()[0:2]
+            for mode, server in self._servers.items()
+        }
+
+    @property
+    def stats(self) -> dict:
+        """
+        Broadcast statistics getter.
+
+        "dropped" and "disconnects" are the total messages dropped and
+        clients disconnected because of full client queues. "clients"
+        contains the statistics of each connected client - the number
+        of entries currently queued ("queued") and the maximum ever
+        queued ("maxqueue"), and the messages and bytes sent and
+        messages dropped.
+
+        :return: dict of broadcast statistics
+        :rtype: dict
+        """
+
+        clients = [
+            {
+                "peer": client.peer,
+                "mode": client.mode,
+                "queued": client.queue.qsize(),
+                "maxqueue": client.maxqueue,
+                "sent": client.sent,
+                "bytes": client.bytes,
+                "dropped": client.dropped,
+            }
+            for mode in (RAW, JSON)
+            for client in self._clients[mode]
+        ]
+        return {
+            "messages": self._messages,
+            "errors": self._errors,
+            "connections": self._connections,
+            "disconnects": self._disconnects,
+            "dropped": self._dropped,
+            "clients": clients,
+        }
+
+
+def _read_batch(reader: NMEAReader, maxsize: int) -> list:
+    """
+    Read the next message from a synchronous reader, waiting for it if
+    necessary, plus any further messages already in the reader's buffer.
+    The reader's own msgfilter and parsing options are applied.
+
+    :param NMEAReader reader: reader
+    :param int maxsize: maximum number of messages
+    :return: list of (raw_data, parsed_data) tuples (empty if source is exhausted)
+    :rtype: list
+    """
+
+    item = reader.read()
+    if item == (None, None):
+        return []
+    batch = [item]
+    while len(batch) < maxsize:
+        item = reader.read_buffered()
+        if item == (None, None):
+            break
+        batch.append(item)
+    return batch
+
+
+def _tojson(parsed: object) -> bytes:
+    """
+    Encode parsed message as a line of JSON.
+
+    :param object parsed: NMEAMessage or CompactNMEAMessage
+    :return: JSON object of message identity and attributes, terminated
+        by a newline, or None if parsed is not a message
+    :rtype: bytes
+    """
+
+    if isinstance(parsed, NMEAMessage):
+        parsed._decode_all()
+        atts = {att: val for att, val in vars(parsed).items() if att[0] != "_"}
+    elif hasattr(parsed, "_attrs"):  # CompactNMEAMessage
+        atts = {}
+        for att in parsed._attrs:
+            try:
+                atts[att] = getattr(parsed, att)
+            except AttributeError:  # beyond end of payload
+                pass
+    else:
+        return None
+    return (
+        json.dumps({"identity": parsed.identity, **atts}, default=str) + "\n"
+    ).encode("utf-8")
@@ -0,0 +1,183 @@
+"""
+Bulk NMEA log file parser.
+
+Parses large NMEA log files in parallel across multiple worker
+processes. The file is split into chunks at sentence boundaries
+(a "$" header immediately following a CRLF terminator), each chunk
+is read and parsed by an NMEAReader in a worker process, and the
+results are yielded either in original file order or in order of
+completion e.g.
+
+    for raw, parsed in parse_file("nmealog.log", workers=4):
+        ...
+
+Each chunk is parsed independently, so stream-level conditions
+which would normally end an NMEAReader iteration (e.g. a sentence
+which is not CRLF terminated) only end the iteration of that chunk.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from io import BytesIO
+from pynmeagps.nmeareader import NMEAReader
+
+CHUNKSIZE = 4194304  # default target chunk size in bytes
+SCANSIZE = 65536  # sentence boundary scan read size in bytes
+
+
+def parse_file(path: str, workers: int = None, ordered: bool = True, **kwargs):
+    """
+    Parse NMEA log file in parallel, yielding the same (raw_data,
+    parsed_data) tuples as iterating an NMEAReader over the file.
+
+    The results of each chunk are returned from the worker process
+    in a single batch. If a 'func' is specified, it is applied to
+    each (raw_data, parsed_data) tuple within the worker process and
+    its return value is yielded instead. Reducing each message to
+    the values actually required in this way (e.g. time, lat, lon)
+    substantially reduces interprocess overheads.
+
+    Any other keyword arguments (e.g. validate, msgmode, msgfilter,
+    quitonerror) are passed to each worker's NMEAReader. Any 'func'
+    or 'errorhandler' must be picklable (e.g. a module level function).
+
+    :param str path: path to NMEA log file
+    :param int workers: number of worker processes, or 1 to parse
+        in the current process (None = available_cpus())
+    :param bool ordered: True = yield results in file order,
+        False = yield results in order of chunk completion (True)
+    :param int chunksize: (kwarg) target chunk size in bytes (4194304)
+    :param object func: (kwarg) function applied to each
+        (raw_data, parsed_data) tuple in the worker process (None)
+    :return: generator of (raw_data, parsed_data) tuples, or func return values
+    :rtype: generator
+    """
+
+    chunksize = kwargs.pop("chunksize", CHUNKSIZE)
+    func = kwargs.pop("func", None)
+    chunks = iter(split_file(path, chunksize))
+    workers = available_cpus() if workers is None else workers
+
+    if workers <= 1:
+        for start, end in chunks:
+            yield from _parse_chunk(path, start, end, func, kwargs)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+
+        def submit(chunk: tuple):
+            return executor.submit(_parse_chunk, path, *chunk, func, kwargs)
+
+        # limit chunks in flight to bound memory usage
+        pending = deque(submit(chunk) for _, chunk in zip(range(workers * 2), chunks))
+        try:
+            while pending:
+                if ordered:
+                    done = [pending.popleft()]
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                for future in done:
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        pending.append(submit(chunk))
+                    yield from future.result()
+        finally:  # generator closed early or error raised
+            for future in pending:
+                future.cancel()
+
+
+def available_cpus() -> int:
+    """
+    Get number of CPUs available to this process, which may be fewer
+    than os.cpu_count() (e.g. in a container or with CPU affinity set).
+    Using more worker processes than this only adds process pool overhead.
+
+    :return: number of available CPUs
+    :rtype: int
+    """
+
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on Windows or MacOS
+        return os.cpu_count() or 1
+
+
+def split_file(path: str, chunksize: int = CHUNKSIZE) -> list:
+    """
+    Split NMEA log file into chunks of approximately chunksize
+    bytes, each starting at a sentence boundary.
+
+    :param str path: path to NMEA log file
+    :param int chunksize: target chunk size in bytes (4194304)
+    :return: list of (start, end) byte offsets
+    :rtype: list
+    """
+
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, "rb") as stream:
+        pos = max(chunksize, 2)
+        while pos < size:
+            pos = _next_boundary(stream, pos)
+            if pos is None:
+                break
+            bounds.append(pos)
+            pos += max(chunksize, 2)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def _next_boundary(stream, pos: int) -> int:
+    """
+    Find offset of the first sentence header ("$" following CRLF)
+    at or after pos.
+
+    :param stream stream: binary file stream
+    :param int pos: offset to scan from (must be >= 2)
+    :return: offset of sentence header, or None if not found
+    :rtype: int
+    """
+
+    base = pos - 2  # allow for CRLF immediately preceding pos
+    stream.seek(base)
+    data = stream.read(SCANSIZE)
+    while True:
+        idx = data.find(b"\r\n$")
+        if idx != -1:
+            return base + idx + 2
+        chunk = stream.read(SCANSIZE)
+        if not chunk:
+            return None
+        base += len(data) - 2
+        data = data[-2:] + chunk
+
+
+def _parse_chunk(path: str, start: int, end: int, func: object, kwargs: dict) -> list:
+    """
+    Read and parse chunk of NMEA log file.
+
+    :param str path: path to NMEA log file
+    :param int start: chunk start offset
+    :param int end: chunk end offset
+    :param object func: function applied to each (raw_data, parsed_data) tuple, or None
+    :param dict kwargs: NMEAReader keyword arguments
+    :return: list of (raw_data, parsed_data) tuples, or func return values
+    :rtype: list
+    """
+
+    with open(path, "rb") as stream:
+        stream.seek(start)
+        data = stream.read(end - start)
+    nmr = NMEAReader(BytesIO(data), **kwargs)
+    if func is None:
+        return list(nmr)
+    return [func(raw_data, parsed_data) for raw_data, parsed_data in nmr]
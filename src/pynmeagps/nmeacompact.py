@@ -0,0 +1,280 @@
+"""
+Compact NMEA message classes.
+
+NMEAMessage stores its attributes in a per-instance dictionary,
+alongside the payload as a list of strings. For applications which
+hold very large numbers of parsed messages in memory, this module
+generates one compact, immutable class per payload definition (e.g.
+"NMEAGGA", "NMEAPUBX00"), created on first use. Each class stores its
+attributes in __slots__ rather than an instance dictionary, repeating
+groups as a single named tuple of member value tuples (as for
+NMEAMessage with groups=True) and the payload as a single string.
+
+Compact messages provide the same public API as NMEAMessage (attribute
+access, including legacy suffixed repeating group attribute names,
+identity, talker, msgID, msgmode, payload, checksum, serialize() and
+str()), and are returned by NMEAReader if compact=True e.g.
+
+    for raw, parsed in NMEAReader(stream, compact=True):
+        ...
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=protected-access, invalid-name
+
+from sys import intern
+from pynmeagps.nmeahelpers import xor_checksum
+from pynmeagps.nmeamessage import NMEAMessage, _check_ids, compile_group_plan
+from pynmeagps.nmeatypes_core import PROP_MSGIDS
+import pynmeagps.exceptions as nme
+
+# generated compact message classes, keyed on (msgID, msgmode, proprietary msgId)
+_CLASSES = {}
+
+
+class CompactNMEAMessage:
+    """
+    CompactNMEAMessage class.
+
+    Base class of the compact message classes generated for each payload
+    definition. Use compact_message() or NMEAReader.parse(compact=True)
+    to create instances.
+    """
+
+    __slots__ = ("_talker", "_msgID", "_mode", "_payload")
+
+    _plan = ()  # compiled grouped payload plan
+    _groups = {}  # mapping of group member name to group key
+    _attrs = ()  # public attribute names in payload order
+
+    # public API shared with NMEAMessage
+    identity = NMEAMessage.identity
+    talker = NMEAMessage.talker
+    msgID = NMEAMessage.msgID
+    msgmode = NMEAMessage.msgmode
+    str2val = staticmethod(NMEAMessage.str2val)
+    val2str = staticmethod(NMEAMessage.val2str)
+    nomval = staticmethod(NMEAMessage.nomval)
+
+    # payload parsing shared with NMEAMessage
+    _get_dict = NMEAMessage._get_dict
+    _parse_plan = NMEAMessage._parse_plan
+    _parse_items = NMEAMessage._parse_items
+    _calc_num_repeats = NMEAMessage._calc_num_repeats
+    _sign_latlon = NMEAMessage._sign_latlon
+    _group_value = NMEAMessage._group_value
+
+    def __init__(self, talker: str, msgID: str, msgmode: int, payload: list):
+        """Constructor.
+
+        :param str talker: message talker e.g. "GP" or "P"
+        :param str msgID: message ID e.g. "GGA"
+        :param int msgmode: mode (0=GET, 1=SET, 2=POLL)
+        :param list payload: message content as list of string values
+        :raises: NMEATypeError
+        """
+
+        # bypass immutability check during initialisation
+        setatt = object.__setattr__
+        setatt(self, "_talker", talker)
+        setatt(self, "_msgID", msgID)
+        setatt(self, "_mode", msgmode)
+        setatt(self, "_payload", payload)
+        attrs = {}
+        self._parse_plan(self._plan, 0, attrs)
+        self._sign_latlon(attrs)
+        for name, val in attrs.items():
+            setatt(self, name, val)
+        setatt(self, "_payload", ",".join(payload))
+
+    def __getattr__(self, name: str) -> object:
+        """
+        Get legacy suffixed repeating group attribute (e.g. 'svid_01').
+
+        Only invoked if attribute has not been set.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError if attribute is not present
+        """
+
+        return self._group_value(self._groups, name)
+
+    def __setattr__(self, name, value):
+        """
+        Override setattr to make object immutable.
+
+        :param str name: attribute name
+        :param object value: attribute value
+        :raises: NMEAMessageError
+        """
+
+        raise nme.NMEAMessageError(
+            f"Object is immutable. Updates to {name} not permitted after initialisation."
+        )
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle support - generated classes are recreated on unpickling.
+
+        :return: tuple of (callable, args)
+        :rtype: tuple
+        """
+
+        return (compact_message, (self._talker, self._msgID, self._mode, self.payload))
+
+    def __str__(self) -> str:
+        """
+        Human readable representation, with repeating group members
+        shown as legacy suffixed attributes (e.g. 'svid_01'), as
+        for NMEAMessage.
+
+        :return: human readable representation
+        :rtype: str
+        """
+
+        gkeys = self._groups.values()
+        atts = []
+        for att in self._attrs:
+            try:
+                val = object.__getattribute__(self, att)
+            except AttributeError:  # beyond end of payload
+                continue
+            if att in gkeys:
+                for i, item in enumerate(zip(*val), 1):
+                    atts.extend(
+                        f"{name}_{i:02d}={mval}"
+                        for name, mval in zip(val._fields, item)
+                    )
+            else:
+                atts.append(f"{att}={val}")
+        return f"<NMEA({self.identity}, " + ", ".join(atts) + ")>"
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        eval(repr(obj)) = equivalent NMEAMessage
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return (
+            f"NMEAMessage('{self._talker}','{self._msgID}', "
+            f"{self._mode}, payload={self.payload})"
+        )
+
+    def serialize(self) -> bytes:
+        """
+        Serialize message.
+
+        :return: serialized output
+        :rtype: bytes
+        """
+
+        content = self._content()
+        cksum = xor_checksum(content.encode("utf-8"))
+        return f"${content}*{cksum}\r\n".encode("utf-8")
+
+    def _content(self) -> str:
+        """
+        Get message content (everything between "$" and "*").
+
+        :return: message content e.g. "GNGLL,5327.04319,S,..."
+        :rtype: str
+        """
+
+        return f"{self._talker}{self._msgID},{self._payload}"
+
+    @property
+    def payload(self) -> list:
+        """
+        Payload getter.
+
+        :return: raw payload as list
+        :rtype: list
+        """
+
+        return self._payload.split(",") if self._payload else []
+
+    @property
+    def checksum(self) -> str:
+        """
+        Checksum getter.
+
+        :return: checksum as hex string
+        :rtype: str
+        """
+
+        return xor_checksum(self._content().encode("utf-8"))
+
+
+def compact_class(msgID: str, msgmode: int, payload: list) -> type:
+    """
+    Get compact message class for message ID, creating it from the
+    payload definition on first use.
+
+    :param str msgID: message ID e.g. "GGA"
+    :param int msgmode: mode (0=GET, 1=SET, 2=POLL)
+    :param list payload: message content (first element is msgId
+        for proprietary message IDs e.g. PUBX)
+    :return: compact message class
+    :rtype: type
+    :raises: NMEAMessageError if message ID is unknown
+    """
+
+    msgId = payload[0] if msgID in PROP_MSGIDS and payload else None
+    cls = _CLASSES.get((msgID, msgmode, msgId), None)
+    if cls is not None:
+        return cls
+
+    # use an uninitialised instance to look up payload definition
+    probe = CompactNMEAMessage.__new__(CompactNMEAMessage)
+    for att, val in (("_msgID", msgID), ("_mode", msgmode), ("_payload", payload)):
+        object.__setattr__(probe, att, val)
+    pdict = probe._get_dict(payload=payload)
+    plan, groups = compile_group_plan(pdict)
+    attrs = tuple(step[1] for step in plan)
+    name = f"NMEA{msgID}{msgId or ''}{('', '_SET', '_POLL')[msgmode]}"
+    cls = type(
+        name,
+        (CompactNMEAMessage,),
+        {
+            "__slots__": attrs,
+            "__doc__": f"Compact {msgID}{msgId or ''} message class.",
+            "__module__": __name__,
+            "_plan": plan,
+            "_groups": groups,
+            "_attrs": attrs,
+        },
+    )
+    _CLASSES[(msgID, msgmode, msgId)] = cls
+    return cls
+
+
+def compact_message(
+    talker: str, msgID: str, msgmode: int, payload: list
+) -> CompactNMEAMessage:
+    """
+    Create compact message from parsed payload.
+
+    :param str talker: message talker e.g. "GP" or "P"
+    :param str msgID: message ID e.g. "GGA"
+    :param int msgmode: mode (0=GET, 1=SET, 2=POLL)
+    :param list payload: message content as list of string values
+    :return: compact message
+    :rtype: CompactNMEAMessage
+    :raises: NMEAMessageError, NMEATypeError
+    """
+
+    _check_ids(talker, msgID, msgmode)
+    # share talker and msgID strings between messages
+    talker, msgID = intern(talker), intern(msgID)
+    return compact_class(msgID, msgmode, payload)(talker, msgID, msgmode, payload)
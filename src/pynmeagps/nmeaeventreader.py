@@ -0,0 +1,254 @@
+"""
+Event-driven NMEA reader.
+
+Drives an NMEAReader without busy-waiting on the stream's
+'in_waiting' attribute. Reads block until a complete sentence is
+available, the timeout expires or a stop event is set, e.g.
+
+    stopevent = Event()
+    nmr = NMEAEventReader(serial, timeout=1, stopevent=stopevent)
+    for raw, parsed in nmr:  # until stopevent is set or stream ends
+        print(parsed)
+
+The stream is waited on using a selector (select/poll/epoll) where
+it supports fileno() (e.g. Serial on Linux and MacOS, sockets,
+pipes), otherwise by checking 'in_waiting' at 'pollinterval'
+second intervals (e.g. Serial on Windows). Other streams (e.g.
+regular files, BytesIO) are always treated as readable.
+
+NB: NMEAReader buffers the stream internally, so the stream should
+not be wrapped in a BufferedReader - data held in the wrapper's buffer
+is not visible to the selector.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+import selectors
+from threading import Event
+from time import perf_counter
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEAReader
+
+POLLINTERVAL = 0.01  # seconds between in_waiting checks if stream is not selectable
+STOPCHECK = 0.1  # maximum seconds between stop event checks
+WAITSELECT = "select"
+WAITPOLL = "poll"
+WAITREADY = "ready"
+
+
+class NMEAEventReader:
+    """
+    NMEAEventReader class.
+    """
+
+    def __init__(
+        self,
+        stream,
+        timeout: float = None,
+        stopevent: Event = None,
+        pollinterval: float = POLLINTERVAL,
+        **kwargs,
+    ):
+        """Constructor.
+
+        :param stream stream: input data stream (e.g. Serial, socket or pipe)
+        :param float timeout: maximum time in seconds read() waits for a
+            sentence (None = wait until stopped or stream ends)
+        :param Event stopevent: threading.Event which stops reading when set
+            (None = create one, set by stop())
+        :param float pollinterval: seconds between in_waiting checks if stream
+            does not support fileno() (0.01)
+        :param kwargs: keyword arguments for the underlying NMEAReader
+            e.g. msgmode, quitonerror, msgfilter
+        :raises: NMEAParseError (if mode is invalid)
+        """
+
+        self._reader = NMEAReader(stream, **kwargs)
+        self._stream = stream
+        self._timeout = timeout
+        self._stopevent = Event() if stopevent is None else stopevent
+        self._pollinterval = pollinterval
+        self._item = None  # sentence read by wait() but not yet returned
+        self._eof = False
+        self._selector = None
+        self._mode = WAITREADY
+        selector = selectors.DefaultSelector()
+        try:
+            selector.register(stream, selectors.EVENT_READ)
+            self._selector = selector
+            self._mode = WAITSELECT
+        except (AttributeError, OSError, ValueError):  # e.g. no fileno
+            selector.close()
+        if self._mode == WAITREADY and hasattr(stream, "in_waiting"):
+            self._mode = WAITPOLL
+
+    def __enter__(self):
+        """
+        Context manager enter routine.
+        """
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        """
+        Context manager exit routine.
+        """
+
+        self.close()
+
+    def __iter__(self):
+        """Iterator."""
+
+        return self
+
+    def __next__(self) -> (bytes, NMEAMessage):
+        """
+        Return next item in iteration, waiting for as long as
+        necessary (read timeouts are ignored).
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
+        :rtype: tuple
+        :raises: StopIteration (when stopped or stream ends)
+        """
+
+        while True:
+            item = self.read()
+            if item != (None, None):
+                return item
+            if self._eof or self._stopevent.is_set():
+                raise StopIteration
+
+    def read(self) -> (bytes, NMEAMessage):
+        """
+        Wait for and read the next NMEA sentence.
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage),
+            or (None, None) on timeout, stop or end of stream
+        :rtype: tuple
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        if not self.wait():
+            return (None, None)
+        item = self._item
+        self._item = None
+        return item
+
+    def wait(self) -> bool:
+        """
+        Wait until a complete NMEA sentence has been read from
+        the stream, the timeout expires, reading is stopped or
+        the stream ends.
+
+        :return: True if a sentence is available to read(), otherwise False
+        :rtype: bool
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        if self._item is not None:
+            return True
+        reader = self._reader
+        stopevent = self._stopevent
+        timeout = self._timeout
+        deadline = None if timeout is None else perf_counter() + timeout
+        while True:
+            item = reader.read_buffered()
+            if item != (None, None):
+                self._item = item
+                return True
+            if self._eof or stopevent.is_set():
+                return False
+            remaining = STOPCHECK
+            if deadline is not None:
+                remaining = min(remaining, deadline - perf_counter())
+                if remaining <= 0:
+                    return False
+            if self._ready(remaining) and not reader.fill():
+                self._eof = True
+
+    def _ready(self, timeout: float) -> bool:
+        """
+        Wait up to timeout seconds for stream to become readable.
+
+        :param float timeout: timeout in seconds
+        :return: True if stream is readable, otherwise False
+        :rtype: bool
+        """
+
+        if self._mode == WAITSELECT:
+            return bool(self._selector.select(timeout))
+        if self._mode == WAITPOLL:
+            if self._stream.in_waiting:
+                return True
+            self._stopevent.wait(min(timeout, self._pollinterval))
+            return False
+        return True
+
+    def stop(self):
+        """
+        Stop reading (e.g. from another thread). Any wait in progress
+        returns within 0.1 seconds.
+        """
+
+        self._stopevent.set()
+
+    def close(self):
+        """
+        Stop reading and release the selector. The stream
+        itself is not closed.
+        """
+
+        self.stop()
+        if self._selector is not None:
+            self._selector.close()
+            self._selector = None
+            self._mode = WAITREADY
+
+    @property
+    def reader(self) -> NMEAReader:
+        """
+        Underlying NMEAReader getter (e.g. for its stats property).
+
+        :return: NMEAReader
+        :rtype: NMEAReader
+        """
+
+        return self._reader
+
+    @property
+    def mode(self) -> str:
+        """
+        Wait mode getter - "select" (selector), "poll" (in_waiting
+        checks) or "ready" (stream always treated as readable).
+
+        :return: wait mode
+        :rtype: str
+        """
+
+        return self._mode
+
+    @property
+    def eof(self) -> bool:
+        """
+        End of stream getter.
+
+        :return: True if stream has ended, otherwise False
+        :rtype: bool
+        """
+
+        return self._eof
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Stopped getter.
+
+        :return: True if stop event is set, otherwise False
+        :rtype: bool
+        """
+
+        return self._stopevent.is_set()
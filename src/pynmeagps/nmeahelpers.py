@@ -10,7 +10,8 @@ Created on 04 Mar 2021
 """
 # pylint: disable=invalid-name
 
-from datetime import datetime
+from datetime import datetime, date, time
+from functools import lru_cache
 from math import sqrt, sin, cos, asin, acos, atan2, pi
 from pynmeagps.nmeatypes_core import (
     NMEA_MSGIDS,
@@ -27,6 +28,8 @@ from pynmeagps.nmeatypes_core import (
 import pynmeagps.exceptions as nme
 
 KNOTSCONV = {"MS": 0.5144447324, "FS": 1.68781084, "MPH": 1.15078, "KMPH": 1.852001}
+DTCACHESIZE = 32  # number of recent time2utc and date2utc results cached
+XORMASKS = tuple((shift, (1 << shift) - 1) for shift in (256, 128, 64, 32, 16, 8))
 
 
 def int2hexstr(val: int) -> str:
@@ -51,10 +54,36 @@ def get_parts(message: object) -> tuple:
     :raises: NMEAMessageError (if message is badly formed)
     """
 
+    return get_parts_cksum(message)[0:4]
+
+
+def get_parts_cksum(message: object) -> tuple:
+    """
+    Get talker, msgid, payload, checksum and calculated checksum
+    of raw NMEA message in a single pass.
+
+    :param object message: entire message as bytes, bytes-like object or string
+    :return: tuple of (talker as str, msgID as str, payload as list,
+        checksum as str, calculated checksum as str)
+    :rtype: tuple
+    :raises: NMEAMessageError (if message is badly formed)
+    """
+
     try:
-        if isinstance(message, bytes):
-            message = message.decode("utf-8")
-        content, cksum = message.strip("$\r\n").split("*", 1)
+        if isinstance(message, memoryview):  # decode and checksum in place
+            text = str(message, "utf-8")
+            stripped = text.lstrip("$\r\n")
+            start = len(text) - len(stripped)
+            content, cksum = stripped.rstrip("$\r\n").split("*", 1)
+            if len(text) == message.nbytes:  # ASCII, char offsets = byte offsets
+                calc = xor_checksum(message[start : start + len(content)])
+            else:
+                calc = xor_checksum(content.encode("utf-8"))
+        else:
+            content, cksum = _to_bytes(message).strip(b"$\r\n").split(b"*", 1)
+            calc = xor_checksum(content)
+            content = content.decode("utf-8")
+            cksum = cksum.decode("utf-8")
         hdr, payload = content.split(",", 1)
         payload = payload.split(",")
         if hdr[0:1] == "P":  # proprietary
@@ -63,8 +92,10 @@ def get_parts(message: object) -> tuple:
         else:  # standard
             talker = hdr[0:2]
             msgid = hdr[2:]
-        return talker, msgid, payload, cksum
+        return talker, msgid, payload, cksum, calc
     except Exception as err:
+        if not isinstance(message, str):
+            message = bytes(message).decode("utf-8", "replace")
         raise nme.NMEAMessageError(f"Badly formed message {message}") from err
 
 
@@ -83,6 +114,46 @@ def get_content(message: object) -> str:
     return content
 
 
+def _to_bytes(message: object) -> bytes:
+    """
+    Convert message to bytes.
+
+    :param object message: message as bytes, bytes-like object or string
+    :return: message as bytes
+    :rtype: bytes
+    """
+
+    if isinstance(message, bytes):
+        return message
+    if isinstance(message, str):
+        return message.encode("utf-8")
+    return bytes(message)  # e.g. bytearray, memoryview
+
+
+def xor_checksum(content: bytes) -> str:
+    """
+    Calculate NMEA checksum (XOR of all bytes) of message content.
+
+    The content is folded in halves as a single integer rather than
+    iterated byte by byte; the XOR of all bytes is unchanged by each fold.
+
+    :param bytes content: message content (everything between "$" and "*")
+        as bytes or bytes-like object
+    :return: checksum as hex string
+    :rtype: str
+    """
+
+    size = len(content)
+    val = int.from_bytes(content, "big")
+    while size > 32:
+        size = (size + 1) >> 1
+        shift = size << 3
+        val = (val >> shift) ^ (val & ((1 << shift) - 1))
+    for shift, mask in XORMASKS:
+        val = (val >> shift) ^ (val & mask)
+    return int2hexstr(val)
+
+
 def list2csv(payload: list) -> str:
     """
     Convert list of strings to single string of comma separated values.
@@ -92,7 +163,10 @@ def list2csv(payload: list) -> str:
     :rtype: str
     """
 
-    return ",".join(map(str, payload))
+    try:
+        return ",".join(payload)
+    except TypeError:  # payload includes non-string values
+        return ",".join(map(str, payload))
 
 
 def calc_checksum(message: object) -> str:
@@ -104,11 +178,8 @@ def calc_checksum(message: object) -> str:
     :rtype: str
     """
 
-    content = get_content(message)
-    cksum = 0
-    for sub in content:
-        cksum ^= ord(sub)
-    return int2hexstr(cksum)
+    content, _ = _to_bytes(message).strip(b"$\r\n").split(b"*", 1)
+    return xor_checksum(content)
 
 
 def isvalid_cksum(message: object) -> bool:
@@ -120,8 +191,8 @@ def isvalid_cksum(message: object) -> bool:
     :rtype: bool
     """
 
-    _, _, _, cksum = get_parts(message)
-    return cksum == calc_checksum(message)
+    _, _, _, cksum, calc = get_parts_cksum(message)
+    return cksum == calc
 
 
 def dmm2ddd(pos: str, att: str) -> float:
@@ -185,6 +256,9 @@ def date2utc(dates: str, form: str = DT) -> datetime.date:
     """
     Convert NMEA Date to UTC datetime.
 
+    Consecutive sentences typically share the same date, so
+    recent results are cached.
+
     :param str dates: NMEA date
     :param str form: date format DT = ddmmyy, DM = mmddyy (DT)
     :return: UTC date YYyy:mm:dd
@@ -192,6 +266,33 @@ def date2utc(dates: str, form: str = DT) -> datetime.date:
     """
 
     try:
+        return _date2utc(dates, form)
+    except TypeError:  # unhashable
+        return ""
+
+
+@lru_cache(maxsize=DTCACHESIZE)
+def _date2utc(dates: str, form: str) -> datetime.date:
+    """
+    Convert NMEA Date to UTC datetime, decoding fixed width
+    ddmmyy or mmddyy strings directly and falling back to
+    strptime for anything else.
+
+    :param str dates: NMEA date
+    :param str form: date format DT = ddmmyy, DM = mmddyy
+    :return: UTC date YYyy:mm:dd
+    :rtype: datetime.date
+    """
+
+    try:
+        if len(dates) == 6 and dates.isdigit():
+            if form == DM:
+                mth, day = int(dates[0:2]), int(dates[2:4])
+            else:
+                day, mth = int(dates[0:2]), int(dates[2:4])
+            year = int(dates[4:6])
+            year += 1900 if year >= 69 else 2000  # as per strptime %y
+            return date(year, mth, day)
         dform = "%m%d%y" if form == DM else "%d%m%y"
         utc = datetime.strptime(dates, dform)
         return utc.date()
@@ -203,13 +304,46 @@ def time2utc(times: str) -> datetime.time:
     """
     Convert NMEA Time to UTC datetime.
 
+    Consecutive sentences in the same navigation epoch typically
+    share the same timestamp, so recent results are cached.
+
+    :param str times: NMEA time hhmmss.ss
+    :return: UTC time hh:mm:ss.ss
+    :rtype: datetime.time
+    """
+
+    try:
+        return _time2utc(times)
+    except TypeError:  # unhashable
+        return ""
+
+
+@lru_cache(maxsize=DTCACHESIZE)
+def _time2utc(times: str) -> datetime.time:
+    """
+    Convert NMEA Time to UTC datetime, decoding fixed width
+    hhmmss or hhmmss.s(sssss) strings directly and falling back
+    to strptime for anything else.
+
     :param str times: NMEA time hhmmss.ss
     :return: UTC time hh:mm:ss.ss
     :rtype: datetime.time
     """
 
     try:
-        if len(times) == 6:  # decimal seconds is omitted
+        if times == "":
+            return ""
+        tlen = len(times)
+        if times[0:6].isdigit() and (
+            tlen == 6 or (7 < tlen < 14 and times[6] == "." and times[7:].isdigit())
+        ):
+            return time(
+                int(times[0:2]),
+                int(times[2:4]),
+                int(times[4:6]),
+                int(times[7:].ljust(6, "0")) if tlen > 6 else 0,
+            )
+        if tlen == 6:  # decimal seconds is omitted
             times = times + ".00"
         utc = datetime.strptime(times, "%H%M%S.%f")
         return utc.time()
@@ -10,7 +10,9 @@ Created on 04 Mar 2021
 # pylint: disable=invalid-name
 
 import struct
+from collections import namedtuple
 from datetime import datetime, timezone
+from functools import partial
 import pynmeagps.exceptions as nme
 import pynmeagps.nmeatypes_core as nmt
 import pynmeagps.nmeatypes_get as nmg
@@ -24,9 +26,218 @@ from pynmeagps.nmeahelpers import (
     dmm2ddd,
     ddd2dmm,
     list2csv,
-    calc_checksum,
+    xor_checksum,
 )
 
+# plan step types
+_SINGLE = 0  # single attribute (including fixed repeating group members)
+_GROUP = 1  # variable length repeating group
+_ITEMS = 2  # repeating group retained as named tuple of member value tuples
+
+# compiled payload plans, keyed on id of (static) payload definition dict
+_PLANS = {}
+# compiled grouped payload plans and group member names, keyed on id of payload definition dict
+_GPLANS = {}
+# named tuple types for repeating groups, keyed on (group key, member names)
+_ITEMTYPES = {}
+# lazy attribute index for plans without variable length groups, keyed on id of plan
+_INDEXES = {}
+# string to typed value conversion functions, keyed on attribute type
+_CONVERTERS = {}
+
+
+def compile_plan(pdict: dict, suffix: str = "", gkey: str = None) -> tuple:
+    """
+    Compile payload definition dictionary into a flat tuple of plan steps.
+
+    Single attributes compile to (_SINGLE, key, suffixed key, type, converter).
+    Fixed length repeating groups are fully expanded into single attribute
+    steps with group index suffixes (e.g. 'svid_01') resolved. Variable length
+    repeating groups compile to (_GROUP, key, numr, group dict, suffix, expansions),
+    where expansions is a cache of the expanded plan for each number of repeats.
+
+    :param dict pdict: payload definition dictionary
+    :param str suffix: group index suffix for (nested) group members
+    :param str gkey: key of enclosing top-level repeating group
+    :return: compiled plan
+    :rtype: tuple
+    """
+
+    plan = []
+    for key, att in pdict.items():
+        pkey = key if gkey is None else gkey  # key reported in any error
+        if isinstance(att, tuple):  # repeating group of attributes
+            numr, attd = att
+            if isinstance(numr, int):  # fixed number of repeats
+                for i in range(numr):
+                    plan.extend(compile_plan(attd, f"{suffix}_{i + 1:02d}", pkey))
+            else:
+                plan.append((_GROUP, pkey, numr, attd, suffix, {}))
+        else:  # single attribute
+            plan.append((_SINGLE, pkey, key + suffix, att, _converter(att)))
+    return tuple(plan)
+
+
+def compile_group_plan(pdict: dict) -> tuple:
+    """
+    Compile payload definition dictionary into a flat tuple of plan steps,
+    retaining each repeating group (fixed or variable length) as a single
+    (_ITEMS, key, numr, group dict, group type, converters) step, where group
+    type is a named tuple type with a field for each group member.
+
+    :param dict pdict: payload definition dictionary
+    :return: tuple of (compiled plan, dict mapping group member name to group key)
+    :rtype: tuple
+    """
+
+    plan = []
+    members = {}
+    for key, att in pdict.items():
+        if isinstance(att, tuple):  # repeating group of attributes
+            numr, attd = att
+            names = tuple(attd)
+            convs = tuple(_converter(attd[name]) for name in names)
+            plan.append((_ITEMS, key, numr, attd, group_type(key, names), convs))
+            members.update(dict.fromkeys(names, key))
+        else:  # single attribute
+            plan.append((_SINGLE, key, key, att, _converter(att)))
+    return tuple(plan), members
+
+
+def group_type(gkey: str, names: tuple) -> type:
+    """
+    Get named tuple type for repeating group, creating it on first use.
+
+    :param str gkey: repeating group key e.g. 'group_sv'
+    :param tuple names: group member names e.g. ('svid', 'elv', 'az', 'cno')
+    :return: named tuple type
+    :rtype: type
+    """
+
+    itype = _ITEMTYPES.get((gkey, names), None)
+    if itype is None:
+        itype = namedtuple(gkey, names)
+        # group types are created dynamically, so pickle by group key and member names
+        itype.__reduce__ = lambda self: (_group_values, (gkey, names, tuple(self)))
+        _ITEMTYPES[(gkey, names)] = itype
+    return itype
+
+
+def _group_values(gkey: str, names: tuple, values: tuple) -> tuple:
+    """
+    Recreate repeating group values (used when unpickling).
+
+    :param str gkey: repeating group key
+    :param tuple names: group member names
+    :param tuple values: tuple of values for each group member
+    :return: named tuple
+    :rtype: tuple
+    """
+
+    return group_type(gkey, names)._make(values)
+
+
+def _group_plan(step: tuple, rng: int) -> tuple:
+    """
+    Get compiled plan for variable length repeating group with
+    specified number of repeats.
+
+    :param tuple step: group plan step
+    :param int rng: number of repeats
+    :return: compiled plan
+    :rtype: tuple
+    """
+
+    _, pkey, _, attd, suffix, gplans = step
+    plan = gplans.get(rng, None)
+    if plan is None:
+        plan = []
+        for i in range(rng):
+            plan.extend(compile_plan(attd, f"{suffix}_{i + 1:02d}", pkey))
+        plan = gplans[rng] = tuple(plan)
+    return plan
+
+
+def _check_ids(talker: str, msgID: str, msgmode: int):
+    """
+    Check message talker, msgID and mode are valid.
+
+    :param str talker: message talker e.g. "GP" or "P"
+    :param str msgID: message ID e.g. "GGA"
+    :param int msgmode: mode (0=GET, 1=SET, 2=POLL)
+    :raises: NMEAMessageError
+    """
+
+    if msgmode not in (0, 1, 2):
+        raise nme.NMEAMessageError(f"Invalid msgmode {msgmode} - must be 0, 1 or 2.")
+    if talker not in nmt.NMEA_TALKERS:
+        raise nme.NMEAMessageError(f"Unknown talker {talker}.")
+    if (
+        msgID not in (nmt.NMEA_MSGIDS)
+        and msgID not in (nmt.NMEA_MSGIDS_PROP)
+        and msgID not in (nmt.PROP_MSGIDS)
+    ):
+        raise nme.NMEAMessageError(
+            f"Unknown msgID {talker}{msgID}, msgmode {('GET','SET','POLL')[msgmode]}."
+        )
+
+
+def _to_float(vals: str) -> object:
+    """
+    Convert NMEA string to float.
+
+    :param str vals: NMEA string
+    :return: float, or "" if empty
+    :rtype: object
+    """
+
+    return vals if vals == "" else float(vals)
+
+
+def _to_int(vals: str) -> object:
+    """
+    Convert NMEA string to int.
+
+    :param str vals: NMEA string
+    :return: int, or "" if empty
+    :rtype: object
+    """
+
+    return vals if vals == "" else int(vals)
+
+
+def _converter(att: str) -> object:
+    """
+    Get function to convert NMEA string to typed value
+    for specified attribute type.
+
+    :param str att: attribute type e.g. 'DE'
+    :return: conversion function, or None if no conversion required
+    :rtype: object
+    """
+
+    if att in _CONVERTERS:
+        return _CONVERTERS[att]
+    if att in (nmt.CH, nmt.ST, nmt.HX):
+        conv = None
+    elif att == nmt.DE:
+        conv = _to_float
+    elif att == nmt.IN:
+        conv = _to_int
+    elif att in (nmt.DT, nmt.DM):
+        conv = partial(date2utc, form=att)
+    elif att in (nmt.LA, nmt.LN):
+        conv = partial(dmm2ddd, att=att)
+    elif att == nmt.TM:
+        conv = time2utc
+    else:
+
+        def conv(vals):
+            raise nme.NMEATypeError(f"Unknown attribute type {att}.")
+
+    _CONVERTERS[att] = conv
+    return conv
+
 
 class NMEAMessage:
     """NMEA GNSS/GPS Message Class."""
@@ -46,6 +257,11 @@ class NMEAMessage:
         :param str msgID: message ID e.g. "GGA"
         :param int msgmode: mode (0=GET, 1=SET, 2=POLL)
         :param bool hpnmeamode: (kwarg) high precision lat/lon mode (7dp rather than 5dp)
+        :param bool lazy: (kwarg) if payload is provided, defer conversion of each
+            attribute until it is first accessed (False)
+        :param bool groups: (kwarg) if payload is provided, set each repeating group
+            as a single attribute containing a named tuple of member value tuples,
+            rather than as individual suffixed attributes; 'lazy' is ignored if True (False)
         :param kwargs: keyword arg(s) representing all or some payload attributes
         :raises: NMEAMessageError
 
@@ -54,21 +270,7 @@ class NMEAMessage:
         # object is mutable during initialisation only
         super().__setattr__("_immutable", False)
 
-        if msgmode not in (0, 1, 2):
-            raise nme.NMEAMessageError(
-                f"Invalid msgmode {msgmode} - must be 0, 1 or 2."
-            )
-        if talker not in nmt.NMEA_TALKERS:
-            raise nme.NMEAMessageError(f"Unknown talker {talker}.")
-        if (
-            msgID not in (nmt.NMEA_MSGIDS)
-            and msgID not in (nmt.NMEA_MSGIDS_PROP)
-            and msgID not in (nmt.PROP_MSGIDS)
-        ):
-            raise nme.NMEAMessageError(
-                f"Unknown msgID {talker}{msgID}, msgmode {('GET','SET','POLL')[msgmode]}."
-            )
-
+        _check_ids(talker, msgID, msgmode)
         self._mode = msgmode
         # high precision NMEA mode returns NMEA lat/lon to 7dp rather than 5dp
         self._hpnmeamode = kwargs.get("hpnmeamode", False)
@@ -87,31 +289,82 @@ class NMEAMessage:
         :raises: UBXTypeError
         """
 
-        pindex = 0  # payload index
-        gindex = []  # (nested) grouped attribute indices
+        self._payload = kwargs.get("payload", [])
+        self._checksum = kwargs.get("checksum", "00")
+
+        # derive NS and EW values if not provided explicitly
+        # (explicit NS or EW values take precedence over lat/lon sign)
+        if "payload" not in kwargs:
+            for key, dirn, pos, neg in (
+                ("lat", "NS", "N", "S"),
+                ("lon", "EW", "E", "W"),
+            ):
+                if key in kwargs and dirn not in kwargs and kwargs[key] != "":
+                    try:
+                        kwargs[dirn] = pos if kwargs[key] > 0 else neg
+                    except TypeError as err:
+                        raise nme.NMEATypeError(
+                            f"Incorrect type for attribute {key} in msgID {self._msgID}."
+                        ) from err
+
+        attrs = {}
+        if "payload" in kwargs and kwargs.get("groups", False):
+            plan, self._groups = self._get_group_plan(**kwargs)
+            self._parse_plan(plan, 0, attrs)
+        elif "payload" in kwargs and kwargs.get("lazy", False):
+            self._lazy = self._get_index(self._get_plan(**kwargs))
+        elif "payload" in kwargs:
+            self._parse_plan(self._get_plan(**kwargs), 0, attrs)
+        else:
+            self._build_plan(self._get_plan(**kwargs), attrs, **kwargs)
+        self.__dict__.update(attrs)  # add attributes to NMEAMessage object
+        # recalculate checksum for (re)constructed message
+        self._checksum = xor_checksum(self._content().encode("utf-8"))
 
-        try:
-            self._payload = kwargs.get("payload", [])
-            self._checksum = kwargs.get("checksum", "00")
-
-            # derive NS and EW values if not provided explicitly
-            # (explicit NS or EW values take precedence over lat/lon sign)
-            if "payload" not in kwargs:
-                if "lat" in kwargs and "NS" not in kwargs:
-                    if kwargs["lat"] != "":
-                        kwargs["NS"] = "N" if kwargs["lat"] > 0 else "S"
-                if "lon" in kwargs and "EW" not in kwargs:
-                    if kwargs["lon"] != "":
-                        kwargs["EW"] = "E" if kwargs["lon"] > 0 else "W"
-
-            pdict = self._get_dict(**kwargs)  # get payload definition dict
-            for key in pdict.keys():  # process each attribute in dict
-                (pindex, gindex) = self._set_attribute(
-                    pindex, pdict, key, gindex, **kwargs
-                )
-            # recalculate checksum for (re)constructed message
-            self._checksum = calc_checksum(self.serialize())
+    def _parse_plan(self, plan: tuple, pindex: int, attrs: dict) -> int:
+        """
+        Execute compiled payload plan against parsed payload, converting
+        each payload string to a typed attribute value.
+
+        Attributes beyond the end of the payload are omitted (probably
+        just an older device missing NMEA <=4.10 dict attributes). Repeating
+        groups retained as items are set to a named tuple of member value
+        tuples; any members of a final partial repeat beyond the end of
+        the payload are set to an empty string.
 
+        :param tuple plan: compiled payload plan
+        :param int pindex: payload index
+        :param dict attrs: attribute values (updated in place)
+        :return: pindex
+        :rtype: int
+        :raises: NMEATypeError
+        """
+
+        payload = self._payload
+        plen = len(payload)
+        step = (None, None)  # current plan step
+        try:
+            for step in plan:
+                if step[0] == _SINGLE:
+                    if pindex < plen:
+                        _, _, keyr, _, conv = step
+                        attrs[keyr] = (
+                            payload[pindex] if conv is None else conv(payload[pindex])
+                        )
+                        pindex += 1
+                elif step[0] == _ITEMS:  # repeating group retained as items
+                    pindex = self._parse_items(step, pindex, attrs)
+                else:  # variable length repeating group
+                    numr, attd = step[2:4]
+                    if numr == "None":  # indeterminate number of repeats
+                        rng = self._calc_num_repeats(attd, payload, pindex)
+                    elif numr in attrs:  # number of repeats in named attribute
+                        rng = attrs[numr]
+                        # repeats beyond end of payload would be omitted anyway
+                        rng = min(rng, -(-(plen - pindex) // len(attd)))
+                    else:
+                        raise AttributeError(numr)
+                    pindex = self._parse_plan(_group_plan(step, rng), pindex, attrs)
         except (
             AttributeError,
             OverflowError,
@@ -120,132 +373,288 @@ class NMEAMessage:
             ValueError,
         ) as err:
             raise nme.NMEATypeError(
-                f"Incorrect type for attribute {key} in msgID {self._msgID}."
+                f"Incorrect type for attribute {step[1]} in msgID {self._msgID}."
             ) from err
+        return pindex
 
-    def _set_attribute(
-        self, pindex: int, pdict: dict, key: str, gindex: list, **kwargs
-    ) -> tuple:
+    def _parse_items(self, step: tuple, pindex: int, attrs: dict) -> int:
         """
-        Recursive routine to set individual or grouped payload attributes.
+        Convert repeating group to a named tuple of member value tuples.
 
+        :param tuple step: repeating group plan step
         :param int pindex: payload index
-        :param dict pdict: dict representing payload definition
-        :param str key: attribute keyword
-        :param list gindex: repeating group index array
-        :param kwargs: optional payload key/value pairs
-        :return: (pindex, gindex[])
-        :rtype: tuple
+        :param dict attrs: attribute values (updated in place)
+        :return: pindex
+        :rtype: int
+        :raises: AttributeError if number of repeats attribute is absent
+        """
+
+        payload = self._payload
+        _, gkey, numr, attd, itype, convs = step
+        size = len(convs)
+        if numr == "None":  # indeterminate number of repeats
+            rng = self._calc_num_repeats(attd, payload, pindex)
+        else:  # fixed number of repeats or number in named attribute
+            rng = numr if isinstance(numr, int) else attrs.get(numr, None)
+            if rng is None:
+                raise AttributeError(numr)
+            # repeats beyond end of payload are omitted
+            rng = max(min(rng, -(-(len(payload) - pindex) // size)), 0)
+        end = pindex + rng * size
+        vals = payload[pindex:end]
+        vals += [""] * (end - pindex - len(vals))
+        attrs[gkey] = itype._make(
+            tuple(vals[i::size]) if conv is None else tuple(map(conv, vals[i::size]))
+            for i, conv in enumerate(convs)
+        )
+        return end
+
+    def _get_index(self, plan: tuple) -> dict:
         """
+        Get lazy attribute index, mapping each attribute name to its
+        (payload index, attribute type, definition key). The index for
+        payload definitions without variable length groups is static
+        and is created once on first use.
 
-        att = pdict[key]  # get attribute type
-        if isinstance(att, tuple):  # repeating group of attributes
-            (pindex, gindex) = self._set_attribute_group(att, pindex, gindex, **kwargs)
-        else:  # single attribute
-            pindex = self._set_attribute_single(att, pindex, key, gindex, **kwargs)
+        :param tuple plan: compiled payload plan
+        :return: attribute index
+        :rtype: dict
+        """
 
-        return (pindex, gindex)
+        index = _INDEXES.get(id(plan), None)
+        if index is None:
+            index = {}
+            self._index_plan(plan, 0, index)
+            if all(step[0] == _SINGLE for step in plan):
+                _INDEXES[id(plan)] = index
+        return index
 
-    def _set_attribute_group(
-        self, att: tuple, pindex: int, gindex: list, **kwargs
-    ) -> tuple:
+    def _index_plan(self, plan: tuple, pindex: int, index: dict) -> int:
         """
-        Process (nested) group of attributes.
+        Execute compiled payload plan to populate lazy attribute
+        index, converting only those attributes which define the
+        number of repeats in a variable length group.
 
-        :param tuple att: attribute group - tuple of (num repeats, attribute dict)
+        :param tuple plan: compiled payload plan
         :param int pindex: payload index
-        :param list gindex: repeating group index array
-        :param kwargs: optional payload key/value pairs
-        :return: (pindex, gindex[])
-        :rtype: tuple
+        :param dict index: attribute index (updated in place)
+        :return: pindex
+        :rtype: int
+        :raises: NMEATypeError
         """
 
-        gindex.append(0)  # add a (nested) group index
-        numr, attd = att  # number of repeats, group dictionary
+        payload = self._payload
+        plen = len(payload)
+        for step in plan:
+            if step[0] == _SINGLE:
+                index[step[2]] = (pindex, step[3], step[1])
+                pindex += 1
+            else:  # variable length repeating group
+                numr, attd = step[2:4]
+                if numr == "None":  # indeterminate number of repeats
+                    rng = self._calc_num_repeats(attd, payload, pindex)
+                else:  # number of repeats in named attribute
+                    try:
+                        rng = self._lazy_value(index, numr, step[1])
+                        rng = min(rng, -(-(plen - pindex) // len(attd)))
+                    except (AttributeError, TypeError) as err:
+                        raise nme.NMEATypeError(
+                            f"Incorrect type for attribute {step[1]} in msgID {self._msgID}."
+                        ) from err
+                pindex = self._index_plan(_group_plan(step, rng), pindex, index)
+        return pindex
 
-        # derive or retrieve number of items in group
-        if isinstance(numr, int):  # fixed number of repeats
-            rng = numr
-        elif numr == "None":  # indeterminate number of repeats
-            pindexend = 0  # may need tweaking
-            rng = self._calc_num_repeats(attd, self._payload, pindex, pindexend)
-        else:  # number of repeats is defined in named attribute
-            rng = getattr(self, numr)
-        # recursively process each group attribute,
-        # incrementing the payload index and group index as we go
-        for i in range(rng):
-            gindex[-1] = i + 1
-            for key1 in attd.keys():
-                (pindex, gindex) = self._set_attribute(
-                    pindex, attd, key1, gindex, **kwargs
-                )
+    def _lazy_value(self, index: dict, name: str, pkey: str = None) -> object:
+        """
+        Convert individual lazy attribute from payload string to typed value.
 
-        gindex.pop()  # remove this (nested) group index
+        :param dict index: attribute index
+        :param str name: attribute name
+        :param str pkey: definition key reported in any error (name)
+        :return: typed value
+        :rtype: object
+        :raises: AttributeError if attribute is not present in payload
+        :raises: NMEATypeError
+        """
 
-        return (pindex, gindex)
+        if name not in index or index[name][0] >= len(self._payload):
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        pindex, att, key = index[name]
+        try:
+            conv = _converter(att)
+            val = self._payload[pindex]
+            if conv is not None:
+                val = conv(val)
+            # adjust sign of decimal lat/lon according to direction (NS/EW) value
+            if name in ("lat", "lon") and val != "":
+                dirn, pos, neg = ("NS", "N", "S") if name == "lat" else ("EW", "E", "W")
+                if dirn in index and index[dirn][0] < len(self._payload):
+                    dval = self._payload[index[dirn][0]]
+                    if (dval == pos and val < 0) or (dval == neg and val > 0):
+                        val = val * -1
+        except (
+            AttributeError,
+            OverflowError,
+            struct.error,
+            TypeError,
+            ValueError,
+        ) as err:
+            raise nme.NMEATypeError(
+                f"Incorrect type for attribute {pkey or key} in msgID {self._msgID}."
+            ) from err
+        return val
 
-    def _set_attribute_single(
-        self, att: str, pindex: int, key: str, gindex: list, **kwargs
-    ) -> int:
+    def __getattr__(self, name: str) -> object:
         """
-        Set individual attribute value.
+        Decode lazy attribute on first access and cache result.
 
-        :param str att: attribute type e.g. 'NU'
-        :param int pindex: payload index
-        :param str key: attribute keyword
-        :param list gindex: repeating group index array
-        :param kwargs: optional payload key/value pairs
-        :return: pindex
-        :rtype: int
+        Only invoked if attribute has not already been set.
+
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError if attribute is not present
         """
-        # pylint: disable=no-member
 
-        # if attribute is part of a (nested) repeating group, suffix name with group index
-        keyr = key
-        for i in gindex:  # one index for each nested level
-            if i > 0:
-                keyr += f"_{i:02d}"
+        groups = self.__dict__.get("_groups", None)
+        if groups is not None:
+            return self._group_value(groups, name)
+        index = self.__dict__.get("_lazy", None)
+        if index is None:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        val = self._lazy_value(index, name)
+        self.__dict__[name] = val
+        return val
 
-        try:
-            # all attribute values have been provided
-            if "payload" in kwargs:
-                val = self._payload[pindex]
-                val = self.str2val(val, att)
-            # some attribute values have been provided,
-            # the rest will be set to a nominal value
-            else:
-                val = kwargs.get(keyr, self.nomval(att))
-                vals = self.val2str(val, att, self._hpnmeamode)
-                self._payload.append(vals)
+    def _group_value(self, groups: dict, name: str) -> object:
+        """
+        Get legacy suffixed repeating group attribute (e.g. 'svid_01')
+        from the corresponding repeating group member values.
 
-        except (
-            IndexError
-        ):  # probably just an older device missing NMEA <=4.10 dict attributes
-            return pindex
+        :param dict groups: mapping of group member name to group key
+        :param str name: attribute name
+        :return: attribute value
+        :rtype: object
+        :raises: AttributeError if attribute is not present
+        """
 
-        setattr(self, keyr, val)  # add attribute to NMEAMessage object
-        pindex += 1  # move on to next attribute in payload definition
+        key, _, idx = name.rpartition("_")
+        if key in groups and idx.isdigit():
+            vals = getattr(getattr(self, groups[key], None), key, ())
+            idx = int(idx) - 1
+            if 0 <= idx < len(vals):
+                return vals[idx]
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
-        return pindex
+    def _decode_all(self):
+        """
+        Decode any remaining lazy attributes, retaining payload order.
+        """
+
+        index = self.__dict__.get("_lazy", None)
+        if index is None:
+            return
+        attrs = {}
+        for name in index:
+            try:
+                attrs[name] = getattr(self, name)
+            except AttributeError:  # beyond end of payload
+                pass
+        for name in attrs:
+            self.__dict__.pop(name, None)
+        self.__dict__.update(attrs)
+        self.__dict__["_lazy"] = None
 
-    def _sign_latlon(self):
+    def _build_plan(self, plan: tuple, attrs: dict, **kwargs):
+        """
+        Execute compiled payload plan against keyword arguments, setting
+        each attribute to the value provided or a nominal value, and
+        appending the equivalent payload string.
+
+        :param tuple plan: compiled payload plan
+        :param dict attrs: attribute values (updated in place)
+        :param kwargs: optional payload key/value pairs
+        :raises: NMEATypeError
+        """
+
+        payload = self._payload
+        step = (None, None)  # current plan step
+        try:
+            for step in plan:
+                if step[0] == _SINGLE:
+                    _, _, keyr, att, _ = step
+                    val = kwargs[keyr] if keyr in kwargs else self.nomval(att)
+                    payload.append(self.val2str(val, att, self._hpnmeamode))
+                    attrs[keyr] = val
+                else:  # variable length repeating group
+                    numr, attd = step[2:4]
+                    if numr == "None":  # indeterminate number of repeats
+                        rng = self._calc_num_repeats(attd, payload, len(payload))
+                    else:  # number of repeats in named attribute
+                        rng = attrs[numr]
+                    self._build_plan(_group_plan(step, rng), attrs, **kwargs)
+        except (
+            AttributeError,
+            KeyError,
+            OverflowError,
+            struct.error,
+            TypeError,
+            ValueError,
+        ) as err:
+            raise nme.NMEATypeError(
+                f"Incorrect type for attribute {step[1]} in msgID {self._msgID}."
+            ) from err
+
+    def _sign_latlon(self, attrs: dict = None):
         """
         Adjust sign of decimal lat/lon according to direction (NS/EW) value
+
+        :param dict attrs: attribute values (updated in place) (None = instance attributes)
+        """
+
+        if attrs is None:
+            attrs = self.__dict__
+        for key, dirn, pos, neg in (("lat", "NS", "N", "S"), ("lon", "EW", "E", "W")):
+            if key in attrs and dirn in attrs and attrs[key] != "":
+                val = attrs[key]
+                if (attrs[dirn] == pos and val < 0) or (attrs[dirn] == neg and val > 0):
+                    attrs[key] = val * -1
+
+    def _get_plan(self, **kwargs) -> tuple:
+        """
+        Get compiled payload plan, compiling it from the payload
+        definition dictionary on first use.
+
+        :return: compiled payload plan
+        :rtype: tuple
         """
-        # pylint: disable=no-member, E0203
-
-        if hasattr(self, "lat") and hasattr(self, "NS"):
-            if self.lat != "":
-                if (self.NS == "N" and self.lat < 0) or (
-                    self.NS == "S" and self.lat > 0
-                ):
-                    self.lat = self.lat * -1
-        if hasattr(self, "lon") and hasattr(self, "EW"):
-            if self.lon != "":
-                if (self.EW == "E" and self.lon < 0) or (
-                    self.EW == "W" and self.lon > 0
-                ):
-                    self.lon = self.lon * -1
+
+        pdict = self._get_dict(**kwargs)
+        plan = _PLANS.get(id(pdict), None)
+        if plan is None:
+            plan = _PLANS[id(pdict)] = compile_plan(pdict)
+        return plan
+
+    def _get_group_plan(self, **kwargs) -> tuple:
+        """
+        Get compiled grouped payload plan, compiling it from the payload
+        definition dictionary on first use.
+
+        :return: tuple of (compiled plan, dict mapping group member name to group key)
+        :rtype: tuple
+        """
+
+        pdict = self._get_dict(**kwargs)
+        gplan = _GPLANS.get(id(pdict), None)
+        if gplan is None:
+            gplan = _GPLANS[id(pdict)] = compile_group_plan(pdict)
+        return gplan
 
     def _get_dict(self, **kwargs) -> dict:
         """
@@ -302,6 +711,7 @@ class NMEAMessage:
         :rtype: str
         """
 
+        self._decode_all()
         stg = f"<NMEA({self.identity}"
         stg += ", "
         for i, att in enumerate(self.__dict__):
@@ -353,11 +763,17 @@ class NMEAMessage:
         :rtype: bytes
         """
 
-        output = "$" + self._talker + self._msgID + ","
-        if len(self._payload) > 0:
-            output += list2csv(self._payload)
-        output += "*" + self._checksum + "\r\n"
-        return output.encode("utf-8")  # convert str to bytes
+        return f"${self._content()}*{self._checksum}\r\n".encode("utf-8")
+
+    def _content(self) -> str:
+        """
+        Get message content (everything between "$" and "*").
+
+        :return: message content e.g. "GNGLL,5327.04319,S,..."
+        :rtype: str
+        """
+
+        return f"{self._talker}{self._msgID},{list2csv(self._payload)}"
 
     @property
     def identity(self) -> str:
@@ -440,29 +856,8 @@ class NMEAMessage:
         :raises: MMEATypeError
         """
 
-        val = vals
-        if att in (
-            nmt.CH,
-            nmt.ST,
-        ):  # character, string, hex
-            pass
-        elif att == nmt.HX:
-            val = vals
-        elif att == nmt.DE:  # decimal
-            if vals != "":
-                val = float(vals)
-        elif att in (nmt.DT, nmt.DM):  # date
-            val = date2utc(vals, att)
-        elif att == nmt.IN:  # integer
-            if vals != "":
-                val = int(vals)
-        elif att in (nmt.LA, nmt.LN):  # lat/lon (d)ddmm.mmmmm(mm)
-            val = dmm2ddd(vals, att)
-        elif att == nmt.TM:  # time hhmmss.ss
-            val = time2utc(vals)
-        else:
-            raise nme.NMEATypeError(f"Unknown attribute type {att}.")
-        return val
+        conv = _converter(att)
+        return vals if conv is None else conv(vals)
 
     @staticmethod
     def val2str(val, att: str, hpmode: bool = False) -> str:
@@ -0,0 +1,487 @@
+"""
+Streaming NMEA pipeline.
+
+Processes an NMEA stream as a sequence of composable stages, e.g.
+
+    framing -> checksum -> filter -> parse -> transform -> sink
+
+Sentences are framed from the stream by an NMEAReader and passed
+through each stage in batches of PipelineItem records. Each stage
+receives a list of items and returns a (possibly shorter) list of
+items, so stages can drop, annotate, parse or forward sentences, and
+can amortise per-call costs (e.g. a single write per batch) across
+the batch e.g.
+
+    pipe = Pipeline(
+        stream,
+        [
+            ChecksumStage(drop=True),
+            FilterStage(forward={"GSV"}),
+            ParseStage(),
+            RawWriter(outstream),
+        ],
+        timing=True,
+    )
+    for item in pipe:
+        if item.parsed is not None:
+            ...
+    print(pipe.stats)
+
+Items marked 'forward' (e.g. by FilterStage) are passed through
+without being parsed, so sentences which are only to be relayed in
+raw form incur no parsing overhead.
+
+A batch contains only those sentences which are already available
+in the reader's buffer (up to 'batchsize'), so batching does not add
+latency when reading from a live stream.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+from time import perf_counter_ns
+from pynmeagps.nmeahelpers import get_parts_cksum
+from pynmeagps.nmeareader import NMEAReader, raw_identity
+from pynmeagps.nmeatypes_core import VALCKSUM
+import pynmeagps.exceptions as nme
+
+BATCHSIZE = 64  # default maximum number of sentences per batch
+FRAMING = "framing"  # stats key for framing stage
+
+
+class PipelineItem:
+    """
+    PipelineItem class.
+
+    Record of a single NMEA sentence as it passes through the pipeline.
+    """
+
+    __slots__ = ("raw", "identity", "parts", "parsed", "forward", "error")
+
+    def __init__(self, raw: bytes):
+        """Constructor.
+
+        :param bytes raw: raw NMEA sentence
+        """
+
+        self.raw = raw
+        self.identity = None  # message identity e.g. "GNGGA", set by FilterStage
+        self.parts = None  # get_parts_cksum() tuple, set by ChecksumStage
+        self.parsed = None  # NMEAMessage, set by ParseStage
+        self.forward = False  # True = pass through without parsing
+        self.error = None  # error message, if sentence is invalid
+
+    def __repr__(self) -> str:
+        """
+        Machine readable representation.
+
+        :return: machine readable representation
+        :rtype: str
+        """
+
+        return (
+            f"PipelineItem(raw={self.raw!r}, identity={self.identity!r}, "
+            f"parsed={self.parsed!r}, forward={self.forward}, error={self.error!r})"
+        )
+
+
+class Stage:
+    """
+    Stage class.
+
+    Base class of pipeline stages. Subclasses override process().
+    """
+
+    def __init__(self, name: str = None):
+        """Constructor.
+
+        :param str name: stage name used in pipeline stats (None = class name)
+        """
+
+        self.name = type(self).__name__ if name is None else name
+
+    def process(self, batch: list) -> list:
+        """
+        Process batch of items.
+
+        :param list batch: list of PipelineItem
+        :return: list of PipelineItem to pass to next stage
+        :rtype: list
+        """
+
+        return batch
+
+
+class MapStage(Stage):
+    """
+    MapStage class.
+
+    Applies a function to each item. The function returns the item
+    (or a replacement) to keep it, or None to drop it.
+    """
+
+    def __init__(self, func: object, name: str = None):
+        """Constructor.
+
+        :param object func: function taking and returning a PipelineItem (or None)
+        :param str name: stage name (None = function name)
+        """
+
+        super().__init__(getattr(func, "__name__", None) if name is None else name)
+        self._func = func
+
+    def process(self, batch: list) -> list:
+        """
+        Process batch of items.
+
+        :param list batch: list of PipelineItem
+        :return: list of PipelineItem
+        :rtype: list
+        """
+
+        return [item for item in map(self._func, batch) if item is not None]
+
+
+class ChecksumStage(Stage):
+    """
+    ChecksumStage class.
+
+    Splits each sentence into its parts and validates its checksum,
+    setting the item's 'parts' (for reuse by ParseStage) or 'error'.
+    """
+
+    def __init__(self, drop: bool = False, name: str = None):
+        """Constructor.
+
+        :param bool drop: True = drop invalid sentences, False = pass them
+            on with 'error' set (False)
+        :param str name: stage name (None = class name)
+        """
+
+        super().__init__(name)
+        self._drop = drop
+
+    def process(self, batch: list) -> list:
+        """
+        Process batch of items.
+
+        :param list batch: list of PipelineItem
+        :return: list of PipelineItem
+        :rtype: list
+        """
+
+        out = []
+        for item in batch:
+            if item.error is None:
+                try:
+                    parts = get_parts_cksum(item.raw)
+                    if parts[3] == parts[4]:
+                        item.parts = parts
+                    else:
+                        item.error = (
+                            f"Message {parts[0]}{parts[1]} invalid checksum {parts[3]}"
+                            f" - should be {parts[4]}."
+                        )
+                except nme.NMEAMessageError as err:
+                    item.error = str(err)
+            if item.error is None or not self._drop:
+                out.append(item)
+        return out
+
+
+class FilterStage(Stage):
+    """
+    FilterStage class.
+
+    Filters sentences by message identity, read from the raw sentence
+    header. Identities may be specified with or without the talker
+    e.g. "GNGGA", "GGA", "PUBX00".
+    """
+
+    def __init__(
+        self,
+        include: set = None,
+        exclude: set = None,
+        forward: set = None,
+        name: str = None,
+    ):
+        """Constructor.
+
+        :param set include: identities to keep - all others are dropped (None = all)
+        :param set exclude: identities to drop (None = none)
+        :param set forward: identities to pass through without parsing (None = none)
+        :param str name: stage name (None = class name)
+        """
+
+        super().__init__(name)
+        self._include = None if include is None else frozenset(include)
+        self._exclude = frozenset(() if exclude is None else exclude)
+        self._forward = frozenset(() if forward is None else forward)
+        self._identities = {}  # cached (keep, forward) by identity
+
+    def process(self, batch: list) -> list:
+        """
+        Process batch of items.
+
+        :param list batch: list of PipelineItem
+        :return: list of PipelineItem
+        :rtype: list
+        """
+
+        out = []
+        for item in batch:
+            identity, msgid = raw_identity(item.raw)
+            item.identity = identity
+            action = self._identities.get(identity, None)
+            if action is None:
+                action = self._identities[identity] = self._action(identity, msgid)
+            keep, forward = action
+            if keep:
+                item.forward = item.forward or forward
+                out.append(item)
+        return out
+
+    def _action(self, identity: str, msgid: str) -> tuple:
+        """
+        Determine action for message identity.
+
+        :param str identity: message identity e.g. "GNGGA"
+        :param str msgid: message ID e.g. "GGA"
+        :return: tuple of (keep, forward) flags
+        :rtype: tuple
+        """
+
+        ids = {identity, msgid}
+        keep = (self._include is None or not ids.isdisjoint(self._include)) and (
+            ids.isdisjoint(self._exclude)
+        )
+        return keep, not ids.isdisjoint(self._forward)
+
+
+class ParseStage(Stage):
+    """
+    ParseStage class.
+
+    Parses each sentence not marked 'forward' or in error, reusing the
+    parts from any preceding ChecksumStage. Parse errors are set in the
+    item's 'error' attribute and 'parsed' is set to the error message,
+    as for NMEAReader. Keyword arguments (validate, msgmode, lazy,
+    groups, compact) are as for NMEAReader.parse().
+    """
+
+    def __init__(self, name: str = None, **kwargs):
+        """Constructor.
+
+        :param str name: stage name (None = class name)
+        :param kwargs: keyword arguments passed to NMEAReader.parse()
+        """
+
+        super().__init__(name)
+        self._kwargs = kwargs
+        self._kwargs.setdefault("validate", VALCKSUM)
+
+    def process(self, batch: list) -> list:
+        """
+        Process batch of items.
+
+        :param list batch: list of PipelineItem
+        :return: list of PipelineItem
+        :rtype: list
+        """
+
+        kwargs = self._kwargs
+        for item in batch:
+            if item.forward or item.error is not None:
+                continue
+            try:
+                if item.parts is None:
+                    item.parsed = NMEAReader.parse(item.raw, **kwargs)
+                else:
+                    item.parsed = NMEAReader.parse_parts(item.parts, **kwargs)
+            except (
+                nme.NMEAMessageError,
+                nme.NMEATypeError,
+                nme.NMEAParseError,
+            ) as err:
+                item.error = item.parsed = str(err)
+        return batch
+
+
+class RawWriter(Stage):
+    """
+    RawWriter class.
+
+    Writes the raw sentence of each item (e.g. to a file, socket or
+    serial port) in a single write per batch, and passes all items on.
+    """
+
+    def __init__(self, stream, errors: bool = False, name: str = None):
+        """Constructor.
+
+        :param stream stream: output stream supporting a write(bytes) method
+        :param bool errors: True = also write sentences in error (False)
+        :param str name: stage name (None = class name)
+        """
+
+        super().__init__(name)
+        self._stream = stream
+        self._errors = errors
+
+    def process(self, batch: list) -> list:
+        """
+        Process batch of items.
+
+        :param list batch: list of PipelineItem
+        :return: list of PipelineItem
+        :rtype: list
+        """
+
+        data = b"".join(
+            item.raw for item in batch if self._errors or item.error is None
+        )
+        if data:
+            self._stream.write(data)
+        return batch
+
+
+class Pipeline:
+    """
+    Pipeline class.
+    """
+
+    def __init__(
+        self,
+        stream,
+        stages: list = (),
+        batchsize: int = BATCHSIZE,
+        timing: bool = False,
+        **kwargs,
+    ):
+        """Constructor.
+
+        :param stream stream: input data stream, or an NMEAReader (or subclass
+            e.g. MMapNMEAReader) used for framing
+        :param list stages: list of Stage objects, or functions which are
+            applied to each item as for MapStage
+        :param int batchsize: maximum number of sentences per batch (64)
+        :param bool timing: True = record time spent in each stage (False)
+        :param kwargs: keyword arguments (e.g. bufsize, nmeaonly) for the
+            NMEAReader used for framing
+        :raises: NMEAParseError if batchsize is invalid
+        """
+
+        if batchsize < 1:
+            raise nme.NMEAParseError(
+                f"Invalid batch size {batchsize} - must be greater than 0."
+            )
+        if isinstance(stream, NMEAReader):
+            self._reader = stream
+        else:
+            self._reader = NMEAReader(stream, **kwargs)
+        self._stages = [
+            stage if isinstance(stage, Stage) else MapStage(stage) for stage in stages
+        ]
+        self._batchsize = batchsize
+        self._timing = timing
+        names = [FRAMING]
+        for stage in self._stages:
+            name = stage.name
+            i = 2
+            while name in names:  # make duplicate names unique
+                name = f"{stage.name}_{i}"
+                i += 1
+            names.append(name)
+        self._names = names
+        self._stats = [[0, 0, 0] for _ in names]  # batches, items, ns
+
+    def __iter__(self):
+        """
+        Iterate over output items.
+
+        :return: generator of PipelineItem
+        :rtype: generator
+        """
+
+        for batch in self.batches():
+            yield from batch
+
+    def batches(self):
+        """
+        Generator which frames sentences from the stream and passes each
+        batch through all stages, yielding each non-empty output batch.
+
+        :return: generator of lists of PipelineItem
+        :rtype: generator
+        :raises: NMEAParseError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        reader = self._reader
+        stages = self._stages
+        batchsize = self._batchsize
+        timing = self._timing
+        stats = self._stats
+        start = 0
+        while True:
+            if timing:
+                start = perf_counter_ns()
+            batch = [PipelineItem(raw) for raw in reader.read_frames(batchsize)]
+            if not batch:
+                break
+            if timing:
+                _record(stats[0], len(batch), start)
+            for i, stage in enumerate(stages, 1):
+                if timing:
+                    num = len(batch)
+                    start = perf_counter_ns()
+                    batch = stage.process(batch)
+                    _record(stats[i], num, start)
+                else:
+                    batch = stage.process(batch)
+                if not batch:
+                    break
+            if batch:
+                yield batch
+
+    def run(self) -> int:
+        """
+        Run pipeline to end of stream, discarding output items
+        (e.g. where the final stage is a sink such as RawWriter).
+
+        :return: number of output items
+        :rtype: int
+        """
+
+        return sum(len(batch) for batch in self.batches())
+
+    @property
+    def stats(self) -> dict:
+        """
+        Per-stage statistics getter. Statistics are only recorded
+        if timing=True. Framing time includes reading the stream.
+
+        :return: dict of {stage name: {"batches": n, "items": n, "ns": n}},
+            where "items" is the number of items input to the stage
+        :rtype: dict
+        """
+
+        return {
+            name: {"batches": batches, "items": items, "ns": nsec}
+            for name, (batches, items, nsec) in zip(self._names, self._stats)
+        }
+
+
+def _record(stat: list, num: int, start: int):
+    """
+    Record stage statistics.
+
+    :param list stat: [batches, items, ns] statistics to update
+    :param int num: number of items processed
+    :param int start: start time in ns
+    """
+
+    stat[2] += perf_counter_ns() - start
+    stat[0] += 1
+    stat[1] += num
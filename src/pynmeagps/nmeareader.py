@@ -4,6 +4,10 @@ NMEAReader class.
 Reads and parses individual NMEA GNSS/GPS messages from
 any stream which supports a read(n) -> bytes method.
 
+The stream is read in chunks of up to 'bufsize' bytes into
+an internal buffer, which is then scanned for complete
+CRLF-terminated NMEA sentences.
+
 Can also read from socket via SocketStream wrapper.
 
 Returns both the raw binary data (as bytes) and the parsed
@@ -22,22 +26,27 @@ Created on 4 Mar 2021
 """
 
 from socket import socket
+from time import perf_counter_ns
 from pynmeagps.socket_stream import SocketStream
+from pynmeagps.nmeacompact import compact_message
 from pynmeagps.nmeamessage import NMEAMessage
 import pynmeagps.exceptions as nme
-from pynmeagps.nmeahelpers import (
-    get_parts,
-    calc_checksum,
-    isvalid_cksum,
-)
+from pynmeagps.nmeahelpers import get_parts_cksum
 from pynmeagps.nmeatypes_core import (
     NMEA_HDR,
+    PROP_MSGIDS,
     VALCKSUM,
     VALMSGID,
     ERR_LOG,
     ERR_RAISE,
 )
 
+# 2nd byte of each valid NMEA header
+NMEA_HDR2 = frozenset(hdr[1] for hdr in NMEA_HDR)
+# instrumentation counters and stage timings
+COUNTERS = ("bytes", "framed", "cksumerrors", "errors")
+TIMINGS = ("read", "frame", "filter", "split", "construct")
+
 
 class NMEAReader:
     """
@@ -53,7 +62,19 @@ class NMEAReader:
         :param bool nmeaonly (kwarg): True = error on non-NMEA data, False = ignore non-NMEA data
         :param int validate (kwarg): bitfield validation flags - VALCKSUM (default), VALMSGID
         :param int msgmode (kwarg): 0 = GET (default), 1 = SET, 2 = POLL
-        :param int bufsize: (kwarg) socket recv buffer size (4096)
+        :param int bufsize: (kwarg) stream read chunk size / socket recv buffer size (4096)
+        :param bool lazy: (kwarg) defer conversion of each NMEAMessage attribute
+            until it is first accessed (False)
+        :param bool groups: (kwarg) set each repeating group as a named tuple
+            of member value tuples rather than as suffixed attributes (False)
+        :param bool compact: (kwarg) return parsed data as a compact, slotted
+            CompactNMEAMessage rather than an NMEAMessage (False)
+        :param set msgfilter: (kwarg) message identities to be parsed
+            e.g. {"GNGGA", "RMC", "PUBX00"} - all others are filtered (None = no filter)
+        :param bool filterraw: (kwarg) True = return filtered messages as raw data
+            only, False = skip filtered messages entirely (False)
+        :param bool instrument: (kwarg) True = record counters and per-stage
+            timings, available via the stats property (False)
         :raises: NMEAParseError (if mode is invalid)
 
         """
@@ -75,6 +96,22 @@ class NMEAReader:
         self._nmea_only = nmeaonly
         self._validate = validate
         self._mode = msgmode
+        self._lazy = kwargs.get("lazy", False)
+        self._groups = kwargs.get("groups", False)
+        self._compact = kwargs.get("compact", False)
+        msgfilter = kwargs.get("msgfilter", None)
+        self._msgfilter = None if msgfilter is None else frozenset(msgfilter)
+        self._filterraw = kwargs.get("filterraw", False)
+        self._skipped = {}
+        if kwargs.get("instrument", False):
+            self._counters = dict.fromkeys(COUNTERS, 0)
+            self._nanos = dict.fromkeys(TIMINGS, 0)
+            self._msgcounts = {}
+        else:
+            self._counters = None  # instrumentation disabled
+        self._bufsize = bufsize
+        self._buffer = bytearray()
+        self._pos = 0  # offset of first unconsumed byte in buffer
 
     def __iter__(self):
         """Iterator."""
@@ -100,33 +137,150 @@ class NMEAReader:
         """
         Read the binary data from the stream buffer.
 
+        If a msgfilter is set, messages not in the filter are either
+        skipped or, if filterraw=True, returned as (raw_data, None).
+
         :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
         :rtype: tuple
         :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
 
         """
 
-        parsing = True
+        if self._counters is not None:
+            return self._read_instrumented(self._read_frame_instrumented)
+        return self._read(self._read_frame)
+
+    def read_buffered(self) -> (bytes, NMEAMessage):
+        """
+        Read the next NMEA sentence already in the internal buffer,
+        without reading the stream. Used with fill() by event-driven
+        callers which wait for the stream to become readable (e.g.
+        NMEAEventReader) rather than blocking in read().
+
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage),
+            or (None, None) if the buffer contains no complete sentence
+        :rtype: tuple
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        if self._counters is not None:
+            return self._read_instrumented(self._scan_buffered_instrumented)
+        return self._read(self._scan_buffered)
+
+    def fill(self) -> int:
+        """
+        Read one chunk of up to bufsize bytes from the stream into the
+        internal buffer, without blocking for more data than is currently
+        available where the stream supports this (e.g. Serial, socket).
+
+        :return: number of bytes read (0 if stream is exhausted)
+        :rtype: int
+        """
+
+        if self._counters is not None:
+            start = perf_counter_ns()
+            data = self._read_chunk()
+            return self.feed(data, perf_counter_ns() - start)
+        return self.feed(self._read_chunk())
+
+    def feed(self, data: bytes, nanos: int = 0) -> int:
+        """
+        Append data read from the stream by the caller (e.g. awaited from
+        an asynchronous stream by AsyncNMEAReader) to the internal buffer,
+        for subsequent read_buffered() calls.
+
+        :param bytes data: data read from stream
+        :param int nanos: time taken to read data in nanoseconds, added to
+            the "read" stage timing if instrument=True (0)
+        :return: number of bytes added (0 if data is empty i.e. stream is exhausted)
+        :rtype: int
+        """
+
+        if self._counters is not None:
+            self._counters["bytes"] += len(data)
+            self._nanos["read"] += nanos
+        if not data:
+            return 0
+        self._extend(data)
+        return len(data)
+
+    def _read(self, readframe: object) -> (bytes, NMEAMessage):
+        """
+        Read and parse the next NMEA sentence.
+
+        :param object readframe: function returning the next sentence,
+            or None if no sentence is available
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
+        :rtype: tuple
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
         raw_data = None
         parsed_data = None
 
         try:
-            while parsing:  # loop until end of valid NMEA message or EOF
-                byte1 = self._read_bytes(1)  # read 1st byte
-                if byte1 != b"\x24":  # not NMEA, discard and continue
-                    continue
-                byte2 = self._read_bytes(1)  # read 2nd byte to confirm protocol
-                bytehdr = byte1 + byte2
-                if bytehdr in NMEA_HDR:  # it's a NMEA message
-                    byten = self._read_line()  # NMEA protocol is CRLF terminated
-                    raw_data = bytehdr + byten
-                    parsed_data = self.parse(
-                        raw_data, validate=self._validate, msgmode=self._mode
-                    )
-                    parsing = False
-                else:  # it's not a NMEA message (UBX or something else)
-                    if self._nmea_only:  # raise error and quit
-                        raise nme.NMEAParseError(f"Unknown data header {bytehdr}.")
+            raw_data = readframe()
+            while (
+                raw_data is not None
+                and self._msgfilter is not None
+                and self._is_filtered(raw_data)
+            ):
+                if self._filterraw:
+                    return (raw_data, None)
+                raw_data = readframe()
+            if raw_data is None:
+                return (None, None)
+            parsed_data = self.parse(
+                raw_data,
+                validate=self._validate,
+                msgmode=self._mode,
+                lazy=self._lazy,
+                groups=self._groups,
+                compact=self._compact,
+            )
+
+        except EOFError:
+            return (None, None)
+        except (
+            nme.NMEAMessageError,
+            nme.NMEATypeError,
+            nme.NMEAParseError,
+            nme.NMEAStreamError,
+        ) as err:
+            if self._quitonerror:
+                self._do_error(str(err))
+            parsed_data = str(err)
+
+        return (raw_data, parsed_data)
+
+    def _read_instrumented(self, readframe: object) -> (bytes, NMEAMessage):
+        """
+        Read the binary data from the stream buffer, recording
+        counters and per-stage timings.
+
+        :param object readframe: function returning the next sentence,
+            or None if no sentence is available
+        :return: tuple of (raw_data as bytes, parsed_data as NMEAMessage)
+        :rtype: tuple
+        :raises: NMEAStreamError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        raw_data = None
+        parsed_data = None
+
+        try:
+            raw_data = readframe()
+            while (
+                raw_data is not None
+                and self._msgfilter is not None
+                and self._timed("filter", self._is_filtered, raw_data)
+            ):
+                if self._filterraw:
+                    return (raw_data, None)
+                raw_data = readframe()
+            if raw_data is None:
+                return (None, None)
+            parsed_data = self._parse_instrumented(raw_data)
 
         except EOFError:
             return (None, None)
@@ -136,40 +290,335 @@ class NMEAReader:
             nme.NMEAParseError,
             nme.NMEAStreamError,
         ) as err:
+            self._counters["errors"] += 1
             if self._quitonerror:
                 self._do_error(str(err))
             parsed_data = str(err)
 
         return (raw_data, parsed_data)
 
-    def _read_bytes(self, size: int) -> bytes:
+    def _read_frame_instrumented(self) -> bytes:
         """
-        Read a specified number of bytes from stream.
+        Read the next complete NMEA sentence, recording stream read
+        and framing timings and bytes read.
 
-        :param int size: number of bytes to read
-        :return: bytes
+        :return: NMEA sentence including CRLF terminator
         :rtype: bytes
         :raises: EOFError if stream ends prematurely
+        :raises: NMEAParseError if nmeaonly=True and stream includes non-NMEA data
         """
 
-        data = self._stream.read(size)
-        if len(data) < size:  # EOF
-            raise EOFError()
-        return data
+        frame = self._scan_frame_instrumented()
+        while frame is None:
+            if not self.fill():
+                raise EOFError()
+            frame = self._scan_frame_instrumented()
+        return frame
 
-    def _read_line(self) -> bytes:
+    def _scan_frame_instrumented(self) -> bytes:
         """
-        Read until end of line (CRLF).
+        Scan internal buffer for the next complete NMEA sentence,
+        recording framing timings and bytes framed.
 
-        :return: bytes
+        :return: NMEA sentence including CRLF terminator, or None if
+            buffer does not yet contain a complete sentence
+        :rtype: bytes
+        :raises: EOFError if sentence is not CRLF terminated
+        :raises: NMEAParseError if nmeaonly=True and stream includes non-NMEA data
+        """
+
+        frame = self._timed("frame", self._scan_frame)
+        if frame is not None:
+            self._counters["framed"] += len(frame)
+        return frame
+
+    def _scan_buffered_instrumented(self) -> bytes:
+        """
+        Scan internal buffer for the next complete NMEA sentence,
+        recording framing timings.
+
+        :return: NMEA sentence including CRLF terminator, or None if
+            buffer does not contain a complete sentence
+        :rtype: bytes
+        :raises: NMEAParseError if nmeaonly=True and stream includes non-NMEA data
+        """
+
+        frame = self._timed("frame", self._scan_buffered)
+        if frame is not None:
+            self._counters["framed"] += len(frame)
+        return frame
+
+    def _parse_instrumented(self, raw_data: bytes) -> object:
+        """
+        Parse NMEA sentence, recording split (including checksum
+        calculation) and message construction timings, messages by
+        identity and checksum failures.
+
+        :param bytes raw_data: NMEA sentence
+        :return: NMEAMessage or CompactNMEAMessage object (or None if unknown message
+            and VALMSGID is not set)
+        :rtype: NMEAMessage
+        :raises: NMEAParseError (if data stream contains invalid data or unknown message type)
+        """
+
+        try:
+            parts = self._timed("split", get_parts_cksum, raw_data)
+        except nme.NMEAMessageError as err:
+            if not self._validate & VALMSGID:
+                return None
+            raise nme.NMEAParseError(err)
+        talker, msgid, payload, checksum, calc = parts
+        identity = talker + msgid
+        if talker == "P" and msgid in PROP_MSGIDS and payload:  # e.g. PUBX00
+            identity += payload[0]
+        self._msgcounts[identity] = self._msgcounts.get(identity, 0) + 1
+        if self._validate & VALCKSUM and checksum != calc:
+            self._counters["cksumerrors"] += 1
+        return self._timed(
+            "construct",
+            self.parse_parts,
+            parts,
+            validate=self._validate,
+            msgmode=self._mode,
+            lazy=self._lazy,
+            groups=self._groups,
+            compact=self._compact,
+        )
+
+    def _timed(self, stage: str, func: object, *args, **kwargs) -> object:
+        """
+        Call function, adding the time taken to the stage timing.
+
+        :param str stage: stage name e.g. "split"
+        :param object func: function to call
+        :return: function return value
+        :rtype: object
+        """
+
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._nanos[stage] += perf_counter_ns() - start
+
+    def read_frames(self, maxframes: int = 1) -> list:
+        """
+        Read up to maxframes raw NMEA sentences without parsing them.
+
+        Only sentences already in the internal buffer are returned,
+        unless the buffer contains no complete sentence, in which case
+        the stream is read until one is available. This allows callers
+        to process sentences in batches without waiting for a full
+        batch to arrive. Any msgfilter is not applied. If instrument=True,
+        byte counts and read and framing timings are recorded as for read().
+
+        :param int maxframes: maximum number of sentences to return
+        :return: list of NMEA sentences including CRLF terminators
+            (empty if stream is exhausted)
+        :rtype: list
+        :raises: NMEAParseError (if nmeaonly=True and stream includes non-NMEA data)
+        """
+
+        scan = (
+            self._scan_frame
+            if self._counters is None
+            else self._scan_frame_instrumented
+        )
+        frames = []
+        while len(frames) < maxframes:
+            pos = self._pos
+            try:
+                frame = scan()
+                if frame is None:
+                    if frames or not self.fill():
+                        break
+                    continue
+            except EOFError:
+                # end of stream - return any sentences already read, and
+                # rescan from the same point (so ending again) on next call
+                if frames:
+                    self._pos = pos
+                break
+            frames.append(frame)
+        return frames
+
+    def _read_frame(self) -> bytes:
+        """
+        Read the next complete NMEA sentence, topping the internal
+        buffer up from the stream in chunks as required.
+
+        :return: NMEA sentence including CRLF terminator
         :rtype: bytes
         :raises: EOFError if stream ends prematurely
+        :raises: NMEAParseError if nmeaonly=True and stream includes non-NMEA data
+        """
+
+        frame = self._scan_frame()
+        while frame is None:
+            self._extend(self._read_chunk())
+            frame = self._scan_frame()
+        return frame
+
+    def _scan_frame(self) -> bytes:
+        """
+        Scan internal buffer for the next complete NMEA sentence.
+        Any non-NMEA data preceding the sentence is discarded.
+
+        :return: NMEA sentence including CRLF terminator, or None if
+            buffer does not yet contain a complete sentence
+        :rtype: bytes
+        :raises: EOFError if sentence is not CRLF terminated
+        :raises: NMEAParseError if nmeaonly=True and stream includes non-NMEA data
+        """
+
+        buf = self._buffer
+        while True:
+            start = buf.find(b"\x24", self._pos)  # "$"
+            if start == -1:  # no header in buffer, discard
+                self._pos = len(buf)
+                return None
+            if start + 1 == len(buf):  # need 2nd byte to confirm protocol
+                self._pos = start
+                return None
+            if buf[start + 1] not in NMEA_HDR2:  # not NMEA (UBX or something else)
+                self._pos = start + 1
+                if self._nmea_only:  # raise error and quit
+                    raise nme.NMEAParseError(
+                        f"Unknown data header {bytes(buf[start : start + 2])}."
+                    )
+                continue
+            end = buf.find(b"\x0a", start + 2)  # NMEA protocol is CRLF terminated
+            if end == -1:  # incomplete sentence
+                self._pos = start
+                return None
+            self._pos = end + 1
+            if buf[end - 1] != 0x0D:  # not CRLF terminated
+                raise EOFError()
+            return self._frame(start, end + 1)
+
+    def _scan_buffered(self) -> bytes:
+        """
+        Scan internal buffer for the next complete NMEA sentence,
+        skipping any sentences which are not CRLF terminated.
+
+        :return: NMEA sentence including CRLF terminator, or None if
+            buffer does not contain a complete sentence
+        :rtype: bytes
+        :raises: NMEAParseError if nmeaonly=True and stream includes non-NMEA data
+        """
+
+        while True:
+            try:
+                return self._scan_frame()
+            except EOFError:
+                continue
+
+    def _frame(self, start: int, end: int) -> bytes:
+        """
+        Return sentence at given offsets in internal buffer.
+
+        :param int start: sentence start offset
+        :param int end: sentence end offset
+        :return: NMEA sentence
+        :rtype: bytes
+        """
+
+        return bytes(self._buffer[start:end])
+
+    def _extend(self, data: bytes):
         """
+        Append chunk of data read from stream to internal buffer,
+        discarding any data already consumed.
 
-        data = self._stream.readline()  # NMEA protocol is CRLF terminated
-        if data[-2:] != b"\x0d\x0a":  # EOF
+        :param bytes data: data read from stream
+        :raises: EOFError if stream is exhausted (data is empty)
+        """
+
+        if not data:  # EOF
             raise EOFError()
-        return data
+        if self._pos:
+            del self._buffer[: self._pos]
+            self._pos = 0
+        self._buffer += data
+
+    def _is_filtered(self, raw_data: bytes) -> bool:
+        """
+        Check message identity in raw sentence header against msgfilter,
+        without parsing the sentence, and count any filtered messages.
+
+        :param bytes raw_data: NMEA sentence
+        :return: True if message is to be filtered, False if it is to be parsed
+        :rtype: bool
+        """
+
+        identity, msgid = raw_identity(raw_data)
+        if identity in self._msgfilter or msgid in self._msgfilter:
+            return False
+        self._skipped[identity] = self._skipped.get(identity, 0) + 1
+        return True
+
+    def _read_chunk(self) -> bytes:
+        """
+        Read up to bufsize bytes from stream without blocking
+        for more data than is currently available, where the
+        stream supports this (e.g. Serial, buffered File, socket).
+
+        :return: bytes (empty if EOF or timeout)
+        :rtype: bytes
+        """
+
+        stream = self._stream
+        if hasattr(stream, "in_waiting"):  # e.g. Serial
+            return stream.read(min(max(stream.in_waiting, 1), self._bufsize))
+        if hasattr(stream, "read1"):  # e.g. BufferedReader, BytesIO, SocketStream
+            return stream.read1(self._bufsize)
+        return stream.read(self._bufsize)
+
+    @property
+    def skipped(self) -> dict:
+        """
+        Skipped messages getter.
+
+        :return: count of messages filtered by msgfilter, by identity
+            e.g. {"GPGSV": 12, "GNGSA": 8}
+        :rtype: dict
+        """
+
+        return dict(self._skipped)
+
+    @property
+    def stats(self) -> dict:
+        """
+        Instrumentation statistics getter. Only available if the reader
+        was created with instrument=True.
+
+        Counters are "messages" (sentences parsed, by identity), "bytes"
+        (read from stream), "discarded" (non-NMEA bytes skipped),
+        "filtered" (sentences filtered by msgfilter), "cksumerrors"
+        (checksum failures) and "errors" (all errors reported, including
+        checksum failures). "ns" contains the cumulative time in
+        nanoseconds spent in each stage - "read" (reading the stream),
+        "frame" (scanning for sentences), "filter" (msgfilter checks),
+        "split" (splitting and checksumming each sentence) and
+        "construct" (constructing each message).
+
+        :return: snapshot of counters and timings (empty if instrument=False)
+        :rtype: dict
+        """
+
+        counters = self._counters
+        if counters is None:
+            return {}
+        pending = len(self._buffer) - self._pos  # bytes buffered but not yet framed
+        return {
+            "messages": dict(self._msgcounts),
+            "bytes": counters["bytes"],
+            "discarded": counters["bytes"] - counters["framed"] - pending,
+            "filtered": sum(self._skipped.values()),
+            "cksumerrors": counters["cksumerrors"],
+            "errors": counters["errors"],
+            "ns": dict(self._nanos),
+        }
 
     def _do_error(self, err: str):
         """
@@ -213,32 +662,90 @@ class NMEAReader:
         :param bytes message: bytes message to parse
         :param int validate (kwarg): bitfield validation flags - VALCKSUM (default), VALMSGID (can be OR'd)
         :param int msgmode (kwarg): 0 = GET (default), 1 = SET, 2 = POLL
-        :return: NMEAMessage object (or None if unknown message and VALMSGID is not set)
+        :param bool lazy (kwarg): defer conversion of each attribute until first accessed (False)
+        :param bool groups (kwarg): set each repeating group as a named tuple of
+            member value tuples (False)
+        :param bool compact (kwarg): return CompactNMEAMessage rather than
+            NMEAMessage - lazy and groups are ignored if True (False)
+        :return: NMEAMessage or CompactNMEAMessage object (or None if unknown message
+            and VALMSGID is not set)
         :rtype: NMEAMessage
         :raises: NMEAParseError (if data stream contains invalid data or unknown message type)
 
         """
 
+        try:
+            parts = get_parts_cksum(message)
+        except nme.NMEAMessageError as err:
+            if not kwargs.get("validate", VALCKSUM) & VALMSGID:
+                return None
+            raise nme.NMEAParseError(err)
+        return NMEAReader.parse_parts(parts, **kwargs)
+
+    @staticmethod
+    def parse_parts(parts: tuple, **kwargs) -> object:
+        """
+        Parse NMEA message from the (talker, msgID, payload, checksum,
+        calculated checksum) tuple returned by get_parts_cksum(), e.g.
+        where the raw sentence has already been split and checksummed.
+        Keyword arguments are as for parse().
+
+        :param tuple parts: tuple of (talker, msgID, payload, checksum, calculated checksum)
+        :return: NMEAMessage or CompactNMEAMessage object (or None if unknown message
+            and VALMSGID is not set)
+        :rtype: NMEAMessage
+        :raises: NMEAParseError (if checksum is invalid or unknown message type)
+        """
+
         validate = kwargs.get("validate", VALCKSUM)
         msgmode = kwargs.get("msgmode", 0)
+        lazy = kwargs.get("lazy", False)
+        groups = kwargs.get("groups", False)
+        compact = kwargs.get("compact", False)
         if msgmode not in (0, 1, 2):
             raise nme.NMEAParseError(
                 f"Invalid parse mode {msgmode} - must be 0, 1 or 2."
             )
 
         try:
-            talker, msgid, payload, checksum = get_parts(message)
-            if validate & VALCKSUM:
-                if not isvalid_cksum(message):
-                    raise nme.NMEAParseError(
-                        f"Message {talker}{msgid} invalid checksum {checksum}"
-                        f" - should be {calc_checksum(message)}."
-                    )
+            talker, msgid, payload, checksum, calc = parts
+            if validate & VALCKSUM and checksum != calc:
+                raise nme.NMEAParseError(
+                    f"Message {talker}{msgid} invalid checksum {checksum}"
+                    f" - should be {calc}."
+                )
+            if compact:
+                return compact_message(talker, msgid, msgmode, payload)
             return NMEAMessage(
-                talker, msgid, msgmode, payload=payload, checksum=checksum
+                talker,
+                msgid,
+                msgmode,
+                payload=payload,
+                checksum=checksum,
+                lazy=lazy,
+                groups=groups,
             )
 
         except nme.NMEAMessageError as err:
             if not validate & VALMSGID:
                 return None
             raise nme.NMEAParseError(err)
+
+
+def raw_identity(raw_data: bytes) -> tuple:
+    """
+    Get message identity from raw NMEA sentence header, without
+    parsing the sentence.
+
+    :param bytes raw_data: NMEA sentence
+    :return: tuple of (identity e.g. "GNGGA" or "PUBX00", msgID e.g. "GGA" or "UBX00")
+    :rtype: tuple
+    """
+
+    hdr = bytes(raw_data[1:32]).split(b",", 2)
+    identity = hdr[0].decode("utf-8", "replace")
+    if identity[0:1] == "P":  # proprietary
+        if identity[1:] in PROP_MSGIDS and len(hdr) > 1:  # e.g. PUBX,00
+            identity += hdr[1].decode("utf-8", "replace")
+        return identity, identity[1:]
+    return identity, identity[2:]  # standard
@@ -0,0 +1,346 @@
+"""
+NMEA replay engine.
+
+Replays NMEA sentences from a log file or stream, or from a sequence
+of NMEAMessage objects (e.g. synthesized by synthesize()), to an
+output stream, socket or pipe, paced either by the sentences'
+embedded 'time' attributes or at a fixed rate, with an optional
+speed multiplier e.g.
+
+    with open("nmealog.log", "rb") as stream:
+        replay = NMEAReplay(stream, sock, speed=100)
+        stats = replay.run()
+    print(stats["rate"], stats["target_rate"])
+
+Each sentence is scheduled at an offset from the start of the
+replay. Sentences due within 'interval' seconds of each other (e.g.
+all the sentences of one navigation epoch) are written together in
+a single write. As schedules are absolute rather than relative to
+the previous write, timing errors do not accumulate over the replay.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=invalid-name
+
+from datetime import datetime, time, timedelta, timezone
+from itertools import islice
+from threading import Event
+from time import perf_counter
+from pynmeagps.nmeamessage import NMEAMessage
+from pynmeagps.nmeareader import NMEAReader
+from pynmeagps.nmeaserializer import NMEASerializer
+from pynmeagps.nmeatypes_core import GET
+import pynmeagps.exceptions as nme
+
+BATCHSIZE = 64  # default maximum number of sentences per write
+INTERVAL = 0.001  # default batching interval in seconds
+SECSPERDAY = 86400
+RAWTYPES = (bytes, memoryview)  # raw sentences (memoryview from MMapNMEAReader)
+
+
+class NMEAReplay:
+    """
+    NMEAReplay class.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(
+        self,
+        source,
+        output,
+        *,
+        speed: float = 1.0,
+        rate: float = None,
+        interval: float = INTERVAL,
+        batchsize: int = BATCHSIZE,
+        **kwargs,
+    ):
+        """Constructor.
+
+        :param object source: binary input stream (e.g. log file) or NMEAReader,
+            or iterable of NMEAMessage, CompactNMEAMessage or
+            (raw_data, parsed_data) tuples
+        :param object output: output stream supporting a write(bytes) method
+            (e.g. file, pipe or serial port) or socket supporting sendall(bytes)
+        :param float speed: speed multiplier e.g. 100 = 100x real time,
+            0 = as fast as possible (1.0)
+        :param float rate: fixed rate in sentences per second at speed 1
+            (None = pace by embedded time attributes)
+        :param float interval: sentences due within this many seconds of
+            the first sentence in a batch are written together (0.001)
+        :param int batchsize: maximum number of sentences per write (64)
+        :param kwargs: keyword arguments for the NMEAReader used if the
+            source is a stream (e.g. nmeaonly, quitonerror)
+        :raises: NMEAParseError if speed, rate or batchsize are invalid
+        """
+
+        # pylint: disable=too-many-arguments
+
+        if speed < 0 or (rate is not None and rate <= 0) or batchsize < 1:
+            raise nme.NMEAParseError(
+                f"Invalid speed {speed}, rate {rate} or batch size {batchsize}."
+            )
+        if hasattr(source, "read") and not isinstance(source, NMEAReader):
+            source = NMEAReader(source, **kwargs)
+        self._source = source
+        self._write = getattr(output, "sendall", None) or output.write
+        self._flush = getattr(output, "flush", None)
+        self._speed = speed
+        self._rate = rate
+        self._interval = interval
+        self._batchsize = batchsize
+        self._serializer = NMEASerializer()
+        self._stopevent = Event()
+        self._start = 0.0
+        self._stats = _new_stats()
+
+    def run(self, limit: int = None) -> dict:
+        """
+        Replay sentences until the source is exhausted, 'limit'
+        sentences have been written, or stop() is called.
+
+        :param int limit: maximum number of sentences to write (None = no limit)
+        :return: replay statistics, as for the stats property
+        :rtype: dict
+        """
+
+        self._stopevent.clear()
+        self._stats = _new_stats()
+        paced = self._speed > 0
+        interval = self._interval
+        batchsize = self._batchsize
+        batch = []
+        nraw = 0  # number of raw sentences in batch
+        due0 = 0.0  # scheduled time of batch
+        self._start = perf_counter()
+        for data, due in islice(self._schedule(), limit):
+            if batch and (len(batch) >= batchsize or (paced and due - due0 > interval)):
+                if not self._send(batch, nraw, due0):
+                    return self.stats
+                batch = []
+                nraw = 0
+            if not batch:
+                due0 = due
+            batch.append(data)
+            if isinstance(data, RAWTYPES):
+                nraw += 1
+        if batch:
+            self._send(batch, nraw, due0)
+        return self.stats
+
+    def stop(self):
+        """
+        Stop replay (e.g. from another thread). Any batch awaiting its
+        scheduled time is not written.
+        """
+
+        self._stopevent.set()
+
+    def _schedule(self):
+        """
+        Generator of sentences and their scheduled times.
+
+        :return: generator of (data, due) tuples, where data is a raw sentence
+            or message and due is its scheduled time in seconds from start
+        :rtype: generator
+        """
+
+        speed = self._speed
+        if speed == 0:
+            for data, _ in self._items(False):
+                yield data, 0.0
+        elif self._rate is not None:
+            step = 1 / (self._rate * speed)
+            for i, (data, _) in enumerate(self._items(False)):
+                yield data, i * step
+        else:
+            logtime = 0.0  # elapsed time in log
+            last = None
+            for data, tim in self._items(True):
+                if tim is not None:
+                    secs = (
+                        tim.hour * 3600
+                        + tim.minute * 60
+                        + tim.second
+                        + tim.microsecond / 1e6
+                    )
+                    if last is None:
+                        last = secs
+                    else:
+                        delta = (secs - last) % SECSPERDAY  # allow for midnight
+                        if delta < SECSPERDAY / 2:  # ignore time going backwards
+                            logtime += delta
+                            last = secs
+                yield data, logtime / speed
+
+    def _items(self, needtime: bool):
+        """
+        Generator of sentences from source.
+
+        :param bool needtime: True = get time of each sentence, False = don't
+            (sentences from a stream are then not parsed)
+        :return: generator of (data, time) tuples, where data is a raw sentence
+            or message and time is a datetime.time or None
+        :rtype: generator
+        """
+
+        source = self._source
+        if isinstance(source, NMEAReader):
+            if needtime:
+                for raw, parsed in source:
+                    yield raw, _gettime(parsed)
+            else:
+                frames = source.read_frames(self._batchsize)
+                while frames:
+                    for raw in frames:
+                        yield raw, None
+                    frames = source.read_frames(self._batchsize)
+            return
+        for item in source:
+            if isinstance(item, tuple):
+                raw, parsed = item
+                yield raw, _gettime(parsed) if needtime else None
+            else:
+                yield item, _gettime(item) if needtime else None
+
+    def _send(self, batch: list, nraw: int, due: float) -> bool:
+        """
+        Wait until batch is due, then write it.
+
+        :param list batch: raw sentences and/or messages
+        :param int nraw: number of raw sentences in batch
+        :param float due: scheduled time in seconds from start
+        :return: True if batch was written, False if replay was stopped
+        :rtype: bool
+        """
+
+        stats = self._stats
+        if self._speed > 0:
+            wait = self._start + due - perf_counter()
+            if wait > 0 and self._stopevent.wait(wait):
+                return False
+            stats["maxlag"] = max(stats["maxlag"], perf_counter() - self._start - due)
+        elif self._stopevent.is_set():
+            return False
+        if nraw == 0:
+            data = self._serializer.serialize(batch)
+        elif nraw == len(batch):
+            data = b"".join(batch)
+        else:
+            data = b"".join(
+                item if isinstance(item, RAWTYPES) else item.serialize()
+                for item in batch
+            )
+        self._write(data)
+        if self._flush is not None:
+            self._flush()
+        stats["elapsed"] = perf_counter() - self._start
+        stats["target"] = due
+        stats["messages"] += len(batch)
+        stats["bytes"] += len(data)
+        stats["batches"] += 1
+        return True
+
+    @property
+    def stats(self) -> dict:
+        """
+        Replay statistics getter.
+
+        "elapsed" is the actual time from the start of the replay to
+        the last write, and "target" is the scheduled time of the last
+        write. "rate" and "target_rate" are the achieved and target
+        average rates in sentences per second over these durations
+        (None if the duration is zero). "maxlag" is the maximum delay
+        in seconds between the scheduled and actual time of a write.
+
+        :return: dict of messages, bytes, batches, elapsed, target,
+            rate, target_rate and maxlag
+        :rtype: dict
+        """
+
+        stats = dict(self._stats)
+        num = stats["messages"]
+        stats["rate"] = num / stats["elapsed"] if stats["elapsed"] > 0 else None
+        stats["target_rate"] = num / stats["target"] if stats["target"] > 0 else None
+        return stats
+
+
+def synthesize(
+    talker: str,
+    msgID: str,
+    msgmode: int = GET,
+    *,
+    count: int = None,
+    interval: float = 1.0,
+    start: datetime = None,
+    **kwargs,
+):
+    """
+    Generator of NMEAMessage objects constructed from keyword arguments,
+    with the 'time' and 'date' attributes of successive messages
+    advanced by 'interval' seconds (unless explicitly specified in
+    kwargs) e.g. for replay by NMEAReplay.
+
+    :param str talker: talker e.g. "GN"
+    :param str msgID: message ID e.g. "GGA"
+    :param int msgmode: message mode (0=GET, 1=SET, 2=POLL) (0)
+    :param int count: number of messages (None = unlimited)
+    :param float interval: interval between message times in seconds (1.0)
+    :param datetime start: time of first message (None = current UTC time)
+    :param kwargs: NMEAMessage keyword arguments e.g. lat=53.1, lon=-2.1
+    :return: generator of NMEAMessage
+    :rtype: generator
+    :raises: NMEAMessageError, NMEATypeError
+    """
+
+    # pylint: disable=too-many-arguments
+
+    if start is None:
+        start = datetime.now(timezone.utc)
+    i = 0
+    while count is None or i < count:
+        dtm = start + timedelta(seconds=i * interval)
+        yield NMEAMessage(
+            talker,
+            msgID,
+            msgmode,
+            **{"time": dtm.time(), "date": dtm.date(), **kwargs},
+        )
+        i += 1
+
+
+def _new_stats() -> dict:
+    """
+    Create empty replay statistics.
+
+    :return: dict of statistics
+    :rtype: dict
+    """
+
+    return {
+        "messages": 0,
+        "bytes": 0,
+        "batches": 0,
+        "elapsed": 0.0,
+        "target": 0.0,
+        "maxlag": 0.0,
+    }
+
+
+def _gettime(parsed: object) -> time:
+    """
+    Get time attribute of parsed message, if any.
+
+    :param object parsed: parsed message, or None or error string
+    :return: time or None
+    :rtype: datetime.time
+    """
+
+    tim = getattr(parsed, "time", None)
+    return tim if isinstance(tim, time) else None
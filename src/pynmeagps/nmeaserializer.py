@@ -0,0 +1,74 @@
+"""
+Batch NMEA serializer.
+
+Serializes batches of NMEAMessage or CompactNMEAMessage objects into
+a single bytes object, which can then be written to a stream (e.g. a
+file, socket or serial port) in a single call e.g.
+
+    serializer = NMEASerializer()
+    for batch in batches:
+        serializer.write(stream, batch)
+
+Each message's content is formatted once and the whole batch is
+joined and encoded in a single operation. The checksum of an
+NMEAMessage, calculated on construction, is reused rather than
+recalculated; the checksum of a CompactNMEAMessage is calculated
+from the same content which is output.
+
+NB: in CPython, a single join and encode of the batch is faster than
+encoding each sentence into a preallocated bytearray at a running
+offset, and much faster than recalculating every checksum over the
+bytes written, so no reusable output buffer is used.
+
+Created on 18 Oct 2026
+
+:author: semuadmin
+:copyright: SEMU Consulting © 2026
+:license: BSD 3-Clause
+"""
+
+# pylint: disable=protected-access
+
+from pynmeagps.nmeahelpers import xor_checksum
+from pynmeagps.nmeamessage import NMEAMessage
+
+
+class NMEASerializer:
+    """
+    NMEASerializer class.
+    """
+
+    def serialize(self, messages) -> bytes:
+        """
+        Serialize batch of messages.
+
+        :param iterable messages: NMEAMessage or CompactNMEAMessage objects
+        :return: serialized output, equivalent to the concatenated output
+            of each message's serialize() method
+        :rtype: bytes
+        """
+
+        sentences = []
+        for msg in messages:
+            content = msg._content()
+            if isinstance(msg, NMEAMessage):
+                cksum = msg._checksum
+            else:
+                cksum = xor_checksum(content.encode("utf-8"))
+            sentences.append(f"${content}*{cksum}\r\n")
+        return "".join(sentences).encode("utf-8")
+
+    def write(self, stream, messages) -> int:
+        """
+        Serialize batch of messages and write to stream in a single call.
+
+        :param stream stream: output stream supporting a write(bytes) method
+        :param iterable messages: NMEAMessage or CompactNMEAMessage objects
+        :return: number of bytes written
+        :rtype: int
+        """
+
+        data = self.serialize(messages)
+        if data:
+            stream.write(data)
+        return len(data)
@@ -2,7 +2,7 @@
 socket_stream class.
 
 A skeleton socket wrapper which provides basic stream-like
-read(bytes) and readline() methods.
+read(bytes), read1(bytes) and readline() methods.
 
 NB: this will read from a socket indefinitely. It is the
 responsibility of the calling application to monitor
@@ -22,6 +22,13 @@ from socket import socket
 class SocketStream:
     """
     socket stream class.
+
+    Data is received via socket.recv_into() into a preallocated
+    bytearray buffer, with read and write offsets tracking the
+    unconsumed data. Unconsumed data is moved to the start of the
+    buffer only when there is insufficient space at the end for
+    the next recv, and the buffer is only enlarged if the unconsumed
+    data itself exceeds the available capacity.
     """
 
     def __init__(self, sock: socket, **kwargs):
@@ -29,13 +36,15 @@ class SocketStream:
         Constructor.
 
         :param sock socket: socket object
-        :param int bufsize: (kwarg) internal buffer size (4096)
+        :param int bufsize: (kwarg) socket recv buffer size (4096)
         """
 
         self._socket = sock
         self._bufsize = kwargs.get("bufsize", 4096)
-        self._buffer = bytearray()
-        self._recv()  # populate initial buffer
+        self._buffer = bytearray(self._bufsize * 2)
+        self._view = memoryview(self._buffer)
+        self._rpos = 0  # offset of first unconsumed byte
+        self._wpos = 0  # offset of first free byte
 
     def _recv(self) -> bool:
         """
@@ -45,23 +54,54 @@ class SocketStream:
         :rtype: bool
         """
 
+        if len(self._buffer) - self._wpos < self._bufsize:
+            self._compact()
         try:
-            data = self._socket.recv(self._bufsize)
-            self._buffer += data
+            num = self._socket.recv_into(self._view[self._wpos :], self._bufsize)
         except (OSError, TimeoutError):
             return False
+        if num == 0:  # connection closed by peer
+            return False
+        self._wpos += num
         return True
 
+    def _compact(self):
+        """
+        Move unconsumed data to start of buffer, enlarging buffer
+        if there is still insufficient space for the next recv.
+        """
+
+        unread = self._wpos - self._rpos
+        if self._rpos:
+            self._buffer[0:unread] = self._buffer[self._rpos : self._wpos]
+            self._rpos = 0
+            self._wpos = unread
+        if len(self._buffer) - unread < self._bufsize:
+            self._view.release()  # buffer cannot be resized while exported
+            self._buffer.extend(bytes(len(self._buffer)))
+            self._view = memoryview(self._buffer)
+
+    def fileno(self) -> int:
+        """
+        Return file descriptor of wrapped socket (e.g. so the
+        stream can be waited on using select or a selector).
+
+        :return: file descriptor
+        :rtype: int
+        """
+
+        return self._socket.fileno()
+
     @property
     def buffer(self) -> bytearray:
         """
         Getter for buffer.
 
-        :return: buffer
+        :return: unconsumed contents of buffer
         :rtype: bytearray
         """
 
-        return self._buffer
+        return self._buffer[self._rpos : self._wpos]
 
     def read(self, num: int) -> bytes:
         """
@@ -74,12 +114,31 @@ class SocketStream:
         """
 
         # if at end of internal buffer, top it up from socket
-        while len(self._buffer) < num:
+        while self._wpos - self._rpos < num:
+            if not self._recv():
+                return b""
+        data = self._view[self._rpos : self._rpos + num].tobytes()
+        self._rpos += num
+        return data
+
+    def read1(self, num: int) -> bytes:
+        """
+        Read up to specified number of bytes from buffer, topping
+        up the buffer from the socket only if it is empty.
+        NB: always check length of return data.
+
+        :param int num: maximum number of bytes to read
+        :return: bytes read (which may be less than num)
+        :rtype: bytes
+        """
+
+        if self._rpos == self._wpos:
             if not self._recv():
                 return b""
-        data = self._buffer[:num]
-        self._buffer = self._buffer[num:]
-        return bytes(data)
+        end = min(self._rpos + num, self._wpos)
+        data = self._view[self._rpos : end].tobytes()
+        self._rpos = end
+        return data
 
     def readline(self) -> bytes:
         """
@@ -90,14 +149,18 @@ class SocketStream:
         :rtype: bytes
         """
 
-        line = b""
+        start = self._rpos
         while True:
-            data = self.read(1)
-            if len(data) == 1:
-                line += data
-                if line[-1:] == b"\n":  # LF
-                    break
-            else:
+            end = self._buffer.find(b"\n", start, self._wpos)  # LF
+            if end != -1:
+                end += 1
+                break
+            scanned = self._wpos - self._rpos  # no need to rescan this
+            if not self._recv():
+                end = self._wpos
                 break
+            start = self._rpos + scanned
 
+        line = self._view[self._rpos : end].tobytes()
+        self._rpos = end
         return line
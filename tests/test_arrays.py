@@ -0,0 +1,207 @@
+"""
+Columnar NumPy decoding tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import datetime
+import unittest
+
+from pynmeagps import NMEAReader, NMEAMessageError, decode_columns
+from pynmeagps import haversine, bearing, ecef2llh, llh2ecef
+from pynmeagps.nmeaarrays import (
+    bearing_array,
+    date2utc_array,
+    dmm2ddd_array,
+    ecef2llh_array,
+    haversine_array,
+    llh2ecef_array,
+    time2utc_array,
+    track_bearings,
+    track_distances,
+)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy not installed")
+class ArraysTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.sentences = [
+            b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,06,5.88,56.0,M,48.5,M,,*64\r\n",
+            b"$GNRMC,103607.00,A,5327.03942,N,10214.42462,W,0.046,,060321,,,A,V*0E\r\n",
+            b"$GPGGA,235959.99,3327.03942,S,10214.42462,E,2,12,0.55,-12.5,M,48.5,M,1.0,0123*74\r\n",
+            b"$GNGGA,,,,,,0,00,99.99,,,,,,*56\r\n",
+            b"$GNGGA,103608.00,5327.03942,N,00214.42462,W,1,06,5.88,56.0,M,48.5,M,,*00\r\n",
+            "$GNRMC,103608.00,A,5327.03942,S,10214.42462,E,0.046,,310221,,,A,V*00\r\n",
+            memoryview(
+                b"$GNRMC,103609.5,A,5327.03942,S,10214.42462,E,0.046,,290224,,,A,V*33\r\n"
+            ),
+            b"$PUBX,00,103607.00,5327.03942,N,00214.42462,W,104.461,G3,29,31,0.085,39.63,-0.007,,5.88,7.62,8.09,6,0,0*69\r\n",
+            b"$GNRMC,,%$\r\n",
+        ]
+
+    def tearDown(self):
+        pass
+
+    def testDecodeGGA(self):
+        res = decode_columns(self.sentences, "GGA")
+        self.assertEqual(len(res["time"]), 3)  # bad checksum ignored
+        self.assertEqual(res["lat"].dtype, np.float64)
+        np.testing.assert_allclose(res["lat"], [53.450657, -33.450657, np.nan])
+        np.testing.assert_allclose(res["lon"], [-2.2404103333, 102.2404103333, np.nan])
+        self.assertEqual(res["quality"].tolist(), [1, 2, 0])
+        self.assertEqual(res["quality"].dtype, np.int64)
+        self.assertEqual(res["diffStation"].dtype, np.float64)  # empty values
+        self.assertEqual(res["diffStation"][1], 123)
+        self.assertEqual(res["NS"].tolist(), ["N", "S", ""])
+        self.assertEqual(res["time"][0], np.timedelta64(38167000000, "us"))
+        self.assertEqual(res["time"][1], np.timedelta64(86399990000, "us"))
+        self.assertTrue(np.isnat(res["time"][2]))
+
+    def testDecodeRMC(self):
+        res = decode_columns(self.sentences, "GNRMC", validate=0)
+        self.assertEqual(len(res["time"]), 3)
+        self.assertEqual(
+            res["date"].tolist(),
+            [
+                datetime.date(2021, 3, 6),
+                None,  # invalid date
+                datetime.date(2024, 2, 29),
+            ],
+        )
+        np.testing.assert_allclose(res["lat"], [53.450657, -53.450657, -53.450657])
+        np.testing.assert_allclose(
+            res["lon"], [-102.2404103333, 102.2404103333, 102.2404103333]
+        )
+        stamp = res["date"] + res["time"]
+        self.assertEqual(stamp[2], np.datetime64("2024-02-29T10:36:09.500000"))
+
+    def testDecodeTalker(self):  # talker-prefixed msgID only decodes that talker
+        res = decode_columns(self.sentences, "GNGGA")
+        np.testing.assert_allclose(res["lat"], [53.450657, np.nan])
+        res = decode_columns(self.sentences, "GPGGA")
+        self.assertEqual(res["quality"].tolist(), [2])
+        self.assertEqual(len(decode_columns(self.sentences, "GLGGA")["lat"]), 0)
+        self.assertEqual(len(decode_columns(self.sentences, "UBX00")["lat"]), 1)
+
+    def testDecodeMatchesParse(self):  # same values as NMEAMessage
+        res = decode_columns(self.sentences, "PUBX00")
+        msg = NMEAReader.parse(self.sentences[7])
+        for key, arr in res.items():
+            val = getattr(msg, key)
+            if isinstance(val, float):
+                self.assertAlmostEqual(arr[0], val, 9)
+            elif isinstance(val, datetime.time):
+                self.assertEqual(arr[0], np.timedelta64(38167000000, "us"))
+            elif val == "":
+                self.assertTrue(np.isnan(arr[0]))
+            else:
+                self.assertEqual(arr[0], val)
+
+    def testDecodeEMPTY(self):
+        res = decode_columns([], "RMC")
+        self.assertEqual(len(res["lat"]), 0)
+        self.assertEqual(res["lat"].dtype, np.float64)
+        self.assertEqual(res["date"].dtype, np.dtype("datetime64[D]"))
+
+    def testDecodeBADMSGID(self):
+        EXPECTED_ERROR = "Unknown msgID XYZ msgmode GET."
+        with self.assertRaises(NMEAMessageError) as context:
+            decode_columns(self.sentences, "XYZ")
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testDMM2DDDArray(self):
+        res = dmm2ddd_array(np.array([5314.12345, 10214.42462, 0.0, np.nan]))
+        np.testing.assert_allclose(res, [53.2353908333, 102.2404103333, 0.0, np.nan])
+
+    def testTime2UTCArray(self):
+        res = time2utc_array(np.array([81123.0, 81123.5, 246000.0, 86000.0, np.nan]))
+        self.assertEqual(res[0], np.timedelta64(29483000000, "us"))
+        self.assertEqual(res[1], np.timedelta64(29483500000, "us"))
+        self.assertTrue(np.isnat(res[2:]).all())
+
+    def testDate2UTCArray(self):
+        res = date2utc_array(np.array([120320.0, 311269.0, 10168.0, 290223.0, 320.5]))
+        self.assertEqual(
+            res.tolist(),
+            [
+                datetime.date(2020, 3, 12),
+                datetime.date(1969, 12, 31),
+                datetime.date(2068, 1, 1),
+                None,
+                None,
+            ],
+        )
+        res = date2utc_array(np.array([31220.0]), "DM")
+        self.assertEqual(res[0], np.datetime64("2020-03-12"))
+
+    def _points(self) -> tuple:
+        lat = np.linspace(-89.5, 89.5, 41)
+        lon = np.linspace(-179.5, 179.5, 41)
+        grid = np.meshgrid(lat, lon)
+        lat1, lon1 = grid[0].ravel(), grid[1].ravel()
+        lat2, lon2 = lat1[::-1] * 0.3, np.roll(lon1, 7)
+        lat2[:10], lon2[:10] = lat1[:10], lon1[:10]  # coincident points
+        lat2[10:20], lon2[10:20] = lat1[10:20] + 1e-6, lon1[10:20]  # close points
+        return lat1, lon1, lat2, lon2
+
+    def testHaversineArray(self):  # accuracy against scalar helper
+        lat1, lon1, lat2, lon2 = self._points()
+        res = haversine_array(lat1, lon1, lat2, lon2)
+        for i, dist in enumerate(res):
+            self.assertAlmostEqual(
+                dist, haversine(lat1[i], lon1[i], lat2[i], lon2[i]), 8
+            )
+        res = haversine_array([51.23, 51.23], [-2.41, -2.41], 34.205, 39.1, 6371)
+        self.assertAlmostEqual(res[1], haversine(51.23, -2.41, 34.205, 39.1, 6371), 8)
+
+    def testBearingArray(self):  # accuracy against scalar helper
+        lat1, lon1, lat2, lon2 = self._points()
+        res = bearing_array(lat1, lon1, lat2, lon2)
+        for i, brng in enumerate(res):
+            self.assertAlmostEqual(brng, bearing(lat1[i], lon1[i], lat2[i], lon2[i]), 8)
+
+    def testTrack(self):
+        lat = [53.0, 53.001, 53.002, 53.002]
+        lon = [-2.0, -2.0, -2.0, -2.001]
+        res = track_distances(lat, lon)
+        self.assertEqual(len(res), 3)
+        total = sum(haversine(lat[i], lon[i], lat[i + 1], lon[i + 1]) for i in range(3))
+        self.assertAlmostEqual(res.sum(), total, 9)
+        res = track_bearings(lat, lon)
+        np.testing.assert_allclose(res, [0.0, 0.0, 270.0003994], atol=1e-6)
+        self.assertEqual(len(track_distances([53.0], [-2.0])), 0)
+
+    def testLLH2ECEFArray(self):  # accuracy against scalar helper
+        lat1, lon1, _, _ = self._points()
+        hgt = np.linspace(-500, 20000000, len(lat1))
+        res = np.stack(llh2ecef_array(lat1, lon1, hgt), axis=1)
+        for i, xyz in enumerate(res):
+            np.testing.assert_allclose(
+                xyz, llh2ecef(lat1[i], lon1[i], hgt[i]), atol=1e-6
+            )
+
+    def testECEF2LLHArray(self):  # accuracy against scalar helper
+        lat1, lon1, _, _ = self._points()
+        hgt = np.linspace(-500, 20000000, len(lat1))
+        x, y, z = llh2ecef_array(lat1, lon1, hgt)
+        x[:3], y[:3], z[:3] = [0.0, 1000.0, 50000.0], 0.0, [0.0, 0.0, -10.0]  # core
+        res = np.stack(ecef2llh_array(x, y, z), axis=1)
+        for i, llh in enumerate(res):
+            np.testing.assert_allclose(llh, ecef2llh(x[i], y[i], z[i]), atol=1e-8)
+        np.testing.assert_allclose(res[3:, 0], lat1[3:], atol=1e-8)
+        np.testing.assert_allclose(res[3:, 2], hgt[3:], atol=1e-5)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
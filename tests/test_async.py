@@ -0,0 +1,185 @@
+"""
+Asynchronous reader tests for pynmeagps - uses a local
+asyncio TCP server to multiplex many NMEA feeds on one event loop.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import asyncio
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import (
+    AsyncNMEAReader,
+    NMEAReader,
+    NMEAParseError,
+    ERR_IGNORE,
+    ERR_RAISE,
+)
+
+
+class DummyAsyncStream:
+    """
+    Dummy asynchronous stream which returns data in fixed size chunks.
+    """
+
+    def __init__(self, data: bytes, chunk: int = 7):
+        self._data = data
+        self._chunk = chunk
+
+    async def read(self, num: int) -> bytes:
+        num = min(num, self._chunk)
+        data, self._data = self._data[:num], self._data[num:]
+        await asyncio.sleep(0)
+        return data
+
+
+class AsyncTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            self.dataNMEA4 = stream.read()
+        with open(os.path.join(dirname, "pygpsdata-mixed.log"), "rb") as stream:
+            self.dataMIXED = stream.read()
+
+    def tearDown(self):
+        pass
+
+    async def _serve_and_read(self, data: bytes, numclients: int) -> list:
+        """
+        Start local TCP server which sends data to each client, then
+        read from numclients concurrent connections on the same loop.
+        """
+
+        async def handle(_, writer):
+            writer.write(data)
+            await writer.drain()
+            writer.close()
+
+        async def client(port):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            res = []
+            async for _, parsed in AsyncNMEAReader(reader, bufsize=1024):
+                res.append(str(parsed))
+            writer.close()
+            return res
+
+        server = await asyncio.start_server(handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            return await asyncio.gather(*(client(port) for _ in range(numclients)))
+        finally:
+            server.close()
+            await server.wait_closed()
+
+    def testAsyncMultiplex(self):  # many concurrent TCP feeds on one event loop
+        results = asyncio.run(self._serve_and_read(self.dataNMEA4, 200))
+        self.assertEqual(len(results), 200)
+        for res in results:
+            self.assertEqual(len(res), 48)
+            self.assertEqual(res, results[0])
+        self.assertEqual(
+            results[0],
+            [str(parsed) for _, parsed in NMEAReader(BytesIO(self.dataNMEA4))],
+        )
+
+    def testAsyncMixed(self):  # non-NMEA data ignored, small read chunks
+        async def run():
+            return [
+                parsed.identity
+                async for _, parsed in AsyncNMEAReader(DummyAsyncStream(self.dataMIXED))
+            ]
+
+        res = asyncio.run(run())
+        self.assertEqual(len(res), 15)
+        self.assertEqual(
+            res, [parsed.identity for _, parsed in NMEAReader(BytesIO(self.dataMIXED))]
+        )
+
+    def testAsyncNMEAONLY(self):  # non-NMEA data raises error
+        async def run():
+            nmr = AsyncNMEAReader(
+                DummyAsyncStream(self.dataMIXED), nmeaonly=True, quitonerror=ERR_RAISE
+            )
+            async for _ in nmr:
+                pass
+
+        with self.assertRaises(NMEAParseError) as context:
+            asyncio.run(run())
+        self.assertTrue("Unknown data header" in str(context.exception))
+
+    def testAsyncBadChecksum(self):  # bad checksum ignored and returned as error string
+        async def run():
+            nmr = AsyncNMEAReader(
+                DummyAsyncStream(
+                    b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*72\r\n"
+                    + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+                ),
+                quitonerror=ERR_IGNORE,
+            )
+            return [await nmr.read(), await nmr.read(), await nmr.read()]
+
+        res = asyncio.run(run())
+        self.assertEqual(res[0][1], "Message GNDTM invalid checksum 72 - should be 71.")
+        self.assertEqual(res[1][1].identity, "GNGLL")
+        self.assertEqual(res[2], (None, None))
+
+    def testAsyncFilter(self):  # message identity filter
+        async def run(filterraw):
+            nmr = AsyncNMEAReader(
+                DummyAsyncStream(self.dataMIXED),
+                msgfilter={"GNGGA"},
+                filterraw=filterraw,
+            )
+            return [parsed async for _, parsed in nmr], nmr.skipped
+
+        res, skipped = asyncio.run(run(False))
+        self.assertEqual([parsed.identity for parsed in res], ["GNGGA", "GNGGA"])
+        self.assertEqual(skipped["GNGSA"], 8)
+        res, _ = asyncio.run(run(True))
+        self.assertEqual(len(res), 15)
+        self.assertEqual(len([parsed for parsed in res if parsed is not None]), 2)
+
+    def testAsyncInstrument(self):  # instrumentation counters and timings
+        async def run():
+            nmr = AsyncNMEAReader(DummyAsyncStream(self.dataMIXED), instrument=True)
+            return [parsed async for _, parsed in nmr], nmr.stats
+
+        res, stats = asyncio.run(run())
+        nmr = NMEAReader(BytesIO(self.dataMIXED), instrument=True)
+        expected = [parsed for _, parsed in nmr]
+        self.assertEqual(len(res), len(expected))
+        for key in ("messages", "bytes", "discarded", "errors"):
+            self.assertEqual(stats[key], nmr.stats[key])
+        self.assertGreater(stats["ns"]["read"], 0)
+
+    def testAsyncNonCRLF(self):  # sentence not CRLF terminated skipped
+        async def run():
+            nmr = AsyncNMEAReader(
+                DummyAsyncStream(
+                    b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\n"
+                    + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+                )
+            )
+            return [parsed.identity async for _, parsed in nmr]
+
+        self.assertEqual(asyncio.run(run()), ["GNGLL"])
+        self.assertNotIsInstance(AsyncNMEAReader(DummyAsyncStream(b"")), NMEAReader)
+
+    def testAsyncSyncIter(self):  # synchronous iteration not supported
+        nmr = AsyncNMEAReader(DummyAsyncStream(b""))
+        with self.assertRaises(TypeError):
+            iter(nmr)
+        with self.assertRaises(TypeError):
+            next(nmr)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,217 @@
+"""
+TCP broadcaster tests for pynmeagps - uses localhost loopback
+connections.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import asyncio
+import json
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import (
+    DISCONNECT,
+    DROPNEWEST,
+    DROPOLDEST,
+    AsyncNMEAReader,
+    NMEABroadcaster,
+    NMEAParseError,
+    NMEAReader,
+)
+
+GLL = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+
+
+class GatedAsyncStream:
+    """
+    Dummy asynchronous stream which returns data once the gate is open.
+    """
+
+    def __init__(self, data: bytes, chunk: int = 4096):
+        self._data = data
+        self._chunk = chunk
+        self.gate = asyncio.Event()
+
+    async def read(self, num: int) -> bytes:
+        await self.gate.wait()
+        num = min(num, self._chunk)
+        data, self._data = self._data[:num], self._data[num:]
+        await asyncio.sleep(0)
+        return data
+
+
+async def connect(broadcaster: NMEABroadcaster, mode: str, num: int) -> list:
+    """
+    Open client connections and wait until they are all registered.
+    """
+
+    host, port = broadcaster.addresses[mode]
+    expected = broadcaster.stats["connections"] + num
+    conns = [await asyncio.open_connection(host, port) for _ in range(num)]
+    while broadcaster.stats["connections"] < expected:
+        await asyncio.sleep(0.01)
+    return conns
+
+
+async def readall(conns: list) -> list:
+    """
+    Read all data from client connections until EOF.
+    """
+
+    data = await asyncio.gather(*(reader.read() for reader, _ in conns))
+    for _, writer in conns:
+        writer.close()
+    return data
+
+
+class BroadcasterTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            self.dataNMEA4 = stream.read()
+
+    def tearDown(self):
+        pass
+
+    def testFanout(self):  # raw and JSON output to many clients
+        async def run():
+            stream = GatedAsyncStream(self.dataNMEA4 * 5)
+            bcast = NMEABroadcaster(stream, host="127.0.0.1", port=0, jsonport=0)
+            await bcast.start()
+            rawconns = await connect(bcast, "raw", 100)
+            jsonconns = await connect(bcast, "json", 2)
+            stream.gate.set()
+            task = asyncio.ensure_future(bcast.serve())
+            rawdata = await readall(rawconns)
+            jsondata = await readall(jsonconns)
+            return rawdata, jsondata, await task
+
+        rawdata, jsondata, stats = asyncio.run(run())
+        self.assertEqual(rawdata, [self.dataNMEA4 * 5] * 100)
+        lines = jsondata[0].decode("utf-8").splitlines()
+        self.assertEqual(jsondata[1], jsondata[0])
+        self.assertEqual(len(lines), 240)
+        expected = [str(parsed) for _, parsed in NMEAReader(BytesIO(self.dataNMEA4))]
+        msg = json.loads(lines[1])
+        self.assertEqual(msg["identity"], "GNRMC")
+        self.assertEqual(msg["date"], "2021-03-06")
+        self.assertEqual(msg["time"], "10:36:07")
+        self.assertEqual(len(msg), expected[1].count("=") + 1)
+        self.assertEqual(stats["messages"], 240)
+        self.assertEqual(stats["connections"], 102)
+        self.assertEqual((stats["dropped"], stats["disconnects"]), (0, 0))
+        self.assertEqual(stats["clients"], [])
+
+    def testSyncSource(self):  # synchronous stream read in worker thread
+        async def run():
+            bcast = NMEABroadcaster(
+                BytesIO(self.dataNMEA4 + b"$GNGLL,bad*00\r\n"),
+                host="127.0.0.1",
+                port=0,
+                jsonport=0,
+                compact=True,
+            )
+            await bcast.start()
+            rawconns = await connect(bcast, "raw", 3)
+            jsonconns = await connect(bcast, "json", 1)
+            task = asyncio.ensure_future(bcast.serve())
+            rawdata = await readall(rawconns)
+            jsondata = await readall(jsonconns)
+            return rawdata, jsondata, await task
+
+        rawdata, jsondata, stats = asyncio.run(run())
+        self.assertEqual(rawdata[2], self.dataNMEA4 + b"$GNGLL,bad*00\r\n")
+        self.assertEqual(len(jsondata[0].splitlines()), 48)
+        self.assertEqual((stats["messages"], stats["errors"]), (49, 1))
+
+    def testFilter(self):  # reader msgfilter and parsing options applied
+        async def run():
+            bcast = NMEABroadcaster(
+                BytesIO(self.dataNMEA4),
+                host="127.0.0.1",
+                port=0,
+                jsonport=0,
+                msgfilter={"GGA", "GNRMC"},
+                compact=True,
+            )
+            await bcast.start()
+            rawconns = await connect(bcast, "raw", 1)
+            jsonconns = await connect(bcast, "json", 1)
+            task = asyncio.ensure_future(bcast.serve())
+            rawdata = await readall(rawconns)
+            jsondata = await readall(jsonconns)
+            return rawdata[0], jsondata[0], await task
+
+        rawdata, jsondata, stats = asyncio.run(run())
+        raws = rawdata.splitlines()
+        self.assertEqual([raw[:6] for raw in raws], [b"$GNRMC", b"$GNGGA"])
+        msgs = [json.loads(line) for line in jsondata.splitlines()]
+        self.assertEqual([msg["identity"] for msg in msgs], ["GNRMC", "GNGGA"])
+        self.assertEqual(msgs[1]["numSV"], 6)
+        self.assertEqual(stats["messages"], 2)
+
+    def testPolicy(self):  # full client queues
+        async def run(policy):
+            bcast = NMEABroadcaster(
+                AsyncNMEAReader(GatedAsyncStream(b"")),
+                host="127.0.0.1",
+                port=0,
+                queuesize=4,
+                policy=policy,
+            )
+            await bcast.start()
+            conns = await connect(bcast, "raw", 1)
+            for i in range(10):
+                bcast.broadcast(GLL.replace(b"223232", f"{i:06d}".encode()))
+            stats = bcast.stats
+            bcast.stop()
+            await bcast.close()
+            return (await readall(conns))[0], stats
+
+        data, stats = asyncio.run(run(DROPNEWEST))
+        self.assertEqual(data.count(b"$"), 4)
+        self.assertIn(b"000000", data)
+        self.assertEqual(stats["dropped"], 6)
+        self.assertEqual(stats["clients"][0]["dropped"], 6)
+        self.assertEqual(stats["clients"][0]["maxqueue"], 4)
+        self.assertEqual(stats["clients"][0]["queued"], 4)
+        data, stats = asyncio.run(run(DROPOLDEST))
+        self.assertEqual(data.count(b"$"), 4)
+        self.assertIn(b"000009", data)
+        self.assertNotIn(b"000005", data)
+        self.assertEqual(stats["dropped"], 6)
+        data, stats = asyncio.run(run(DISCONNECT))
+        self.assertEqual(data, b"")
+        self.assertEqual((stats["dropped"], stats["disconnects"]), (0, 1))
+        self.assertEqual(stats["clients"], [])
+
+    def testStop(self):  # stopped while waiting for source
+        async def run():
+            bcast = NMEABroadcaster(GatedAsyncStream(b""), host="127.0.0.1", port=0)
+            task = asyncio.ensure_future(bcast.serve())
+            await asyncio.sleep(0.05)
+            conns = await connect(bcast, "raw", 1)
+            bcast.stop()
+            stats = await task
+            return (await readall(conns))[0], stats
+
+        data, stats = asyncio.run(run())
+        self.assertEqual(data, b"")
+        self.assertEqual(stats["connections"], 1)
+
+    def testInvalid(self):  # invalid parameters
+        for kwargs in ({}, {"port": 0, "queuesize": 0}, {"port": 0, "policy": "x"}):
+            with self.assertRaises(NMEAParseError):
+                NMEABroadcaster(BytesIO(), **kwargs)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Bulk log file parser tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import tempfile
+import unittest
+
+from pynmeagps import available_cpus, parse_file, split_file, NMEAReader, ERR_IGNORE
+
+
+def latlon(_, parsed):  # module level so it can be pickled
+    return (parsed.identity, getattr(parsed, "lat", None))
+
+
+class BulkTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        data = b""
+        for log in ("pygpsdata-nmea4.log", "pygpsdata-mixed.log"):
+            with open(os.path.join(dirname, log), "rb") as stream:
+                data += stream.read()
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "nmeabulk.log")
+        with open(self.path, "wb") as stream:
+            stream.write(data * 20)
+        with open(self.path, "rb") as stream:
+            self.expected = [
+                (raw, str(parsed))
+                for raw, parsed in NMEAReader(stream, quitonerror=ERR_IGNORE)
+            ]
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def testSplitFile(self):
+        size = os.path.getsize(self.path)
+        chunks = split_file(self.path, 1000)
+        self.assertGreater(len(chunks), 10)
+        self.assertEqual(chunks[0][0], 0)
+        self.assertEqual(chunks[-1][1], size)
+        with open(self.path, "rb") as stream:
+            data = stream.read()
+        for (_, end), (start, _) in zip(chunks, chunks[1:]):
+            self.assertEqual(end, start)
+            self.assertEqual(data[start - 2 : start + 1], b"\r\n$")
+        self.assertEqual(split_file(self.path, size * 2), [(0, size)])
+
+    def testSplitFileNoBoundary(self):  # no sentence boundary after target offset
+        path = os.path.join(self.tmpdir.name, "nmeabulk2.log")
+        with open(path, "wb") as stream:
+            stream.write(b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n" + b"x" * 200000)
+        self.assertEqual(split_file(path, 100), [(0, 200036)])
+
+    def testAvailableCPUs(self):  # default number of workers
+        self.assertTrue(1 <= available_cpus() <= os.cpu_count())
+        if hasattr(os, "sched_getaffinity"):
+            self.assertEqual(available_cpus(), len(os.sched_getaffinity(0)))
+
+    def testParseFileInProcess(self):
+        res = [
+            (raw, str(parsed))
+            for raw, parsed in parse_file(
+                self.path, workers=1, chunksize=2000, quitonerror=ERR_IGNORE
+            )
+        ]
+        self.assertEqual(res, self.expected)
+
+    def testParseFileOrdered(self):
+        res = [
+            (raw, str(parsed))
+            for raw, parsed in parse_file(
+                self.path, workers=2, chunksize=2000, quitonerror=ERR_IGNORE
+            )
+        ]
+        self.assertEqual(res, self.expected)
+
+    def testParseFileUnordered(self):
+        res = [
+            (raw, str(parsed))
+            for raw, parsed in parse_file(
+                self.path,
+                workers=2,
+                ordered=False,
+                chunksize=2000,
+                quitonerror=ERR_IGNORE,
+            )
+        ]
+        self.assertEqual(sorted(res), sorted(self.expected))
+
+    def testParseFileFunc(self):
+        res = list(
+            parse_file(
+                self.path,
+                workers=2,
+                chunksize=5000,
+                func=latlon,
+                msgfilter={"GGA"},
+            )
+        )
+        self.assertEqual(len(res), 60)
+        self.assertEqual(res[0], ("GNGGA", 53.450657))
+
+    def testParseFileClose(self):  # generator closed before all chunks parsed
+        gen = parse_file(self.path, workers=2, chunksize=1000, quitonerror=ERR_IGNORE)
+        raw, _ = next(gen)
+        self.assertEqual(raw, self.expected[0][0])
+        gen.close()
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
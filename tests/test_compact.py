@@ -0,0 +1,130 @@
+"""
+Compact message class tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import pickle
+import unittest
+
+from pynmeagps import (
+    CompactNMEAMessage,
+    GSVAssembler,
+    NMEAMessage,
+    NMEAMessageError,
+    NMEAParseError,
+    NMEAReader,
+    NMEATypeError,
+    ERR_IGNORE,
+    VALMSGID,
+    VALNONE,
+    compact_class,
+    compact_message,
+)
+
+GGA = b"$GNGGA,103607.00,5327.03942,S,10214.42462,W,1,06,4.34,24.9,M,0.0,M,,*4B\r\n"
+GSV = b"$GPGSV,3,1,11,01,06,014,08,12,43,207,28,14,06,049,,15,44,171,23,1*6B\r\n"
+PUBX = b"$PUBX,03,5,23,-,014,06,08,000,12,U,207,43,28,009*59\r\n"
+
+
+class CompactTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testCompact(self):  # compact message attributes and public API
+        res = NMEAReader.parse(GGA, compact=True)
+        self.assertIsInstance(res, CompactNMEAMessage)
+        self.assertEqual(type(res).__name__, "NMEAGGA")
+        self.assertEqual((res.lat, res.lon), (-53.450657, -102.2404103333))
+        self.assertEqual(res.numSV, 6)
+        self.assertEqual(res.identity, "GNGGA")
+        self.assertEqual((res.talker, res.msgID, res.msgmode), ("GN", "GGA", 0))
+        self.assertEqual(res.checksum, "4B")
+        self.assertEqual(res.serialize(), GGA)
+        self.assertEqual(res.payload, NMEAReader.parse(GGA).payload)
+        self.assertEqual(str(res), str(NMEAReader.parse(GGA)))
+        self.assertEqual(str(eval(repr(res))), str(res))
+        self.assertFalse(hasattr(res, "__dict__"))
+        self.assertFalse(hasattr(res, "foo"))
+
+    def testCompactImmutable(self):  # compact messages are immutable
+        res = NMEAReader.parse(GGA, compact=True)
+        with self.assertRaises(NMEAMessageError):
+            res.lat = 0
+        with self.assertRaises(NMEAMessageError):
+            res.foo = 0
+
+    def testCompactGroups(self):  # repeating groups and legacy suffixed names
+        res = NMEAReader.parse(GSV, compact=True)
+        self.assertEqual(res.group_sv.svid, (1, 12, 14, 15))
+        self.assertEqual(res.svid_04, 15)
+        self.assertEqual(res.cno_03, "")
+        self.assertFalse(hasattr(res, "svid_05"))
+        res = NMEAReader.parse(PUBX, compact=True)
+        self.assertEqual(type(res).__name__, "NMEAUBX03")
+        self.assertEqual(res.identity, "PUBX03")
+        self.assertEqual(res.cno_02, 28)
+        self.assertEqual(str(res), str(NMEAReader.parse(PUBX)))
+        self.assertIn("svid_02=12, status_02=U, azi_02=207.0", str(res))
+
+    def testCompactClass(self):  # one class per payload definition
+        cls = compact_class("GGA", 0, [])
+        self.assertIs(type(NMEAReader.parse(GGA, compact=True)), cls)
+        self.assertIs(compact_class("GGA", 0, []), cls)
+        self.assertIn("lat", cls.__slots__)
+        self.assertIsNot(
+            compact_class("UBX", 0, ["00"]), compact_class("UBX", 0, ["03"])
+        )
+
+    def testCompactPickle(self):  # pickle generated classes
+        res = NMEAReader.parse(GSV, compact=True)
+        res2 = pickle.loads(pickle.dumps(res))
+        self.assertIs(type(res2), type(res))
+        self.assertEqual(str(res2), str(res))
+
+    def testCompactErrors(self):  # invalid messages
+        with self.assertRaises(NMEAMessageError):
+            compact_message("XX", "GGA", 0, [])
+        with self.assertRaises(NMEAParseError):
+            NMEAReader.parse(
+                b"$GNXXX,5327.04319,S,00214.41396,E,223232.00,A,A*77\r\n",
+                validate=VALMSGID,
+                compact=True,
+            )
+        with self.assertRaises(NMEATypeError):
+            NMEAReader.parse(
+                b"$GNRMC,103607.00,A,5327.03942,N,10214.42462,W,0.0X6,,060321,,,A,V*00\r\n",
+                validate=VALNONE,
+                compact=True,
+            )
+
+    def testCompactStream(self):  # compact messages equivalent to NMEAMessage
+        dirname = os.path.dirname(__file__)
+        for log in ("pygpsdata-nmea4.log", "pygpsdata-mixed.log"):
+            with open(os.path.join(dirname, log), "rb") as stream:
+                expected = list(NMEAReader(stream, quitonerror=ERR_IGNORE))
+            with open(os.path.join(dirname, log), "rb") as stream:
+                res = list(NMEAReader(stream, compact=True, quitonerror=ERR_IGNORE))
+            self.assertEqual([str(p) for _, p in res], [str(p) for _, p in expected])
+            for (_, parsed), (_, exp) in zip(res, expected):
+                if exp is not None:
+                    self.assertEqual(parsed.serialize(), exp.serialize())
+
+    def testCompactGSVAssembler(self):  # compact messages in GSVAssembler
+        tables = GSVAssembler().process(
+            NMEAReader.parse(b"$GAGSV,1,1,00,7*73\r\n", compact=True)
+        )
+        self.assertTrue(tables[0].complete)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -9,7 +9,7 @@ Created on 4 Mar 2021
 """
 
 import unittest
-from pynmeagps import NMEAMessage, GET, SET, POLL, NMEAMessageError
+from pynmeagps import NMEAMessage, GET, SET, POLL, NMEAMessageError, NMEATypeError
 
 
 class FillTest(unittest.TestCase):
@@ -178,6 +178,38 @@ class FillTest(unittest.TestCase):
             NMEAMessage("GN", "UBX", GET, payload=["08", 0, 0])
         self.assertTrue(EXPECTED_ERROR in str(context.exception))
 
+    def testFill_PUBX03(self):  # test GET constructor with variable length group
+        msg = NMEAMessage("P", "UBX", GET, msgId="03", numSv=2, svid_01=5, svid_02=7)
+        self.assertEqual(
+            str(msg),
+            "<NMEA(PUBX03, msgId=03, numSv=2, svid_01=5, status_01=, azi_01=0.0, ele_01=0.0, cno_01=0, lck_01=0, svid_02=7, status_02=, azi_02=0.0, ele_02=0.0, cno_02=0, lck_02=0)>",
+        )
+        self.assertEqual(
+            msg.payload,
+            [
+                "03",
+                "2",
+                "5",
+                "",
+                "0.0",
+                "0.0",
+                "0",
+                "0",
+                "7",
+                "",
+                "0.0",
+                "0.0",
+                "0",
+                "0",
+            ],
+        )
+
+    def testFill_BADTYPE(self):  # test GET constructor with incorrect lat type
+        EXPECTED_ERROR = "Incorrect type for attribute lat in msgID GLL."
+        with self.assertRaises(NMEATypeError) as context:
+            NMEAMessage("GN", "GLL", GET, lat="X")
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
@@ -0,0 +1,160 @@
+"""
+Epoch builder tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import asyncio
+import datetime
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import AsyncNMEAReader, EpochBuilder, NMEAFix, NMEAReader
+
+RMC1 = b"$GNRMC,103607.00,A,5327.03942,N,00214.42462,W,0.046,,060321,,,A,V*0F\r\n"
+GGA1 = b"$GNGGA,103607.00,5327.03942,N,00214.42462,W,1,06,5.88,56.0,M,48.5,M,,*64\r\n"
+GSA1 = b"$GNGSA,A,3,23,24,20,12,,,,,,,,,9.62,5.88,7.62,1*0C\r\n"
+GSA2 = b"$GNGSA,A,3,66,76,,,,,,,,,,,9.62,5.88,7.62,2*08\r\n"
+GSABAD = b"$GNGSA,A,3,2x,24,20,12,,,,,,,,,9.62,5.88,7.62,1*47\r\n"
+RMC2 = b"$GNRMC,103608.00,A,5327.03942,N,00214.42462,W,0.046,,060321,,,A,V*00\r\n"
+ZDA = b"$GNZDA,103607.00,07,03,2021,00,00*7E\r\n"
+GSV = b"$GPGSV,3,1,11,01,06,014,08,12,43,207,28,14,06,049,,15,44,171,23,1*6B\r\n"
+
+
+class DummyAsyncStream:
+    """
+    Dummy asynchronous stream which returns data in fixed size chunks.
+    """
+
+    def __init__(self, data: bytes, chunk: int = 64):
+        self._data = data
+        self._chunk = chunk
+
+    async def read(self, num: int) -> bytes:
+        num = min(num, self._chunk)
+        data, self._data = self._data[:num], self._data[num:]
+        await asyncio.sleep(0)
+        return data
+
+
+class EpochBuilderTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            self.dataNMEA4 = stream.read()
+
+    def tearDown(self):
+        pass
+
+    def testTimeChange(self):  # epoch emitted when time changes
+        epb = EpochBuilder()
+        fixes = []
+        for msg in (RMC1, GGA1, GSA1, GSA2, GSV):
+            fixes += epb.process(NMEAReader.parse(msg))
+        self.assertEqual(fixes, [])
+        fixes = epb.process(NMEAReader.parse(RMC2))
+        self.assertEqual(len(fixes), 1)
+        fix = fixes[0]
+        self.assertEqual(fix.time, datetime.time(10, 36, 7))
+        self.assertEqual(fix.date, datetime.date(2021, 3, 6))
+        self.assertEqual((fix.lat, fix.lon), (53.450657, -2.2404103333))
+        self.assertEqual((fix.alt, fix.quality, fix.numSV), (56.0, 1, 6))
+        self.assertEqual((fix.PDOP, fix.HDOP, fix.VDOP), (9.62, 5.88, 7.62))
+        self.assertEqual(fix.svids, (23, 24, 20, 12, 66, 76))
+        self.assertEqual(fix.spd, 0.046)
+        self.assertIsNone(fix.cog)
+        self.assertIsNone(fix.stdLat)
+        fixes = epb.flush()
+        self.assertEqual(fixes[0].time, datetime.time(10, 36, 8))
+        self.assertEqual(epb.flush(), [])
+
+    def testZDADate(self):  # date taken from ZDA
+        epb = EpochBuilder(terminator="ZDA")
+        fixes = epb.process(NMEAReader.parse(GGA1))
+        fixes += epb.process(NMEAReader.parse(ZDA))
+        self.assertEqual(len(fixes), 1)
+        self.assertEqual(fixes[0].date, datetime.date(2021, 3, 7))
+        self.assertEqual(fixes[0].time, datetime.time(10, 36, 7))
+        zda = NMEAReader.parse(b"$GNZDA,103607.00,,,,00,00*7B\r\n")
+        self.assertIsNone(epb.process(zda)[0].date)
+
+    def testTerminator(self):  # epoch emitted on terminating sentence
+        epb = EpochBuilder(terminator="GGA")
+        self.assertEqual(epb.process(NMEAReader.parse(RMC1)), [])
+        fixes = epb.process(NMEAReader.parse(GGA1))
+        self.assertEqual(len(fixes), 1)
+        self.assertEqual(fixes[0].alt, 56.0)
+        self.assertIsNone(fixes[0].svids)
+        self.assertEqual(epb.flush(), [])
+
+    def testIgnored(self):  # other messages and parse errors ignored
+        epb = EpochBuilder()
+        self.assertEqual(epb.process(NMEAReader.parse(GSV)), [])
+        self.assertEqual(epb.process(None), [])
+        self.assertEqual(epb.process("Message GNGGA invalid checksum"), [])
+        self.assertEqual(epb.flush(), [])
+
+    def testGroupsLazy(self):  # messages parsed with groups or lazy options
+        expected = list(
+            EpochBuilder().assemble(
+                NMEAReader.parse(msg) for msg in (RMC1, GGA1, GSA1, GSA2)
+            )
+        )
+        for kwargs in ({"groups": True}, {"lazy": True}):
+            fixes = list(
+                EpochBuilder().assemble(
+                    NMEAReader.parse(msg, **kwargs) for msg in (RMC1, GGA1, GSA1, GSA2)
+                )
+            )
+            self.assertEqual(fixes, expected)
+
+    def testLazyInvalid(self):  # invalid lazy svids omitted, not raised
+        data = BytesIO(RMC1 + GGA1 + GSABAD + GSA2)
+        fixes = list(EpochBuilder().assemble(NMEAReader(data, lazy=True)))
+        self.assertEqual(len(fixes), 1)
+        self.assertEqual(fixes[0].svids, (24, 20, 12, 66, 76))
+        self.assertEqual(fixes[0].PDOP, 9.62)
+
+    def testNMEAFix(self):  # fix record
+        fix = NMEAFix(lat=53.450657, lon=-2.2404103333, numSV=6)
+        self.assertEqual(fix.numSV, 6)
+        self.assertIsNone(fix.alt)
+        self.assertEqual(eval(repr(fix)), fix)
+        self.assertEqual(fix.asdict()["lat"], 53.450657)
+        self.assertTrue(str(fix).startswith("<NMEAFix(time=None, date=None"))
+        self.assertFalse(hasattr(fix, "__dict__"))
+        with self.assertRaises(AttributeError):
+            fix.foo = 1
+        with self.assertRaises(AttributeError):
+            NMEAFix(foo=1)
+
+    def testAssembleStream(self):  # sync driver
+        with open(
+            os.path.join(os.path.dirname(__file__), "pygpsdata-nmea4.log"), "rb"
+        ) as stream:
+            fixes = list(EpochBuilder().assemble(NMEAReader(stream)))
+        self.assertEqual(len(fixes), 1)
+        self.assertEqual(fixes[0].stdLat, 15.0)
+        self.assertEqual(fixes[0].svids, (23, 24, 20, 12, 66, 76))
+
+    def testAssembleAsync(self):  # async driver
+        async def run():
+            nmr = AsyncNMEAReader(DummyAsyncStream(self.dataNMEA4))
+            return [fix async for fix in EpochBuilder().aassemble(nmr)]
+
+        fixes = asyncio.run(run())
+        with open(
+            os.path.join(os.path.dirname(__file__), "pygpsdata-nmea4.log"), "rb"
+        ) as stream:
+            self.assertEqual(fixes, list(EpochBuilder().assemble(NMEAReader(stream))))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,186 @@
+"""
+Event-driven reader tests for pynmeagps - uses local socket pairs and pipes.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import socket
+import threading
+import time
+import unittest
+from io import BytesIO
+
+from pynmeagps import ERR_IGNORE, NMEAEventReader, NMEAReader, SocketStream
+
+GLL = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+
+
+class DummySerial:
+    """
+    Dummy serial stream with in_waiting attribute but no fileno.
+    """
+
+    def __init__(self, data: bytes):
+        self._data = data
+        self.checks = 0
+
+    @property
+    def in_waiting(self) -> int:
+        self.checks += 1
+        return len(self._data)
+
+    def read(self, num: int) -> bytes:
+        data, self._data = self._data[:num], self._data[num:]
+        return data
+
+    def feed(self, data: bytes):
+        self._data += data
+
+
+class EventReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            self.dataNMEA4 = stream.read()
+
+    def tearDown(self):
+        pass
+
+    def testReadBuffered(self):  # NMEAReader reads without blocking on stream
+        data = GLL * 2 + b"$GNGLL,5327.04319,S*00\r\n" + GLL[:20]
+        nmr = NMEAReader(BytesIO(data), quitonerror=ERR_IGNORE)
+        self.assertEqual(nmr.read_buffered(), (None, None))
+        self.assertEqual(nmr.fill(), len(data))
+        self.assertEqual(nmr.read_buffered()[0], GLL)
+        self.assertEqual(nmr.read_buffered()[1].lat, -53.4507198333)
+        raw, parsed = nmr.read_buffered()
+        self.assertEqual(raw, b"$GNGLL,5327.04319,S*00\r\n")
+        self.assertIn("invalid checksum", parsed)
+        self.assertEqual(nmr.read_buffered(), (None, None))
+        self.assertEqual(nmr.fill(), 0)
+        self.assertEqual(nmr.feed(GLL[20:]), len(GLL) - 20)  # completes partial
+        self.assertEqual(nmr.read_buffered()[0], GLL)
+        self.assertEqual(nmr.feed(b""), 0)
+
+    def testReadBufferedFilter(self):  # filtered and non-CRLF sentences skipped
+        data = self.dataNMEA4.replace(b"\r\n", b"\n", 1)
+        nmr = NMEAReader(BytesIO(data), msgfilter={"GSA"}, instrument=True)
+        nmr.fill()
+        msgs = []
+        item = nmr.read_buffered()
+        while item != (None, None):
+            msgs.append(item[1].identity)
+            item = nmr.read_buffered()
+        self.assertEqual(msgs, ["GNGSA"] * 4)
+        self.assertEqual(nmr.stats["bytes"], len(data))
+        self.assertEqual(nmr.stats["messages"], {"GNGSA": 4})
+        self.assertEqual(nmr.skipped["GNGGA"], 1)
+
+    def testSocket(self):  # selector on socket, data arriving in pieces
+        sock1, sock2 = socket.socketpair()
+        with sock1, sock2:
+
+            def send():
+                for i in range(0, len(self.dataNMEA4), 100):
+                    sock1.sendall(self.dataNMEA4[i : i + 100])
+                    time.sleep(0.001)
+                sock1.shutdown(socket.SHUT_WR)
+
+            thr = threading.Thread(target=send)
+            thr.start()
+            with NMEAEventReader(sock2, timeout=1) as nmr:
+                self.assertEqual(nmr.mode, "select")
+                raws = [raw for raw, _ in nmr]
+                self.assertTrue(nmr.eof)
+            thr.join()
+        self.assertEqual(b"".join(raws), self.dataNMEA4)
+
+    def testPipeTimeout(self):  # selector on pipe, read timeout
+        rfd, wfd = os.pipe()
+        with os.fdopen(rfd, "rb", buffering=0) as rstream:
+            nmr = NMEAEventReader(rstream, timeout=0.05)
+            self.assertEqual(nmr.mode, "select")
+            start = time.perf_counter()
+            self.assertEqual(nmr.read(), (None, None))
+            self.assertGreaterEqual(time.perf_counter() - start, 0.05)
+            self.assertFalse(nmr.eof or nmr.stopped)
+            os.write(wfd, GLL[:10])
+            self.assertFalse(nmr.wait())
+            os.write(wfd, GLL[10:] + GLL)
+            self.assertTrue(nmr.wait())
+            self.assertTrue(nmr.wait())
+            self.assertEqual(nmr.read()[0], GLL)
+            self.assertEqual(nmr.read()[0], GLL)
+            os.close(wfd)
+            self.assertEqual(nmr.read(), (None, None))
+            self.assertTrue(nmr.eof)
+            nmr.close()
+
+    def testSocketStream(self):  # selector on idle SocketStream, timeout and stop
+        sock1, sock2 = socket.socketpair()
+        with sock1, sock2:
+            stream = SocketStream(sock2)
+            self.assertEqual(stream.fileno(), sock2.fileno())
+            nmr = NMEAEventReader(stream, timeout=0.05)
+            self.assertEqual(nmr.mode, "select")
+            start = time.perf_counter()
+            self.assertEqual(nmr.read(), (None, None))
+            self.assertLess(time.perf_counter() - start, 1)
+            sock1.sendall(GLL)
+            self.assertEqual(nmr.read()[0], GLL)
+            timer = threading.Timer(0.05, nmr.stop)
+            timer.start()
+            start = time.perf_counter()
+            self.assertEqual(list(nmr), [])
+            timer.join()
+            self.assertLess(time.perf_counter() - start, 1)
+            nmr.close()
+
+    def testStop(self):  # stopped from another thread while idle
+        sock1, sock2 = socket.socketpair()
+        with sock1, sock2:
+            stopevent = threading.Event()
+            nmr = NMEAEventReader(sock2, stopevent=stopevent)
+            sock1.sendall(GLL)
+            timer = threading.Timer(0.05, stopevent.set)
+            timer.start()
+            start = time.perf_counter()
+            raws = [raw for raw, _ in nmr]
+            timer.join()
+            self.assertLess(time.perf_counter() - start, 1)
+            self.assertEqual(raws, [GLL])
+            self.assertTrue(nmr.stopped)
+            self.assertFalse(nmr.eof)
+            nmr.close()
+
+    def testPoll(self):  # in_waiting checks if stream has no fileno
+        stream = DummySerial(GLL)
+        nmr = NMEAEventReader(stream, timeout=0.1, pollinterval=0.01)
+        self.assertEqual(nmr.mode, "poll")
+        self.assertEqual(nmr.read()[0], GLL)
+        self.assertEqual(nmr.read(), (None, None))
+        self.assertLess(stream.checks, 20)  # not busy-waiting
+        stream.feed(GLL)
+        self.assertEqual(nmr.read()[0], GLL)
+        timer = threading.Timer(0.05, nmr.stop)
+        timer.start()
+        self.assertEqual(list(nmr), [])
+        timer.join()
+
+    def testReady(self):  # stream always readable
+        nmr = NMEAEventReader(BytesIO(self.dataNMEA4), msgfilter={"GSA"})
+        self.assertEqual(nmr.mode, "ready")
+        self.assertEqual([parsed.msgID for _, parsed in nmr], ["GSA"] * 4)
+        self.assertEqual(nmr.reader.skipped["GNGGA"], 1)
+        self.assertTrue(nmr.eof)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
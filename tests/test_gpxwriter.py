@@ -0,0 +1,187 @@
+"""
+GPX writer tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import datetime
+import os
+import unittest
+import xml.etree.ElementTree as ET
+from io import StringIO
+
+from pynmeagps import GPXWriter, NMEAFix, NMEAReader, NMEAStreamError
+
+NS = "{http://www.topografix.com/GPX/1/1}"
+
+
+class CountingStream(StringIO):
+    """
+    Text stream which counts write calls.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+
+def fix(secs: int, **kwargs) -> NMEAFix:
+    """
+    Create valid fix at given seconds of day.
+    """
+
+    kwargs.setdefault("lat", 53.450657)
+    kwargs.setdefault("lon", -2.2404103333)
+    kwargs.setdefault("quality", 1)
+    tim = datetime.time(secs // 3600, secs % 3600 // 60, secs % 60)
+    return NMEAFix(time=tim, **kwargs)
+
+
+def segments(xml: str) -> list:
+    """
+    Parse GPX and return list of trackpoint lists, one per segment.
+    """
+
+    root = ET.fromstring(xml)
+    return [
+        seg.findall(f"{NS}trkpt")
+        for seg in root.find(f"{NS}trk").findall(f"{NS}trkseg")
+    ]
+
+
+class GPXWriterTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+
+    def tearDown(self):
+        pass
+
+    def testTrackpoint(self):  # trackpoint elements in schema order
+        out = StringIO()
+        with GPXWriter(out, name="Test <track>") as gpx:
+            res = gpx.write(
+                fix(
+                    37567,
+                    date=datetime.date(2021, 3, 6),
+                    alt=56.0,
+                    sep=48.5,
+                    numSV=6,
+                    HDOP=5.88,
+                    VDOP=7.62,
+                    PDOP=9.62,
+                    navMode=3,
+                )
+            )
+        self.assertTrue(res)
+        xml = out.getvalue()
+        self.assertIn("<name>Test &lt;track&gt;</name>", xml)
+        self.assertIn(
+            '<trkpt lat="53.450657" lon="-2.2404103333"><ele>56.0</ele>'
+            "<time>2021-03-06T10:26:07Z</time><geoidheight>48.5</geoidheight>"
+            "<fix>3d</fix><sat>6</sat><hdop>5.88</hdop><vdop>7.62</vdop>"
+            "<pdop>9.62</pdop></trkpt>",
+            xml,
+        )
+        self.assertNotIn("<metadata><time>", xml)
+        self.assertEqual(len(segments(xml)), 1)
+        self.assertEqual((gpx.points, gpx.segments), (1, 1))
+
+    def testFixType(self):  # GPX fix type from quality or navMode
+        out = StringIO()
+        with GPXWriter(out) as gpx:
+            gpx.write(fix(0, quality=2, navMode=3))
+            gpx.write(fix(1, quality=1, navMode=2))
+            gpx.write(fix(2, quality=1))
+        fixes = [pt.findtext(f"{NS}fix") for pt in segments(out.getvalue())[0]]
+        self.assertEqual(fixes, ["dgps", "2d", None])
+
+    def testSegments(self):  # new track segment after fix loss
+        out = StringIO()
+        with GPXWriter(out) as gpx:
+            self.assertTrue(gpx.write(fix(0)))
+            self.assertTrue(gpx.write(fix(1)))
+            self.assertFalse(gpx.write(fix(2, quality=0)))
+            self.assertFalse(gpx.write(fix(3, status="V")))
+            self.assertFalse(gpx.write(fix(4, lat=None)))
+            self.assertTrue(gpx.write(fix(5)))
+            self.assertFalse(gpx.write(fix(6, posMode="N")))
+            self.assertFalse(gpx.write(fix(7, posMode="N")))
+            self.assertTrue(gpx.write(fix(8)))
+        self.assertEqual([len(seg) for seg in segments(out.getvalue())], [2, 1, 1])
+        self.assertEqual((gpx.points, gpx.segments), (4, 3))
+
+    def testMaxGap(self):  # new track segment after time gap
+        out = StringIO()
+        with GPXWriter(out, maxgap=5) as gpx:
+            for secs in (86395, 86399, 2, 10, 15):  # across midnight
+                gpx.write(fix(secs))
+        self.assertEqual([len(seg) for seg in segments(out.getvalue())], [3, 2])
+
+    def testDates(self):  # dates from fixes and midnight rollover
+        out = StringIO()
+        with GPXWriter(out) as gpx:
+            gpx.write(fix(86398))  # no date yet
+            gpx.write(fix(86399, date=datetime.date(2021, 12, 31)))
+            gpx.write(fix(0, quality=0))  # rollover on invalid fix
+            gpx.write(fix(1))
+            gpx.write(fix(0))  # time going backwards isn't a rollover
+        times = [
+            pt.findtext(f"{NS}time") for seg in segments(out.getvalue()) for pt in seg
+        ]
+        self.assertEqual(
+            times,
+            [
+                None,
+                "2021-12-31T23:59:59Z",
+                "2022-01-01T00:00:01Z",
+                "2022-01-01T00:00:00Z",
+            ],
+        )
+
+    def testBuffered(self):  # output written in chunks
+        out = CountingStream()
+        gpx = GPXWriter(out)
+        for secs in range(100):
+            gpx.write(fix(secs))
+        self.assertEqual(out.writes, 0)
+        gpx.flush()
+        self.assertEqual(out.writes, 1)
+        gpx.close()
+        gpx.close()
+        self.assertEqual(out.writes, 2)
+        self.assertFalse(out.closed)
+        self.assertEqual(len(segments(out.getvalue())[0]), 100)
+        with self.assertRaises(NMEAStreamError):
+            gpx.write(fix(0))
+        out = CountingStream()
+        with GPXWriter(out, bufsize=1000) as gpx:
+            for secs in range(100):
+                gpx.write(fix(secs))
+        self.assertGreater(out.writes, 5)
+        self.assertLess(out.writes, 20)
+        self.assertEqual(len(segments(out.getvalue())[0]), 100)
+
+    def testWriteAll(self):  # trackpoints from NMEA stream
+        out = StringIO()
+        with open(
+            os.path.join(os.path.dirname(__file__), "pygpsdata-nmea4.log"), "rb"
+        ) as stream:
+            with GPXWriter(out) as gpx:
+                self.assertEqual(gpx.write_all(NMEAReader(stream)), 1)
+        self.assertEqual(gpx.points, 1)
+        trkpt = segments(out.getvalue())[0][0]
+        self.assertEqual(trkpt.findtext(f"{NS}time"), "2021-03-06T10:36:07Z")
+        self.assertEqual(trkpt.findtext(f"{NS}sat"), "6")
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
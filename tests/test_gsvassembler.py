@@ -0,0 +1,138 @@
+"""
+GSV assembler tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import GSVAssembler, NMEAReader, SatelliteTable
+
+GSV1 = b"$GPGSV,3,1,11,01,06,014,08,12,43,207,28,14,06,049,,15,44,171,23,1*6B\r\n"
+GSV2 = b"$GPGSV,3,2,11,17,32,064,16,19,33,094,,20,20,251,31,21,04,354,,1*63\r\n"
+GSV3 = b"$GPGSV,3,3,11,23,27,251,31,24,89,268,26,25,05,223,,1*5A\r\n"
+GSVGA = b"$GAGSV,1,1,00,7*73\r\n"
+GSVGL = b"$GLGSV,3,1,10,65,07,176,,66,57,223,35,67,42,315,23,68,00,341,29,1*7A\r\n"
+GSVBADELV = b"$GPGSV,3,2,11,17,x2,064,16,19,33,094,,20,20,251,31,21,04,354,,1*28\r\n"
+GSVBADNUM = b"$GPGSV,3,y,11,17,32,064,16,19,33,094,,20,20,251,31,21,04,354,,1*28\r\n"
+GGA = b"$GNGGA,103607.00,5327.03942,S,10214.42462,W,1,06,4.34,24.9,M,0.0,M,,*4B\r\n"
+
+
+class GSVAssemblerTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.gsv = [NMEAReader.parse(msg) for msg in (GSV1, GSV2, GSV3)]
+
+    def tearDown(self):
+        pass
+
+    def testComplete(self):  # all sentences in cycle
+        gsva = GSVAssembler()
+        self.assertEqual(gsva.process(self.gsv[0]), [])
+        self.assertEqual(gsva.process(self.gsv[1]), [])
+        self.assertEqual(gsva.pending, 1)
+        tables = gsva.process(self.gsv[2])
+        self.assertEqual(gsva.pending, 0)
+        self.assertEqual(len(tables), 1)
+        table = tables[0]
+        self.assertTrue(table.complete)
+        self.assertEqual((table.talker, table.signalID, table.numSV), ("GP", "1", 11))
+        self.assertEqual(len(table), 11)
+        self.assertEqual(table.svid, (1, 12, 14, 15, 17, 19, 20, 21, 23, 24, 25))
+        self.assertEqual(table.cno[:4], (8, 28, "", 23))
+        self.assertEqual(list(table)[1], (12, 43.0, 207, 28))
+        self.assertEqual(
+            str(table),
+            "<SatelliteTable(GP, signalID=1, numSV=11, svid=(1, 12, 14, 15, 17, 19, 20, 21, 23, 24, 25), elv=(6.0, 43.0, 6.0, 44.0, 32.0, 33.0, 20.0, 4.0, 27.0, 89.0, 5.0), az=(14, 207, 49, 171, 64, 94, 251, 354, 251, 268, 223), cno=(8, 28, '', 23, 16, '', 31, '', 31, 26, ''), complete=True)>",
+        )
+        self.assertEqual(str(eval(repr(table))), str(table))
+
+    def testGroups(self):  # messages parsed with groups option
+        gsva = GSVAssembler()
+        tables = []
+        for msg in (GSV1, GSV2, GSV3):
+            tables += gsva.process(NMEAReader.parse(msg, groups=True))
+        expected = GSVAssembler().assemble(self.gsv)
+        self.assertEqual(str(tables[0]), str(next(expected)))
+
+    def testMissing(self):  # missing final sentence, next cycle starts
+        gsva = GSVAssembler()
+        gsva.process(self.gsv[0])
+        gsva.process(self.gsv[1])
+        tables = gsva.process(self.gsv[0])
+        self.assertEqual(len(tables), 1)
+        self.assertFalse(tables[0].complete)
+        self.assertEqual(tables[0].missing, (3,))
+        self.assertEqual(len(tables[0]), 8)
+        self.assertEqual(gsva.pending, 1)
+
+    def testMissingFinal(self):  # missing middle sentence, final sentence received
+        gsva = GSVAssembler()
+        gsva.process(self.gsv[0])
+        tables = gsva.process(self.gsv[2])
+        self.assertEqual(tables[0].missing, (2,))
+        self.assertEqual(tables[0].svid, (1, 12, 14, 15, 23, 24, 25))
+        self.assertEqual(gsva.pending, 0)
+
+    def testMaxPending(self):  # oldest pending cycle emitted when limit exceeded
+        gsva = GSVAssembler(maxpending=1)
+        self.assertEqual(gsva.process(self.gsv[0]), [])
+        tables = gsva.process(NMEAReader.parse(GSVGL))
+        self.assertEqual([t.talker for t in tables], ["GP"])
+        self.assertEqual(tables[0].missing, (2, 3))
+        self.assertEqual(gsva.pending, 1)
+        tables = gsva.flush()
+        self.assertEqual([t.talker for t in tables], ["GL"])
+        self.assertEqual(gsva.pending, 0)
+
+    def testIgnored(self):  # non-GSV messages and parse errors ignored
+        gsva = GSVAssembler()
+        self.assertEqual(gsva.process(NMEAReader.parse(GGA)), [])
+        self.assertEqual(gsva.process(None), [])
+        self.assertEqual(gsva.process("Message GPGSV invalid checksum"), [])
+        self.assertEqual(gsva.pending, 0)
+
+    def testLazyInvalid(self):  # invalid lazy fragments dropped, not raised
+        data = BytesIO(GSV1 + GSVBADNUM + GSVBADELV + GSV3)
+        tables = list(GSVAssembler().assemble(NMEAReader(data, lazy=True)))
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(tables[0].missing, (2,))
+        self.assertEqual(tables[0].svid, (1, 12, 14, 15, 23, 24, 25))
+        tables = list(
+            GSVAssembler().assemble(NMEAReader(BytesIO(GSVBADELV), lazy=True))
+        )
+        self.assertEqual(tables, [])
+
+    def testEmpty(self):  # no satellites in view
+        tables = GSVAssembler().process(NMEAReader.parse(GSVGA))
+        self.assertTrue(tables[0].complete)
+        self.assertEqual(len(tables[0]), 0)
+        self.assertEqual(tables[0].svid, ())
+
+    def testAssembleStream(self):  # assemble from NMEAReader output
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            tables = list(GSVAssembler().assemble(NMEAReader(stream)))
+        self.assertEqual(
+            [(t.talker, t.signalID, len(t), t.complete) for t in tables],
+            [
+                ("GP", "1", 11, True),
+                ("GL", "1", 6, False),
+                ("GA", "7", 0, True),
+                ("GB", "1", 2, True),
+                ("GB", "B", 2, False),
+                ("GL", "B", 4, False),
+            ],
+        )
+        self.assertTrue(all(isinstance(t, SatelliteTable) for t in tables))
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
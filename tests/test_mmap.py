@@ -0,0 +1,112 @@
+"""
+Memory-mapped reader tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import tempfile
+import unittest
+
+import pynmeagps.mmapnmeareader as mmr
+from pynmeagps import (
+    MMapNMEAReader,
+    NMEAReader,
+    NMEAParseError,
+    ERR_IGNORE,
+    ERR_RAISE,
+)
+
+
+class MMapTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        self.dirname = os.path.dirname(__file__)
+        self.tmpdir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _compare(self, log: str, **kwargs):
+        path = os.path.join(self.dirname, log)
+        with open(path, "rb") as stream:
+            expected = [
+                (raw, str(parsed)) for raw, parsed in NMEAReader(stream, **kwargs)
+            ]
+        with open(path, "rb") as stream:
+            with MMapNMEAReader(stream, **kwargs) as nmr:
+                res = list(nmr)
+                for raw, _ in res:
+                    self.assertIsInstance(raw, memoryview)
+                res = [(bytes(raw), str(parsed)) for raw, parsed in res]
+        self.assertEqual(res, expected)
+
+    def testMMapNMEA4(self):
+        self._compare("pygpsdata-nmea4.log")
+
+    def testMMapMIXED(self):  # non-NMEA data ignored
+        self._compare("pygpsdata-mixed.log")
+
+    def testMMapBADCK(self):  # bad checksums returned as error strings
+        self._compare("pygpsdata-nmeabadck.log", quitonerror=ERR_IGNORE)
+
+    def testMMapFILTER(self):  # message identity filter
+        self._compare("pygpsdata-nmea4.log", msgfilter={"GGA", "PUBX00"})
+
+    def testMMapLAZY(self):  # lazy attribute conversion
+        self._compare("pygpsdata-nmea4.log", lazy=True)
+
+    def testMMapNMEAONLY(self):  # non-NMEA data raises error
+        path = os.path.join(self.dirname, "pygpsdata-mixed.log")
+        with open(path, "rb") as stream:
+            with MMapNMEAReader(stream, nmeaonly=True, quitonerror=ERR_RAISE) as nmr:
+                with self.assertRaises(NMEAParseError):
+                    for _ in nmr:
+                        pass
+
+    def testMMapEMPTY(self):  # empty file cannot be mapped
+        path = os.path.join(self.tmpdir.name, "empty.log")
+        with open(path, "wb"):
+            pass
+        with open(path, "rb") as stream:
+            with MMapNMEAReader(stream) as nmr:
+                self.assertEqual(nmr.read(), (None, None))
+
+    def testMMapCLOSE(self):  # close with raw data slices still referenced
+        path = os.path.join(self.dirname, "pygpsdata-nmea4.log")
+        with open(path, "rb") as stream:
+            nmr = MMapNMEAReader(stream)
+            raw, _ = nmr.read()
+            nmr.close()
+            self.assertEqual(bytes(raw[0:6]), b"$GNDTM")
+            self.assertEqual(nmr.read(), (None, None))
+            nmr.close()
+
+    def testMMapRELEASE(self):  # read pages released periodically
+        path = os.path.join(self.tmpdir.name, "big.log")
+        with open(os.path.join(self.dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            data = stream.read()
+        with open(path, "wb") as stream:
+            stream.write(data * 20)
+        relsize = mmr.RELEASESIZE
+        mmr.RELEASESIZE = 4096
+        try:
+            with open(path, "rb") as stream:
+                with MMapNMEAReader(stream) as nmr:
+                    first, _ = nmr.read()
+                    res = [str(parsed) for _, parsed in nmr]
+                    if mmr.CANRELEASE:
+                        self.assertGreater(nmr._released, 0)
+                    self.assertEqual(bytes(first[0:6]), b"$GNDTM")
+        finally:
+            mmr.RELEASESIZE = relsize
+        self.assertEqual(len(res), 48 * 20 - 1)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -9,8 +9,20 @@ Created on 4 Mar 2021
 :author: semuadmin
 """
 
+import datetime
+import pickle
 import unittest
-from pynmeagps import NMEAReader, NMEAParseError, SET, VALCKSUM, VALMSGID
+from pynmeagps import (
+    NMEAReader,
+    NMEAMessageError,
+    NMEAParseError,
+    NMEATypeError,
+    SET,
+    VALNONE,
+    VALCKSUM,
+    VALMSGID,
+    get_parts_cksum,
+)
 
 
 class ParseTest(unittest.TestCase):
@@ -81,12 +93,30 @@ class ParseTest(unittest.TestCase):
             NMEAReader.parse(self.messageNK, validate=VALCKSUM | VALMSGID)
         self.assertTrue(EXPECTED_ERROR in str(context.exception))
 
+    def testParsePARTS(self):  # parse from pre-split parts
+        parts = get_parts_cksum(self.messageGLL)
+        res = NMEAReader.parse_parts(parts)
+        self.assertEqual(str(res), str(NMEAReader.parse(self.messageGLL)))
+        badparts = parts[0:4] + ("00",)
+        with self.assertRaises(NMEAParseError):
+            NMEAReader.parse_parts(badparts)
+        self.assertEqual(
+            NMEAReader.parse_parts(badparts, validate=VALNONE).identity, "GNGLL"
+        )
+
     def testParseNK2(
         self,
     ):  # unknown message identifier with validate VALCKSUM only - should just be ignored.
         res = NMEAReader.parse(self.messageNK, validate=VALCKSUM)
         self.assertEqual(res, None)
 
+    def testParseBYTESLIKE(self):  # bytearray and memoryview input
+        msg = self.messageGLL.encode("utf-8")
+        res1 = NMEAReader.parse(bytearray(msg))
+        res2 = NMEAReader.parse(memoryview(b"xx" + msg)[2:])
+        self.assertEqual(str(res1), str(NMEAReader.parse(self.messageGLL)))
+        self.assertEqual(str(res2), str(res1))
+
     def testParseBADMODE(self):  # invalid mode setting
         EXPECTED_ERROR = "Invalid parse mode 4 - must be 0, 1 or 2."
         with self.assertRaises(NMEAParseError) as context:
@@ -99,6 +129,98 @@ class ParseTest(unittest.TestCase):
             NMEAReader.parse(self.messageBADCK)
         self.assertTrue(EXPECTED_ERROR in str(context.exception))
 
+    def testParsePUBX03SHORT(self):  # numSv exceeds number of groups in payload
+        res = NMEAReader.parse(
+            "$PUBX,03,5,23,-,014,06,08,000,12,U,207,43,28,009*59\r\n"
+        )
+        self.assertEqual(
+            str(res),
+            "<NMEA(PUBX03, msgId=03, numSv=5, svid_01=23, status_01=-, azi_01=14.0, ele_01=6.0, cno_01=8, lck_01=0, svid_02=12, status_02=U, azi_02=207.0, ele_02=43.0, cno_02=28, lck_02=9)>",
+        )
+
+    def testParsePUBX03TRUNC(self):  # payload truncated before numSv
+        EXPECTED_ERROR = "Incorrect type for attribute groupSV in msgID UBX."
+        with self.assertRaises(NMEATypeError) as context:
+            NMEAReader.parse("$PUBX,03*00\r\n", validate=VALNONE)
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testParseGSVPLAN(self):  # variable length group plans with differing repeats
+        res1 = NMEAReader.parse(
+            "$GPGSV,3,1,11,01,06,014,08,12,43,207,28,14,06,049,,15,44,171,23,1*6B\r\n"
+        )
+        res2 = NMEAReader.parse(
+            "$GPGSV,3,3,11,23,27,251,31,24,89,268,26,25,05,223,,1*5A"
+        )
+        res3 = NMEAReader.parse(
+            "$GPGSV,3,1,11,01,06,014,08,12,43,207,28,14,06,049,,15,44,171,23,1*6B\r\n"
+        )
+        self.assertEqual(res1.svid_04, 15)
+        self.assertEqual(res1.signalID, "1")
+        self.assertEqual(res2.cno_02, 26)
+        self.assertFalse(hasattr(res2, "svid_04"))
+        self.assertEqual(str(res1), str(res3))
+
+    def testParseLAZY(self):  # lazy attribute conversion
+        res = NMEAReader.parse(self.messageGLL, lazy=True)
+        self.assertFalse("lat" in res.__dict__)
+        self.assertEqual(res.lat, -53.4507198333)
+        self.assertEqual(res.time, datetime.time(22, 32, 32))
+        self.assertTrue("lat" in res.__dict__)
+        self.assertFalse("lon" in res.__dict__)
+        self.assertFalse(hasattr(res, "foo"))
+        self.assertEqual(str(res), str(NMEAReader.parse(self.messageGLL)))
+        self.assertEqual(res.serialize(), self.messageGLL.encode("utf-8"))
+        with self.assertRaises(NMEAMessageError):
+            res.lat = 0
+
+    def testParseLAZYGROUP(self):  # lazy attribute conversion, variable length group
+        msg = "$PUBX,03,5,23,-,014,06,08,000,12,U,207,43,28,009*59\r\n"
+        res = NMEAReader.parse(msg, lazy=True)
+        self.assertEqual(res.cno_02, 28)
+        self.assertFalse(hasattr(res, "svid_03"))
+        self.assertEqual(str(res), str(NMEAReader.parse(msg)))
+
+    def testParseGROUPS(self):  # repeating groups as named tuples
+        msg = "$PUBX,03,5,23,-,014,06,08,000,12,U,207,43,28,009*59\r\n"
+        res = NMEAReader.parse(msg, groups=True)
+        self.assertEqual(res.groupSV.svid, (23, 12))
+        self.assertEqual(res.groupSV.cno, (8, 28))
+        self.assertEqual(
+            list(zip(*res.groupSV)),
+            [(23, "-", 14.0, 6.0, 8, 0), (12, "U", 207.0, 43.0, 28, 9)],
+        )
+        self.assertEqual(res.cno_02, 28)
+        self.assertFalse("cno_02" in res.__dict__)
+        self.assertFalse(hasattr(res, "svid_03"))
+        self.assertFalse(hasattr(res, "foo_01"))
+        self.assertEqual(res.serialize(), msg.encode("utf-8"))
+        self.assertEqual(pickle.loads(pickle.dumps(res)).groupSV, res.groupSV)
+        with self.assertRaises(NMEAMessageError):
+            res.groupSV = None
+
+    def testParseGROUPSFIXED(self):  # fixed length repeating group as named tuple
+        msg = "$GNGSA,A,3,23,24,20,12,,,,,,,,,4.94,3.92,3.00,1*05\r\n"
+        res = NMEAReader.parse(msg, groups=True)
+        self.assertEqual(res.groupSV.svid, (23, 24, 20, 12) + ("",) * 8)
+        self.assertEqual(res.svid_04, 12)
+        self.assertEqual(res.PDOP, 4.94)
+        self.assertEqual(
+            str(res),
+            "<NMEA(GNGSA, opMode=A, navMode=3, groupSV=groupSV(svid=(23, 24, 20, 12, '', '', '', '', '', '', '', '')), PDOP=4.94, HDOP=3.92, VDOP=3.0, systemId=1)>",
+        )
+
+    def testParseLAZYBADTYPE(self):  # conversion error deferred until access
+        EXPECTED_ERROR = "Incorrect type for attribute spd in msgID RMC."
+        res = NMEAReader.parse(
+            "$GNRMC,103607.00,A,5327.03942,N,10214.42462,W,0.0X6,,060321,,,A,V*00\r\n",
+            validate=VALNONE,
+            lazy=True,
+        )
+        self.assertEqual(res.lon, -102.2404103333)
+        with self.assertRaises(NMEATypeError) as context:
+            print(res.spd)
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
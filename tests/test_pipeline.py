@@ -0,0 +1,167 @@
+"""
+Streaming pipeline tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import (
+    ChecksumStage,
+    CompactNMEAMessage,
+    FilterStage,
+    MapStage,
+    NMEAMessage,
+    NMEAParseError,
+    NMEAReader,
+    ParseStage,
+    Pipeline,
+    PipelineItem,
+    RawWriter,
+    Stage,
+)
+
+GLL = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*68\r\n"
+GLLBAD = b"$GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A*00\r\n"
+GSV = b"$GPGSV,3,1,11,01,06,014,08,12,43,207,28,14,06,049,,15,44,171,23,1*6B\r\n"
+PUBX = b"$PUBX,03,5,23,-,014,06,08,000,12,U,207,43,28,009*59\r\n"
+UNKNOWN = b"$GNXXX,5327.04319,S,00214.41396,E,223232.00,A,A*77\r\n"
+
+
+class DropStage(Stage):
+    """
+    Stage which drops batches of more than 2 items.
+    """
+
+    def process(self, batch: list) -> list:
+        return [] if len(batch) > 2 else batch
+
+
+class PipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        self.streamNMEA4 = open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb")
+
+    def tearDown(self):
+        self.streamNMEA4.close()
+
+    def testParse(self):  # parsed output equivalent to NMEAReader
+        expected = [str(parsed) for _, parsed in NMEAReader(self.streamNMEA4)]
+        self.streamNMEA4.seek(0)
+        res = [
+            str(item.parsed)
+            for item in Pipeline(self.streamNMEA4, [ChecksumStage(), ParseStage()])
+        ]
+        self.assertEqual(res, expected)
+        self.streamNMEA4.seek(0)
+        res = [str(item.parsed) for item in Pipeline(self.streamNMEA4, [ParseStage()])]
+        self.assertEqual(res, expected)
+
+    def testRaw(self):  # no stages - raw sentences only
+        items = list(Pipeline(BytesIO(GLL + b"junk" + GSV)))
+        self.assertEqual([item.raw for item in items], [GLL, GSV])
+        self.assertIsNone(items[0].parsed)
+
+    def testChecksum(self):  # invalid sentences flagged or dropped
+        stream = BytesIO(GLL + GLLBAD + b"$GNGLL,nocksum\r\n")
+        items = list(Pipeline(stream, [ChecksumStage(), ParseStage()]))
+        self.assertEqual(len(items), 3)
+        self.assertEqual(items[0].parts[1], "GLL")
+        self.assertEqual(
+            items[1].error, "Message GNGLL invalid checksum 00 - should be 68."
+        )
+        self.assertIsNone(items[1].parsed)
+        self.assertTrue(items[2].error.startswith("Badly formed message"))
+        stream.seek(0)
+        items = list(Pipeline(stream, [ChecksumStage(drop=True)]))
+        self.assertEqual([item.raw for item in items], [GLL])
+
+    def testParseErrors(self):  # parse errors set as for NMEAReader
+        items = list(Pipeline(BytesIO(GLLBAD + UNKNOWN), [ParseStage(validate=0x03)]))
+        self.assertEqual(items[0].parsed, items[0].error)
+        self.assertIn("invalid checksum", items[0].error)
+        self.assertIn("Unknown msgID GNXXX", items[1].error)
+        items = list(Pipeline(BytesIO(UNKNOWN), [ParseStage()]))
+        self.assertIsNone(items[0].parsed)
+        self.assertIsNone(items[0].error)
+
+    def testFilter(self):  # filter and forward by identity
+        stream = BytesIO(GLL + GSV + PUBX)
+        items = list(
+            Pipeline(
+                stream,
+                [
+                    FilterStage(include={"GLL", "GPGSV", "PUBX03"}, forward={"GSV"}),
+                    ParseStage(compact=True),
+                ],
+            )
+        )
+        self.assertEqual(
+            [item.identity for item in items], ["GNGLL", "GPGSV", "PUBX03"]
+        )
+        self.assertIsInstance(items[0].parsed, CompactNMEAMessage)
+        self.assertTrue(items[1].forward)
+        self.assertIsNone(items[1].parsed)
+        self.assertEqual(items[2].parsed.identity, "PUBX03")
+        stream.seek(0)
+        items = list(Pipeline(stream, [FilterStage(exclude={"GNGLL", "PUBX00"})]))
+        self.assertEqual([item.identity for item in items], ["GPGSV", "PUBX03"])
+
+    def testMapAndSink(self):  # function stages and raw writer
+        out = BytesIO()
+
+        def gll_only(item: PipelineItem) -> PipelineItem:
+            keep = item.error is not None or item.parsed.msgID == "GLL"
+            return item if keep else None
+
+        pipe = Pipeline(
+            BytesIO(GLL + GSV + GLLBAD + GLL),
+            [ParseStage(), gll_only, RawWriter(out)],
+        )
+        self.assertEqual(pipe.run(), 3)
+        self.assertEqual(out.getvalue(), GLL + GLL)
+        self.assertEqual(MapStage(gll_only).name, "gll_only")
+
+    def testBatches(self):  # batch size and per-stage statistics
+        pipe = Pipeline(
+            self.streamNMEA4,
+            [ChecksumStage(), DropStage(), ChecksumStage()],
+            batchsize=2,
+            timing=True,
+        )
+        batches = list(pipe.batches())
+        self.assertEqual(len(batches), 24)
+        self.assertTrue(all(len(batch) == 2 for batch in batches))
+        stats = pipe.stats
+        self.assertEqual(
+            list(stats), ["framing", "ChecksumStage", "DropStage", "ChecksumStage_2"]
+        )
+        self.assertEqual(stats["framing"]["items"], 48)
+        self.assertEqual(stats["ChecksumStage_2"]["batches"], 24)
+        self.assertTrue(all(stat["ns"] > 0 for stat in stats.values()))
+        with self.assertRaises(NMEAParseError):
+            Pipeline(self.streamNMEA4, batchsize=0)
+
+    def testBatchesNoTiming(self):  # no statistics recorded
+        pipe = Pipeline(self.streamNMEA4, [ParseStage()], batchsize=1000)
+        self.assertEqual(pipe.run(), 48)
+        self.assertEqual(pipe.stats["ParseStage"]["ns"], 0)
+
+    def testReader(self):  # reader supplied for framing
+        items = list(
+            Pipeline(NMEAReader(BytesIO(GLL + GSV), bufsize=16), [ParseStage()])
+        )
+        self.assertIsInstance(items[1].parsed, NMEAMessage)
+        self.assertEqual(items[1].parsed.svid_04, 15)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,159 @@
+"""
+Replay engine tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import datetime
+import os
+import socket
+import threading
+import unittest
+from io import BytesIO
+
+from pynmeagps import (
+    MMapNMEAReader,
+    NMEAParseError,
+    NMEAReader,
+    NMEAReplay,
+    synthesize,
+)
+
+START = datetime.datetime(2021, 3, 6, 23, 59, 58, tzinfo=datetime.timezone.utc)
+
+
+class ReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            self.dataNMEA4 = stream.read()
+        # 5 epochs of 2 sentences at 1 second intervals, across midnight
+        self.log = b"".join(
+            gga.serialize() + rmc.serialize()
+            for gga, rmc in zip(
+                synthesize("GN", "GGA", count=5, start=START, lat=53.1, lon=-2.1),
+                synthesize("GN", "RMC", count=5, start=START, lat=53.1, lon=-2.1),
+            )
+        )
+
+    def tearDown(self):
+        pass
+
+    def testSynthesize(self):  # messages constructed from kwargs
+        msgs = list(synthesize("GN", "RMC", count=3, start=START, interval=0.5, lat=1))
+        self.assertEqual(len(msgs), 3)
+        self.assertEqual(msgs[0].time, datetime.time(23, 59, 58))
+        self.assertEqual(msgs[2].time, datetime.time(23, 59, 59))
+        self.assertEqual(msgs[2].lat, 1)
+        msgs = list(synthesize("GN", "RMC", count=5, start=START, date=""))
+        self.assertEqual(msgs[4].time, datetime.time(0, 0, 2))
+        self.assertEqual(msgs[4].date, "")
+
+    def testReplayTime(self):  # paced by embedded time, one write per epoch
+        out = BytesIO()
+        stats = NMEAReplay(BytesIO(self.log), out, speed=100).run()
+        self.assertEqual(out.getvalue(), self.log)
+        self.assertEqual(stats["messages"], 10)
+        self.assertEqual(stats["batches"], 5)
+        self.assertEqual(stats["bytes"], len(self.log))
+        self.assertAlmostEqual(stats["target"], 0.04)
+        self.assertGreaterEqual(stats["elapsed"], stats["target"])
+        self.assertAlmostEqual(stats["target_rate"], 250)
+        self.assertLessEqual(stats["rate"], 250)
+        out = BytesIO()
+        stats = NMEAReplay(BytesIO(self.dataNMEA4), out, speed=100).run()
+        self.assertEqual(out.getvalue(), self.dataNMEA4)
+        self.assertEqual(stats["batches"], 1)
+
+    def testReplayRate(self):  # paced at fixed rate
+        out = BytesIO()
+        msgs = synthesize("GN", "GGA", count=20, start=START)
+        stats = NMEAReplay(msgs, out, rate=10, speed=10).run()
+        self.assertEqual(stats["messages"], 20)
+        self.assertEqual(stats["batches"], 20)
+        self.assertAlmostEqual(stats["target"], 0.19)
+        self.assertGreaterEqual(stats["elapsed"], stats["target"])
+        self.assertEqual(len(list(NMEAReader(BytesIO(out.getvalue())))), 20)
+
+    def testReplayUnpaced(self):  # as fast as possible in batches
+        out = BytesIO()
+        replay = NMEAReplay(BytesIO(self.dataNMEA4), out, speed=0, batchsize=10)
+        stats = replay.run()
+        self.assertEqual(out.getvalue(), self.dataNMEA4)
+        self.assertEqual((stats["messages"], stats["batches"]), (48, 5))
+        self.assertIsNone(stats["target_rate"])
+        self.assertEqual(replay.stats, stats)
+
+    def testReplayLimit(self):  # limited number of sentences
+        out = BytesIO()
+        stats = NMEAReplay(synthesize("GN", "GLL"), out, speed=0).run(limit=100)
+        self.assertEqual(stats["messages"], 100)
+
+    def testReplayMixed(self):  # raw, parsed and message sources
+        msgs = list(NMEAReader(BytesIO(self.log)))
+        source = [msgs[0], msgs[1][1], msgs[2]]
+        out = BytesIO()
+        stats = NMEAReplay(source, out, speed=100).run()
+        self.assertEqual(out.getvalue(), b"".join(raw for raw, _ in msgs[:3]))
+        self.assertEqual(stats["batches"], 2)
+        out = BytesIO()
+        NMEAReplay(NMEAReader(BytesIO(self.log)), out, rate=1000).run()
+        self.assertEqual(out.getvalue(), self.log)
+
+    def testReplayMMap(self):  # memoryview raw sentences from MMapNMEAReader
+        path = os.path.join(os.path.dirname(__file__), "pygpsdata-nmea4.log")
+        for kwargs in ({"speed": 0}, {"speed": 1000}, {"rate": 1000, "speed": 10}):
+            out = BytesIO()
+            with open(path, "rb") as stream:
+                with MMapNMEAReader(stream) as nmr:
+                    stats = NMEAReplay(nmr, out, **kwargs).run()
+            self.assertEqual(out.getvalue(), self.dataNMEA4)
+            self.assertEqual(stats["messages"], 48)
+        raw, parsed = NMEAReader(BytesIO(self.log)).read()
+        out = BytesIO()
+        with open(path, "rb") as stream:
+            with MMapNMEAReader(stream) as nmr:
+                source = [nmr.read()[0], parsed, nmr.read()[0]]
+                NMEAReplay(source, out, speed=0).run()  # mixed batch
+        dtm, rmc = self.dataNMEA4.split(b"\r\n")[:2]
+        self.assertEqual(out.getvalue(), dtm + b"\r\n" + raw + rmc + b"\r\n")
+
+    def testReplaySocket(self):  # socket output
+        sock1, sock2 = socket.socketpair()
+        with sock1, sock2:
+            NMEAReplay(BytesIO(self.dataNMEA4), sock1, speed=0).run()
+            sock1.shutdown(socket.SHUT_WR)
+            data = b""
+            while True:
+                chunk = sock2.recv(4096)
+                if not chunk:
+                    break
+                data += chunk
+        self.assertEqual(data, self.dataNMEA4)
+
+    def testReplayStop(self):  # stopped from another thread
+        out = BytesIO()
+        replay = NMEAReplay(BytesIO(self.log), out, speed=1)
+        timer = threading.Timer(0.05, replay.stop)
+        timer.start()
+        stats = replay.run()
+        timer.join()
+        self.assertEqual(stats["batches"], 1)
+        self.assertLess(stats["elapsed"], 0.5)
+
+    def testReplayInvalid(self):  # invalid parameters
+        for kwargs in ({"speed": -1}, {"rate": 0}, {"batchsize": 0}):
+            with self.assertRaises(NMEAParseError):
+                NMEAReplay(BytesIO(self.log), BytesIO(), **kwargs)
+        with self.assertRaises(TypeError):  # options are keyword-only
+            NMEAReplay(BytesIO(self.log), BytesIO(), 100)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -0,0 +1,75 @@
+"""
+Batch serializer tests for pynmeagps.
+
+Created on 18 Oct 2026
+
+*** NB: must be saved in UTF-8 format ***
+
+:author: semuadmin
+"""
+
+import os
+import unittest
+from io import BytesIO
+
+from pynmeagps import NMEAMessage, NMEAReader, NMEASerializer, ERR_IGNORE, GET, POLL
+
+
+class SerializerTest(unittest.TestCase):
+    def setUp(self):
+        self.maxDiff = None
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            self.msgs = [
+                parsed
+                for _, parsed in NMEAReader(stream, quitonerror=ERR_IGNORE)
+                if parsed is not None
+            ]
+
+    def tearDown(self):
+        pass
+
+    def testSerialize(self):  # batch output equivalent to serialize()
+        expected = b"".join(msg.serialize() for msg in self.msgs)
+        ser = NMEASerializer()
+        res = ser.serialize(self.msgs)
+        self.assertIsInstance(res, bytes)
+        self.assertEqual(res, expected)
+        self.assertEqual(ser.serialize([]), b"")
+
+    def testSerializeCompact(self):  # compact messages and mixed batches
+        msgs = [NMEAReader.parse(msg.serialize(), compact=True) for msg in self.msgs]
+        expected = b"".join(msg.serialize() for msg in self.msgs)
+        ser = NMEASerializer()
+        self.assertEqual(ser.serialize(msgs), expected)
+        mixed = [msgs[0], self.msgs[1], msgs[2]]
+        self.assertEqual(
+            ser.serialize(mixed), b"".join(msg.serialize() for msg in mixed)
+        )
+
+    def testConstructed(self):  # constructed messages with non-string payload
+        msg = NMEAMessage(
+            "GN", "GLL", GET, lat=-53.450719, lon=2.240233, time="22:32:32", status="A"
+        )
+        msg2 = NMEAMessage("EI", "GNQ", POLL, msgId="RMC")
+        msg3 = NMEAMessage("GN", "TXT", GET, payload=[1, 1, 1, "hello"])
+        self.assertEqual(msg2.serialize(), b"$EIGNQ,RMC*24\r\n")
+        self.assertEqual(msg3.serialize(), b"$GNTXT,1,1,1,hello*02\r\n")
+        ser = NMEASerializer()
+        self.assertEqual(
+            ser.serialize([msg, msg2, msg3]),
+            msg.serialize() + msg2.serialize() + msg3.serialize(),
+        )
+
+    def testWrite(self):  # single write per batch
+        out = BytesIO()
+        ser = NMEASerializer()
+        num = ser.write(out, self.msgs)
+        self.assertEqual(out.getvalue(), b"".join(msg.serialize() for msg in self.msgs))
+        self.assertEqual(num, len(out.getvalue()))
+        self.assertEqual(ser.write(out, []), 0)
+
+
+if __name__ == "__main__":
+    # import sys;sys.argv = ['', 'Test.testName']
+    unittest.main()
@@ -10,8 +10,8 @@ Created on 11 May 2022
 """
 
 import unittest
-from socket import socket
-from pynmeagps import NMEAReader
+from socket import socket, socketpair
+from pynmeagps import NMEAReader, SocketStream
 
 
 class DummySocket(socket):
@@ -51,6 +51,11 @@ class DummySocket(socket):
         self._buffer = self._buffer[num:]
         return buff
 
+    def recv_into(self, buffer, nbytes: int = 0) -> int:
+        data = self.recv(nbytes or len(buffer))
+        buffer[0 : len(data)] = data
+        return len(data)
+
 
 class SocketTest(unittest.TestCase):
     def setUp(self):
@@ -116,6 +121,55 @@ class SocketTest(unittest.TestCase):
                 break
         self.assertEqual(i, 0)
 
+    def testSocketStreamMethods(self):  # read, read1, readline over real socket pair
+        sock1, sock2 = socketpair()
+        try:
+            sock1.sendall(b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n$GNGLL,5327")
+            sock1.sendall(b".03942,N,00214.42462,W,103607.00,A,A*68\r\n\xb5\x62")
+            sock1.close()
+            ss = SocketStream(sock2, bufsize=16)
+            self.assertEqual(ss.read(3), b"$GN")
+            self.assertEqual(ss.read1(100), b"DTM,W84,,0.0,")
+            self.assertEqual(ss.readline(), b"N,0.0,E,0.0,W84*71\r\n")
+            self.assertEqual(
+                ss.readline(),
+                b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n",
+            )
+            self.assertEqual(ss.buffer, bytearray(b"\xb5\x62"))
+            self.assertEqual(ss.read(3), b"")  # connection closed
+            self.assertEqual(ss.readline(), b"\xb5\x62")  # partial line
+            self.assertEqual(ss.read1(1), b"")
+        finally:
+            sock2.close()
+
+    def testSocketStreamGrow(self):  # unconsumed data exceeds buffer capacity
+        sock1, sock2 = socketpair()
+        try:
+            line = b"$GPRTE,2,1,c,0,PBRCPK,PBRTO,PTELGR,PPLAND,PYAMBU*73\r\n"
+            sock1.sendall(line * 20)
+            sock1.close()
+            ss = SocketStream(sock2, bufsize=8)
+            self.assertEqual(ss.read(len(line) * 3), line * 3)
+            for _ in range(17):
+                self.assertEqual(ss.readline(), line)
+            self.assertEqual(ss.readline(), b"")
+        finally:
+            sock2.close()
+
+    def testSocketReader(self):  # NMEAReader over real socket pair
+        sock1, sock2 = socketpair()
+        try:
+            sock1.sendall(
+                b"\xb5\x62\x01\x07$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n"
+                + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+            )
+            sock1.close()
+            nmr = NMEAReader(sock2, bufsize=10)
+            res = [parsed.identity for _, parsed in nmr]
+            self.assertEqual(res, ["GNDTM", "GNGLL"])
+        finally:
+            sock2.close()
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']
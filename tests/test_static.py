@@ -20,7 +20,9 @@ from pynmeagps.nmeatypes_core import GET, POLL
 from pynmeagps.nmeahelpers import (
     int2hexstr,
     get_parts,
+    get_parts_cksum,
     get_content,
+    xor_checksum,
     calc_checksum,
     isvalid_cksum,
     deg2dmm,
@@ -87,6 +89,39 @@ class StaticTest(unittest.TestCase):
             get_parts(self.messageCRAP)
         self.assertTrue(EXPECTED_ERROR in str(context.exception))
 
+    def testGetPartsCksum(self):
+        res = get_parts_cksum(self.messageGLL)
+        self.assertEqual(res[0:4], get_parts(self.messageGLL))
+        self.assertEqual(res[4], "68")
+        res = get_parts_cksum(self.messageBADCK)
+        self.assertEqual(res[3:], ("22", "68"))
+        res = get_parts_cksum(memoryview(self.messageGLL.encode("utf-8")))
+        self.assertEqual(res[3:], ("68", "68"))
+        res = get_parts_cksum(self.messageGLL.encode("utf-8"))
+        self.assertEqual(res[3:], ("68", "68"))
+        msg = "$GNTXT,01,01,02,é*00\r\n".encode("utf-8")  # non-ASCII
+        res = get_parts_cksum(memoryview(msg))
+        self.assertEqual(res, get_parts_cksum(msg))
+
+    def testGetPartsCksumCRAP(self):  # test badly formed bytes-like message
+        EXPECTED_ERROR = "Badly formed message $GNRMC,,%$£"
+        with self.assertRaises(NMEAMessageError) as context:
+            get_parts_cksum(bytearray(self.messageCRAP.encode("utf-8")))
+        self.assertTrue(EXPECTED_ERROR in str(context.exception))
+
+    def testXORChecksum(self):
+        self.assertEqual(xor_checksum(b""), "00")
+        self.assertEqual(xor_checksum(b"A"), "41")
+        self.assertEqual(
+            xor_checksum(b"GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A"), "68"
+        )
+        for i in range(0, 300):  # check all fold lengths
+            data = bytes((j * 37 + i) & 0xFF for j in range(i))
+            cksum = 0
+            for byt in data:
+                cksum ^= byt
+            self.assertEqual(xor_checksum(data), int2hexstr(cksum))
+
     def testGetContent(self):
         res = get_content(self.messageGLL)
         self.assertEqual(res, "GNGLL,5327.04319,S,00214.41396,E,223232.00,A,A")
@@ -96,6 +131,8 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(res, "68")
         res = calc_checksum(self.messagePUBX)
         self.assertEqual(res, "69")
+        res = calc_checksum(memoryview(self.messagePUBX.encode("utf-8")))
+        self.assertEqual(res, "69")
 
     def testGoodChecksum(self):
         res = isvalid_cksum(self.messageGLL)
@@ -144,12 +181,44 @@ class StaticTest(unittest.TestCase):
         self.assertEqual(res, datetime.date(2020, 3, 12))
         res = date2utc("031220", "DM")
         self.assertEqual(res, datetime.date(2020, 3, 12))
+        res = date2utc("311269")
+        self.assertEqual(res, datetime.date(1969, 12, 31))
+        res = date2utc("010168")
+        self.assertEqual(res, datetime.date(2068, 1, 1))
+        res = date2utc("290223")  # invalid day
+        self.assertEqual(res, "")
+        res = date2utc("12320")  # fallback
+        self.assertEqual(res, datetime.date(2020, 3, 12))
+        res = date2utc("1203a0")
+        self.assertEqual(res, "")
+        res = date2utc(None)
+        self.assertEqual(res, "")
+        res = date2utc([1, 2])  # unhashable
+        self.assertEqual(res, "")
 
     def testTime2UTC(self):
         res = time2utc("")
         self.assertEqual(res, "")
         res = time2utc("081123.000")
         self.assertEqual(res, datetime.time(8, 11, 23))
+        res = time2utc("081123")
+        self.assertEqual(res, datetime.time(8, 11, 23))
+        res = time2utc("081123.5")
+        self.assertEqual(res, datetime.time(8, 11, 23, 500000))
+        res = time2utc("081123.123456")
+        self.assertEqual(res, datetime.time(8, 11, 23, 123456))
+        res = time2utc("081123.")
+        self.assertEqual(res, "")
+        res = time2utc("81123.00")  # fallback
+        self.assertEqual(res, datetime.time(8, 11, 23))
+        res = time2utc("246000.00")
+        self.assertEqual(res, "")
+        res = time2utc("+81123.00")
+        self.assertEqual(res, "")
+        res = time2utc(None)
+        self.assertEqual(res, "")
+        res = time2utc([1, 2])  # unhashable
+        self.assertEqual(res, "")
 
     def testTime2str(self):
         res = time2str(datetime.time(8, 11, 23))
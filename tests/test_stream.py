@@ -11,6 +11,7 @@ Created on 4 Mar 2021
 import os
 import sys
 import unittest
+from io import BytesIO
 
 from pynmeagps import (
     NMEAReader,
@@ -434,6 +435,178 @@ class StreamTest(unittest.TestCase):
                 i += 1
         self.assertEqual(i, 20)
 
+    def testNMEACHUNKSIZE(self):  # sentences spanning stream read chunk boundaries
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            EXPECTED_RESULTS = [str(parsed) for _, parsed in NMEAReader(stream)]
+        for bufsize in (1, 2, 7, 64, 65536):
+            with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+                nmr = NMEAReader(stream, bufsize=bufsize)
+                res = [str(parsed) for _, parsed in nmr]
+            self.assertEqual(res, EXPECTED_RESULTS)
+        self.assertEqual(len(EXPECTED_RESULTS), 48)
+
+    def testNMEARAWFILE(self):  # unbuffered stream without read1 method
+        dirname = os.path.dirname(__file__)
+        with open(
+            os.path.join(dirname, "pygpsdata-mixed.log"), "rb", buffering=0
+        ) as stream:
+            nmr = NMEAReader(stream, bufsize=64)
+            i = 0
+            for raw, parsed in nmr:
+                self.assertEqual(raw[0:1], b"$")
+                self.assertEqual(raw[-2:], b"\r\n")
+                i += 1
+        self.assertEqual(i, 15)
+
+    def testNMEAINWAITING(self):  # stream with in_waiting attribute e.g. Serial
+        class DummySerial(BytesIO):
+            @property
+            def in_waiting(self):
+                return len(self.getbuffer()) - self.tell()
+
+        stream = DummySerial(
+            b"\xb5\x62\x01\x07$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n"
+            + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+        )
+        nmr = NMEAReader(stream)
+        res = [parsed.identity for _, parsed in nmr]
+        self.assertEqual(res, ["GNDTM", "GNGLL"])
+
+    def testNMEALAZY(self):  # lazy attribute conversion
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            EXPECTED_RESULTS = [str(parsed) for _, parsed in NMEAReader(stream)]
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            res = [str(parsed) for _, parsed in NMEAReader(stream, lazy=True)]
+        self.assertEqual(res, EXPECTED_RESULTS)
+
+    def testNMEAGROUPS(self):  # repeating groups as named tuples
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            EXPECTED_RESULTS = [parsed for _, parsed in NMEAReader(stream)]
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            res = [parsed for _, parsed in NMEAReader(stream, groups=True)]
+        self.assertEqual(len(res), len(EXPECTED_RESULTS))
+        for parsed, expected in zip(res, EXPECTED_RESULTS):
+            self.assertEqual(parsed.serialize(), expected.serialize())
+            for att, val in expected.__dict__.items():
+                if att[0] != "_":  # legacy suffixed names still accessible
+                    self.assertEqual(getattr(parsed, att), val)
+        self.assertEqual(res[11].group_sv.svid, (1, 12, 14, 15))
+
+    def testNMEAFILTER(self):  # message identity filter, filtered messages skipped
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-nmea4.log"), "rb") as stream:
+            nmr = NMEAReader(stream, msgfilter={"GNGGA", "RMC", "PUBX00", "PGRMZ"})
+            res = [parsed.identity for _, parsed in nmr]
+            skipped = nmr.skipped
+        self.assertEqual(res, ["GNRMC", "GNGGA", "PUBX00", "PGRMZ"])
+        self.assertEqual(skipped["GNGSA"], 4)
+        self.assertEqual(skipped["GPGSV"], 3)
+        self.assertEqual(skipped["PUBX03"], 1)
+        self.assertEqual(skipped["PGRME"], 1)
+        self.assertEqual(sum(skipped.values()), 44)
+
+    def testNMEAFILTERRAW(self):  # message identity filter, filtered messages raw only
+        dirname = os.path.dirname(__file__)
+        with open(os.path.join(dirname, "pygpsdata-mixed.log"), "rb") as stream:
+            nmr = NMEAReader(stream, msgfilter=["GGA"], filterraw=True)
+            res = [(raw[0:6], parsed) for raw, parsed in nmr]
+        self.assertEqual(len(res), 15)
+        for raw, parsed in res:
+            if raw == b"$GNGGA":
+                self.assertEqual(parsed.identity, "GNGGA")
+            else:
+                self.assertIsNone(parsed)
+        self.assertEqual(sum(nmr.skipped.values()), 13)
+
+    def testNMEALFONLY(self):  # LF rather than CRLF terminator treated as EOF
+        stream = BytesIO(
+            b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\n"
+            + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+        )
+        nmr = NMEAReader(stream)
+        self.assertEqual(nmr.read(), (None, None))
+
+    def testNMEAINSTRUMENT(self):  # instrumentation counters and timings
+        stream = BytesIO(
+            b"junk\x00"
+            + b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*72\r\n"
+            + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+            + b"\xb5\x62\x01\x02"
+            + b"$PUBX,03,5,23,-,014,06,08,000,12,U,207,43,28,009*59\r\n"
+            + b"$GPGSV,1,1,00,1*64\r\n"
+            + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+            + b"$GNGL"
+        )
+        nmr = NMEAReader(
+            stream,
+            quitonerror=ERR_IGNORE,
+            msgfilter={"GLL", "PUBX03", "GNDTM"},
+            instrument=True,
+            bufsize=32,
+        )
+        res = [parsed for _, parsed in nmr]
+        self.assertEqual(len(res), 4)
+        stats = nmr.stats
+        self.assertEqual(stats["messages"], {"GNDTM": 1, "GNGLL": 2, "PUBX03": 1})
+        self.assertEqual(stats["bytes"], len(stream.getvalue()))
+        self.assertEqual(stats["discarded"], 9)
+        self.assertEqual(stats["filtered"], 1)
+        self.assertEqual(stats["cksumerrors"], 1)
+        self.assertEqual(stats["errors"], 1)
+        self.assertEqual(
+            list(stats["ns"]), ["read", "frame", "filter", "split", "construct"]
+        )
+        self.assertTrue(all(nsec > 0 for nsec in stats["ns"].values()))
+        stats["messages"]["GNGLL"] = 0  # snapshot is a copy
+        self.assertEqual(nmr.stats["messages"]["GNGLL"], 2)
+        self.assertEqual(NMEAReader(self.streamNMEA4).stats, {})
+
+    def testNMEAINSTRUMENTEQUIV(self):  # instrumented output identical
+        expected = [(raw, str(parsed)) for raw, parsed in NMEAReader(self.streamMIXED)]
+        self.streamMIXED.seek(0)
+        nmr = NMEAReader(self.streamMIXED, instrument=True)
+        self.assertEqual([(raw, str(parsed)) for raw, parsed in nmr], expected)
+        self.assertEqual(sum(nmr.stats["messages"].values()), len(expected))
+
+    def testNMEAREADFRAMES(self):  # raw sentences read in batches
+        nmr = NMEAReader(self.streamNMEA4, bufsize=256)
+        frames = nmr.read_frames(100)
+        self.assertTrue(0 < len(frames) < 100)  # only those already buffered
+        self.assertEqual(frames[0], b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n")
+        while True:
+            batch = nmr.read_frames(100)
+            if not batch:
+                break
+            frames += batch
+        self.assertEqual(len(frames), 48)
+        stream = BytesIO(
+            b"$GNDTM,W84,,0.0,N,0.0,E,0.0,W84*71\r\n"
+            + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\n"
+            + b"$GNGLL,5327.03942,N,00214.42462,W,103607.00,A,A*68\r\n"
+        )
+        nmr = NMEAReader(stream)
+        self.assertEqual(len(nmr.read_frames(3)), 1)
+        self.assertEqual(nmr.read_frames(3), [])  # LF only treated as EOF
+
+    def testNMEAREADFRAMESINSTRUMENT(self):  # read_frames counted in stats
+        nmr = NMEAReader(self.streamMIXED, instrument=True, bufsize=64)
+        frames = []
+        batch = nmr.read_frames(5)
+        while batch:
+            frames += batch
+            batch = nmr.read_frames(5)
+        stats = nmr.stats
+        self.assertEqual(stats["bytes"], self.streamMIXED.tell())
+        self.assertEqual(
+            stats["discarded"], stats["bytes"] - sum(len(frame) for frame in frames)
+        )
+        self.assertGreater(stats["discarded"], 0)  # non-NMEA data
+        self.assertGreater(stats["ns"]["read"], 0)
+        self.assertGreater(stats["ns"]["frame"], 0)
+
 
 if __name__ == "__main__":
     # import sys;sys.argv = ['', 'Test.testName']